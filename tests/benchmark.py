@@ -0,0 +1,59 @@
+"""
+Helpers for the benchmark test cases.
+
+Benchmarks are regular test cases tagged with ``benchmark``. By default they
+run with small sizes as a part of the test suite and check query counts only.
+Set ``VIEWFLOW_BENCHMARK=1`` to run full-size measurements and print timings::
+
+    VIEWFLOW_BENCHMARK=1 ./manage.py test --tag=benchmark
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+
+ENABLED = bool(os.environ.get("VIEWFLOW_BENCHMARK"))
+
+
+def sizes(small, full):
+    """Return benchmark sizes depending on the benchmark mode."""
+    return full if ENABLED else small
+
+
+class Measurement:
+    queries = 0
+    seconds = 0.0
+
+
+@contextmanager
+def measure():
+    """Count executed queries and wall time of the block."""
+    result = Measurement()
+
+    # counted with a wrapper, the debug query log is capped
+    def count_query(execute, sql, params, many, context):
+        result.queries += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        start = time.perf_counter()
+        yield result
+        result.seconds = time.perf_counter() - start
+
+
+def report(title, header, rows):
+    """Print a benchmark results table, if benchmarks are enabled."""
+    if not ENABLED:
+        return
+    lines = ["", title, " | ".join(header)]
+    for row in rows:
+        lines.append(
+            " | ".join(
+                f"{value:.4f}" if isinstance(value, float) else str(value)
+                for value in row
+            )
+        )
+    sys.stderr.write("\n".join(lines) + "\n")
@@ -0,0 +1,89 @@
+import time
+
+from django.test import SimpleTestCase, tag
+
+from viewflow import fsm, this
+
+from ..benchmark import report, sizes
+from .test_fsm__basics import ReviewState
+
+ITERATIONS = sizes(1000, 100000)
+
+
+class Review(object):  # noqa: D101
+    state = fsm.State(ReviewState, default=ReviewState.NEW)
+
+    def __init__(self, text):
+        self.text = text
+
+    def is_long(self):
+        return len(self.text) > 10
+
+    def can_approve(self, user):
+        return user == "approver"
+
+    @state.transition(
+        source=ReviewState.NEW,
+        target=ReviewState.PUBLISHED,
+        conditions=[this.is_long],
+        permission=this.can_approve,
+    )
+    def publish(self):
+        pass
+
+    @state.transition(
+        source=[ReviewState.PUBLISHED, ReviewState.HIDDEN], target=ReviewState.NEW
+    )
+    def revert(self):
+        pass
+
+    @state.transition(source=fsm.State.ANY, target=ReviewState.REMOVED)
+    def remove(self):
+        pass
+
+
+class GuestReview(Review):  # noqa: D101
+    @Review.state.super()
+    def remove(self):
+        super().remove.original()
+
+
+@tag("benchmark")
+class Test(SimpleTestCase):  # noqa: D101
+    def measure(self, func):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            func()
+        return ITERATIONS / (time.perf_counter() - start)
+
+    def test_transitions_per_second(self):
+        review = GuestReview("long enough review")
+
+        def transition():
+            review.publish()
+            review.revert()
+
+        results = [
+            ("can_proceed", self.measure(review.publish.can_proceed)),
+            ("has_perm", self.measure(lambda: review.publish.has_perm("approver"))),
+            ("call", self.measure(transition) * 2),
+            ("super can_proceed", self.measure(lambda: review.remove.can_proceed())),
+            (
+                "outgoing transitions",
+                self.measure(
+                    lambda: GuestReview.state.get_outgoing_transitions(review.state)
+                ),
+            ),
+        ]
+        self.assertEqual(review.state, ReviewState.NEW)
+        self.assertEqual(
+            {
+                transition.slug
+                for transition in GuestReview.state.get_outgoing_transitions(
+                    ReviewState.NEW
+                )
+            },
+            {"publish", "remove"},
+        )
+
+        report("FSM transitions", ("operation", "per second"), results)
@@ -1,5 +1,5 @@
 from django.utils.translation import gettext_lazy as _
-from unittest import TestCase
+from unittest import TestCase, mock
 from viewflow import fsm, this
 from .test_fsm__basics import Publication, ReviewState
 
@@ -54,6 +54,14 @@ class GuestPublication(Publication):
         )
 
 
+class ModeratedPublication(GuestPublication):
+    def is_approver(self, user):
+        return user.is_superuser
+
+    def is_short(self):
+        return False
+
+
 class Test(TestCase):
     def setUp(self):
         self.publication = GuestPublication(text="test publication")
@@ -114,3 +122,12 @@ class Test(TestCase):
 
     def test_transition_condition(self):
         pass
+
+    def test_overridden_condition_and_permission(self):
+        staff = mock.Mock(is_staff=True, is_superuser=False)
+        self.assertTrue(self.publication.approve.has_perm(staff))
+
+        moderated = ModeratedPublication(text="test publication")
+        self.assertFalse(moderated.approve.has_perm(staff))
+        self.assertFalse(moderated.hide.can_proceed())
+        self.assertTrue(self.publication.approve.has_perm(staff))
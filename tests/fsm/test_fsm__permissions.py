@@ -22,6 +22,37 @@ class _Publication(object):
         return State.CONDITION(user.is_staff, unmet="Only staff users can delete reviews")
 
 
+class _StaticPublication(object):
+    stage = State(ReviewState, default=ReviewState.NEW)
+
+    @stage.transition(
+        source=ReviewState.NEW,
+        target=ReviewState.REMOVED,
+        permission=this.can_remove_review
+    )
+    def remove(self):
+        pass
+
+    @staticmethod
+    def can_remove_review(user):
+        return user.is_staff
+
+
+class _InstancePublication(object):
+    stage = State(ReviewState, default=ReviewState.NEW)
+
+    def __init__(self):
+        self.can_remove_review = lambda user: user.is_staff
+
+    @stage.transition(
+        source=ReviewState.NEW,
+        target=ReviewState.REMOVED,
+        permission=this.can_remove_review
+    )
+    def remove(self):
+        pass
+
+
 class _Test(TestCase):
     def setUp(self):
         self.privileged_user = User.objects.create(
@@ -44,3 +75,25 @@ class _Test(TestCase):
         self.assertFalse(
             publication.remove.has_perm(self.unprivileged_user)
         )
+
+    def test_staticmethod_permission(self):
+        publication = _StaticPublication()
+
+        self.assertTrue(
+            publication.remove.has_perm(self.privileged_user)
+        )
+
+        self.assertFalse(
+            publication.remove.has_perm(self.unprivileged_user)
+        )
+
+    def test_instance_attribute_permission(self):
+        publication = _InstancePublication()
+
+        self.assertTrue(
+            publication.remove.has_perm(self.privileged_user)
+        )
+
+        self.assertFalse(
+            publication.remove.has_perm(self.unprivileged_user)
+        )
@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase, override_settings
 from django.urls import path
 from viewflow.views import ListModelView
@@ -29,6 +30,13 @@ class Test(TestCase):  # noqa: D101
         response = self.client.get("/advanced_user/?_orderby=first_name")
         self.assertIn('data-list-sort-column="last_name"', str(response.content))
 
+    def test_missing_queryset(self):
+        view = ListModelView()
+        with self.assertRaisesMessage(
+            ImproperlyConfigured, "ListModelView is missing a QuerySet"
+        ):
+            view.get_queryset()
+
 
 class UserListView(ListModelView):
     model = User
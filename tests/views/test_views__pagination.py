@@ -0,0 +1,139 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+from django.utils import timezone
+from viewflow.views import ListModelView
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin", "admin@admin.com", "admin")
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+        joined = timezone.now()
+        for n in range(11):
+            User.objects.create_user(
+                "user{:02}".format(n),
+                date_joined=joined - datetime.timedelta(days=n // 2),
+            )
+
+    def get_pages(self, url, **params):
+        pages, cursor = [], None
+        while True:
+            response = self.client.get(
+                url, dict(params, cursor=cursor) if cursor else params
+            )
+            self.assertEqual(response.status_code, 200)
+            page = response.context["page_obj"]
+            pages.append([user.pk for user in page])
+            if not page.has_next():
+                return pages, page
+            cursor = page.next_cursor
+
+    def test_keyset_pages(self):
+        pages, last_page = self.get_pages("/user/")
+
+        self.assertEqual(
+            pages,
+            [
+                [user.pk for user in User.objects.order_by("pk")][n : n + 5]
+                for n in range(0, User.objects.count(), 5)
+            ],
+        )
+
+        response = self.client.get("/user/", {"cursor": last_page.previous_cursor})
+        self.assertEqual([user.pk for user in response.context["page_obj"]], pages[1])
+        self.assertIn(
+            'data-page="{}"'.format(response.context["page_obj"].next_cursor),
+            response.content.decode(),
+        )
+
+    def test_keyset_pages_descending(self):
+        pages, _ = self.get_pages("/user/", _orderby="-date_joined")
+
+        self.assertEqual(
+            sum(pages, []),
+            [user.pk for user in User.objects.order_by("-date_joined", "-pk")],
+        )
+
+    def test_previous_page_reaches_first_page(self):
+        response = self.client.get("/user/")
+        first_page = response.context["page_obj"]
+        first_page.object_list = first_page.object_list[2:]
+        first_page._has_previous = True
+
+        response = self.client.get("/user/", {"cursor": first_page.previous_cursor})
+
+        page = response.context["page_obj"]
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_previous())
+
+    def test_nullable_ordering_fallback(self):
+        response = self.client.get("/user/?_orderby=last_login")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context["view"].keyset_paginated)
+        self.assertEqual(response.context["page_obj"].number, 1)
+
+    def test_invalid_cursor(self):
+        for cursor in ["invalid", "WyJuIiwgWzEsIDJdXQ", "WyJuIiwgWyJ4Il1d"]:
+            with self.subTest(cursor=cursor):
+                response = self.client.get("/user/", {"cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_keyset_queries(self):
+        url = "/user/"
+        counts, cursor = [], None
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"cursor": cursor} if cursor else {})
+            counts.append(len(queries))
+            page = response.context["page_obj"]
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+        self.assertEqual(len(set(counts)), 1)
+
+    def test_estimated_count(self):
+        response = self.client.get("/estimated/")
+        self.assertIn("1-5 of 10+", response.content.decode())
+
+        response = self.client.get("/estimated/", {"page": 3})
+        page = response.context["page_obj"]
+        self.assertFalse(page.has_next())
+        self.assertEqual(
+            [user.pk for user in page],
+            [user.pk for user in User.objects.order_by("pk")][10:],
+        )
+        self.assertIn(
+            "11-{} of 10+".format(User.objects.count()), response.content.decode()
+        )
+
+
+urlpatterns = [
+    path(
+        "user/",
+        ListModelView.as_view(
+            model=User,
+            columns=("username", "date_joined", "last_login"),
+            ordering="pk",
+            paginate_by=5,
+            keyset_pagination=True,
+        ),
+    ),
+    path(
+        "estimated/",
+        ListModelView.as_view(
+            model=User,
+            columns=("username",),
+            ordering="pk",
+            paginate_by=5,
+            estimated_count=True,
+            count_cap=10,
+        ),
+    ),
+]
@@ -0,0 +1,102 @@
+import asyncio
+from unittest import skipIf
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.status import STATUS
+
+
+class Test(TestCase):  # noqa: D101
+    def test_async_callbacks_sync_run(self):
+        process = AsyncWorkflow.start.run(value=1)
+        self.assertEqual(process.data, {"value": 1, "function": 2})
+
+        task = process.task_set.get(flow_task=AsyncWorkflow.handle)
+        self.assertEqual(AsyncWorkflow.handle.run(task, value=2), 2)
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, STATUS.DONE)
+        self.assertEqual(process.data["handle"], 2)
+
+
+class TestAsync(TransactionTestCase):  # noqa: D101
+    async def test_arun(self):
+        process = await AsyncWorkflow.start.arun(value=1)
+        self.assertEqual(process.data, {"value": 1, "function": 2})
+
+        task = await process.task_set.aget(flow_task=AsyncWorkflow.handle)
+        self.assertEqual(await AsyncWorkflow.handle.arun(task, value=2), 2)
+
+        await process.arefresh_from_db()
+        self.assertEqual(process.status, STATUS.DONE)
+        self.assertEqual(process.data["handle"], 2)
+
+    async def test_arun_locked(self):
+        process = await AsyncWorkflow.start.arun(value=1)
+
+        def get_status(process_pk):
+            return AsyncWorkflow.process_class.objects.get(pk=process_pk).status
+
+        self.assertEqual(
+            await AsyncWorkflow.arun_locked(process.pk, get_status, process.pk),
+            STATUS.NEW,
+        )
+
+    @skipIf(connection.vendor == "sqlite", "Concurrent transactions")
+    async def test_concurrent_processes(self):
+        processes = [await AsyncWorkflow.start.arun(value=n) for n in range(4)]
+        tasks = [
+            await process.task_set.aget(flow_task=AsyncWorkflow.handle)
+            for process in processes
+        ]
+
+        AsyncWorkflow.waiting = 0
+        AsyncWorkflow.all_waiting = asyncio.Event()
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *[
+                        AsyncWorkflow.handle.arun(task, value=n, wait=len(tasks))
+                        for n, task in enumerate(tasks)
+                    ]
+                ),
+                timeout=10,
+            )
+        finally:
+            AsyncWorkflow.all_waiting = None
+        self.assertEqual(results, [0, 1, 2, 3])
+
+
+class AsyncWorkflow(flow.Flow):  # noqa: D101
+    waiting = 0
+    all_waiting = None
+
+    start = flow.StartHandle(this.start_process).Next(this.function)
+    function = flow.Function(this.set_function).Next(this.handle)
+    handle = flow.Handle(this.set_handle).Next(this.end)
+    end = flow.End()
+
+    async def start_process(self, activation, value):
+        await asyncio.sleep(0)
+        activation.process.data = {"value": value}
+        return activation.process
+
+    async def set_function(self, activation):
+        await asyncio.sleep(0)
+        activation.process.data["function"] = await activation.process.task_set.acount()
+        await activation.process.asave()
+
+    async def set_handle(self, activation, value, wait=None):
+        if wait is not None:
+            # every handle of the batch is in-flight at once
+            AsyncWorkflow.waiting += 1
+            if AsyncWorkflow.waiting == wait:
+                AsyncWorkflow.all_waiting.set()
+            await AsyncWorkflow.all_waiting.wait()
+
+        activation.process.data["handle"] = value
+        await activation.process.asave()
+        return value
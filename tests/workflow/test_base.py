@@ -47,6 +47,25 @@ class Test(TestCase):  # noqa: D101
         self.assertEqual(TestFlow.instance.node('start'), TestFlow.start)
         self.assertEqual(TestFlow.instance.node('end'), TestFlow.end)
 
+    def test_brief_templates_cached(self):
+        template = TestFlow.get_brief_template()
+        self.assertIs(TestFlow.get_brief_template(), template)
+        self.assertIs(
+            TestFlow.start.get_brief_template(), TestFlow.start.get_brief_template()
+        )
+
+    def test_brief_templates_of_redefined_flow(self):
+        flow_class = brief_flow("Process #{{ process.pk }}")
+        template = flow_class.get_brief_template()
+        task_template = flow_class.start.get_brief_template()
+        self.assertEqual(template.source, "Process #{{ process.pk }}")
+
+        flow_class = brief_flow("Process {{ process.pk }}")
+        self.assertEqual(
+            flow_class.get_brief_template().source, "Process {{ process.pk }}"
+        )
+        self.assertIsNot(flow_class.start.get_brief_template(), task_template)
+
     def _test_obsolete_missing_node(self):
         """TODO: test_obsolete_missing_node """
 
@@ -56,6 +75,19 @@ class TestFlow(flow.Flow):  # noqa: D101
     end = flow.End()
 
 
+def brief_flow(summary_template):
+    return type(
+        "BriefFlow",
+        (flow.Flow,),
+        {
+            "__module__": __name__,
+            "process_summary_template": summary_template,
+            "start": flow.StartHandle().Next(this.end),
+            "end": flow.End(),
+        },
+    )
+
+
 urlpatterns = [
     path('', TestFlow.instance.urls),
 ]
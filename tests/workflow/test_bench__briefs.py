@@ -0,0 +1,97 @@
+from django.contrib.auth.models import User
+from django.db import models
+from django.test import TestCase, override_settings, tag
+from django.urls import path
+from django.utils.timezone import now
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.flow import FlowAppViewset
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.status import PROCESS, STATUS
+
+from ..benchmark import measure, report, sizes
+
+ROWS = sizes([5, 25], [5, 25, 100, 250])
+
+
+class BriefsProcess(Process):
+    comment = models.CharField(max_length=50, blank=True)
+
+
+class BriefsFlow(flow.Flow):  # noqa: D101
+    process_class = BriefsProcess
+    process_summary_template = "{{ process.comment }} #{{ process.pk }}"
+
+    start = flow.StartHandle().Next(this.approve)
+    approve = (
+        flow.View(lambda request, **kwargs: None)
+        .Annotation(result_template="{{ process.comment }} approved")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class BriefsViewset(FlowAppViewset):
+    def get_archive_view_kwargs(self, **kwargs):
+        return super().get_archive_view_kwargs(paginate_by=ROWS[-1], **kwargs)
+
+
+@tag("benchmark")
+@override_settings(ROOT_URLCONF=__name__)
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin", "admin@admin.com", "admin")
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+
+    def create_archive(self, rows):
+        for n in range(rows):
+            process = BriefsProcess.objects.create(
+                flow_class=BriefsFlow, comment=f"Order {n}", status=PROCESS.NEW
+            )
+            Task.objects.create(
+                process=process,
+                flow_task=BriefsFlow.approve,
+                flow_task_type="HUMAN",
+                status=STATUS.DONE,
+                owner=self.admin,
+                finished=now(),
+            )
+
+    def test_render_briefs_queries(self):
+        self.create_archive(3)
+        tasks = list(Task.objects.order_by("pk"))
+
+        with self.assertNumQueries(2):
+            briefs = Task.render_briefs(tasks, processes=True)
+
+        self.assertEqual(
+            briefs, ["Order 0 approved", "Order 1 approved", "Order 2 approved"]
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(tasks[0].brief, "Order 0 approved")
+            self.assertEqual(tasks[0].process.brief, f"Order 0 #{tasks[0].process_id}")
+
+    def test_archive_page_queries(self):
+        results, created = [], 0
+        for rows in ROWS:
+            self.create_archive(rows - created)
+            created = rows
+
+            with measure() as result:
+                response = self.client.get("/archive/")
+            results.append((rows, result.queries, result.seconds))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertContains(response, "Order 0 approved")
+            self.assertContains(response, "Order 0 #")
+
+        report("Archive page render", ("rows", "queries", "seconds"), results)
+
+        # briefs are rendered with a constant number of queries
+        self.assertEqual(results[0][1], results[-1][1])
+
+
+urlpatterns = [
+    path("", BriefsViewset(BriefsFlow).urls),
+]
@@ -0,0 +1,74 @@
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase, tag
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.models import Task
+from viewflow.workflow.status import STATUS
+
+from ..benchmark import measure, report, sizes
+
+
+class BulkAssignFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.user = User.objects.create(username="user")
+        self.user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="viewflow", codename="change_process"
+            )
+        )
+
+    def assign_per_task(self, tasks):
+        for task in tasks:
+            with task.activation() as activation:
+                activation.assign(self.user)
+
+    def test_bulk_assign(self):
+        results = []
+        for count in sizes([10, 50], [500, 5000]):
+            Task.objects.all().delete()
+            BulkAssignFlow.start.run_many({} for _ in range(count))
+            queue = Task.objects.filter(flow_task=BulkAssignFlow.task)
+
+            with measure() as per_task:
+                self.assign_per_task(queue)
+            queue.update(status=STATUS.NEW, owner=None)
+
+            with measure() as bulk:
+                result = queue.bulk_assign(self.user)
+            self.assertEqual(len(result.succeeded), count)
+            # a chunk of 500 tasks costs a constant number of queries
+            self.assertLessEqual(bulk.queries, 10 * (count // 500 + 1))
+
+            results.append(
+                (
+                    count,
+                    per_task.queries,
+                    per_task.seconds,
+                    bulk.queries,
+                    bulk.seconds,
+                )
+            )
+
+        report(
+            "Bulk assign",
+            (
+                "tasks",
+                "per task queries",
+                "per task seconds",
+                "bulk queries",
+                "bulk seconds",
+            ),
+            results,
+        )
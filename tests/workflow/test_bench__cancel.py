@@ -0,0 +1,134 @@
+from django.db import models
+from django.test import TestCase, tag
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.status import PROCESS, STATUS
+
+from ..benchmark import measure, report, sizes
+
+
+class CancelProcess(Process):
+    comment = models.CharField(max_length=50, blank=True)
+
+
+def split_flow(width):
+    """Create a flow with a split of `width` parallel branches."""
+    split = flow.Split()
+    attrs = {
+        "__module__": __name__,
+        "process_class": CancelProcess,
+        "start": flow.StartHandle().Next(this.split),
+        "split": split,
+    }
+    for n in range(width):
+        attrs[f"branch_{n}"] = flow.Handle()
+        split.Next(getattr(this, f"branch_{n}"))
+
+    flow_class = type(f"CancelSplit{width}Flow", (flow.Flow,), attrs)
+    globals()[flow_class.__name__] = flow_class
+    return flow_class
+
+
+WIDTHS = sizes([2, 10, 40], [10, 50, 200, 1000])
+FLOWS = {width: split_flow(width) for width in WIDTHS}
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def test_cancel_queries(self):
+        results = []
+        for width, flow_class in FLOWS.items():
+            process = flow_class.start.run()
+            process = Process.objects.get(pk=process.pk)
+
+            with measure() as result:
+                flow_class.instance.cancel(process)
+            results.append((width, result.queries, result.seconds))
+
+            process.refresh_from_db()
+            self.assertEqual(process.status, PROCESS.CANCELED)
+            self.assertEqual(
+                process.task_set.filter(status=STATUS.CANCELED).count(), width
+            )
+
+        report("Cancel active tasks", ("tasks", "queries", "seconds"), results)
+
+        # the process is coerced once, a task costs the single update
+        min_width, min_queries, _ = results[0]
+        max_width, max_queries, _ = results[-1]
+        self.assertEqual(max_queries - min_queries, max_width - min_width)
+
+    def test_prefetch_coerced_processes_queries(self):
+        flow_class = FLOWS[WIDTHS[0]]
+        processes = [flow_class.start.run() for _ in range(WIDTHS[-1])]
+        tasks = Task.objects.filter(
+            flow_task=flow_class.branch_0, process__in=processes
+        )
+
+        results = []
+        for title, queryset in [
+            ("lazy", tasks.all()),
+            ("prefetched", tasks.prefetch_coerced_processes()),
+        ]:
+            with measure() as result:
+                activations = [
+                    task.flow_task.activation_class(task) for task in queryset
+                ]
+                coerced = [activation.process for activation in activations]
+            results.append((title, result.queries, result.seconds))
+
+            self.assertEqual(len(coerced), len(processes))
+            self.assertTrue(
+                all(isinstance(process, CancelProcess) for process in coerced)
+            )
+
+        report("Coerce task processes", ("mode", "queries", "seconds"), results)
+
+        self.assertEqual(results[0][1], 1 + 2 * len(processes))
+        self.assertEqual(results[1][1], 2)
+
+    def test_cancel_many(self):
+        flow_class = FLOWS[WIDTHS[0]]
+        results = []
+        for count in sizes([10, 50], [500, 5000]):
+            Process.objects.all().delete()
+            flow_class.start.run_many({} for _ in range(count))
+            queryset = Process.objects.filter(flow_class=flow_class)
+
+            with measure() as per_process:
+                for process in queryset:
+                    flow_class.instance.cancel(process)
+            queryset.update(status=PROCESS.NEW, finished=None)
+            Task.objects.filter(status=STATUS.CANCELED).update(
+                status=STATUS.NEW, finished=None
+            )
+
+            with measure() as bulk:
+                result = flow_class.instance.cancel_many(queryset)
+            self.assertEqual(len(result.succeeded), count)
+            # a chunk of 500 processes costs a constant number of queries
+            self.assertLessEqual(bulk.queries, 10 * (count // 500 + 1))
+
+            results.append(
+                (
+                    count,
+                    per_process.queries,
+                    per_process.seconds,
+                    bulk.queries,
+                    bulk.seconds,
+                )
+            )
+
+        report(
+            "Cancel processes",
+            (
+                "processes",
+                "per process queries",
+                "per process seconds",
+                "bulk queries",
+                "bulk seconds",
+            ),
+            results,
+        )
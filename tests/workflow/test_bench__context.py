@@ -0,0 +1,59 @@
+import time
+
+from django.test import SimpleTestCase, tag
+
+from viewflow.workflow.context import Context, context
+
+from ..benchmark import report, sizes
+
+LOOKUPS = sizes(1000, 100000)
+
+
+@tag("benchmark")
+class Test(SimpleTestCase):  # noqa: D101
+    def test_context_lookup(self):
+        results = []
+        for depth in sizes([1, 10], [1, 10, 100]):
+            scopes = [Context(**{"scope_{}".format(n): n}) for n in range(depth)]
+            for scope in scopes:
+                scope.__enter__()
+            try:
+                start = time.perf_counter()
+                for _ in range(LOOKUPS):
+                    context.propagate_exception
+                default_lookup = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for _ in range(LOOKUPS):
+                    context.scope_0
+                scope_lookup = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for _ in range(LOOKUPS):
+                    with Context(propagate_exception=False):
+                        pass
+                enter_exit = time.perf_counter() - start
+            finally:
+                for scope in reversed(scopes):
+                    scope.__exit__(None, None, None)
+
+            results.append(
+                (
+                    depth,
+                    default_lookup / LOOKUPS * 10**9,
+                    scope_lookup / LOOKUPS * 10**9,
+                    enter_exit / LOOKUPS * 10**9,
+                )
+            )
+            self.assertTrue(context.propagate_exception)
+
+        report(
+            "Activation context",
+            (
+                "nested scopes",
+                "ns per default lookup",
+                "ns per scope lookup",
+                "ns per with",
+            ),
+            results,
+        )
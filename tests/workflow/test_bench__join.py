@@ -0,0 +1,78 @@
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.status import STATUS
+
+from ..benchmark import measure, report, sizes
+
+
+def join_flow(width):
+    """Create a flow with `width` parallel branches joined back."""
+    split = flow.Split()
+    attrs = {
+        "__module__": __name__,
+        "start": flow.StartHandle().Next(this.split),
+        "split": split,
+        "join": flow.Join().Next(this.end),
+        "end": flow.End(),
+    }
+    for n in range(width):
+        attrs[f"branch_{n}"] = flow.Handle().Next(this.join)
+        split.Next(getattr(this, f"branch_{n}"))
+
+    flow_class = type(f"Join{width}Flow", (flow.Flow,), attrs)
+    globals()[flow_class.__name__] = flow_class
+    return flow_class
+
+
+WIDTHS = sizes([10, 100], [10, 100, 1000])
+FLOWS = {width: join_flow(width) for width in WIDTHS}
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def test_join_arrivals(self):
+        results = []
+        for width, flow_class in FLOWS.items():
+            process = flow_class.start.run()
+            tasks = {
+                task.flow_task: task
+                for task in process.task_set.filter(flow_task_type="FUNCTION")
+            }
+
+            arrivals, seconds = [], 0.0
+            for n in range(width):
+                node = getattr(flow_class, f"branch_{n}")
+                with measure() as result:
+                    if n == width // 2:
+                        with CaptureQueriesContext(connection) as context:
+                            node.run(tasks[node])
+                    else:
+                        node.run(tasks[node])
+                arrivals.append(result.queries)
+                seconds += result.seconds
+
+            join_task = process.task_set.get(flow_task=flow_class.join)
+            self.assertEqual(join_task.status, STATUS.DONE)
+            process.refresh_from_db()
+            self.assertEqual(process.status, STATUS.DONE)
+
+            # arrivals after the first one don't scan incoming tasks
+            self.assertFalse(
+                any(
+                    'JOIN "viewflow_task_previous"' in query["sql"]
+                    for query in context.captured_queries
+                )
+            )
+            self.assertEqual(set(arrivals[1:-1]), {arrivals[1]})
+
+            results.append((width, sum(arrivals), seconds, arrivals[-2]))
+
+        report(
+            "Join arrivals",
+            ("width", "queries", "seconds", "queries per arrival"),
+            results,
+        )
@@ -0,0 +1,107 @@
+import os
+import threading
+import unittest
+
+from django.db import DatabaseError, connection
+from django.test import TransactionTestCase, skipUnlessDBFeature, tag
+
+from viewflow import this
+from viewflow.workflow import flow, lock
+from viewflow.workflow.exceptions import FlowLockFailed
+from viewflow.workflow.status import PROCESS
+
+from ..benchmark import measure, report, sizes
+
+
+def contention_flow(name, lock_impl, width):
+    """Create a flow with `width` parallel Handle tasks joined back."""
+    split = flow.Split()
+    attrs = {
+        "__module__": __name__,
+        "lock_impl": lock_impl,
+        "start": flow.StartHandle().Next(this.split),
+        "split": split,
+        "join": flow.Join().Next(this.end),
+        "end": flow.End(),
+    }
+    for n in range(width):
+        attrs[f"branch_{n}"] = flow.Handle().Next(this.join)
+        split.Next(getattr(this, f"branch_{n}"))
+
+    flow_class = type(name, (flow.Flow,), attrs)
+    globals()[name] = flow_class
+    return flow_class
+
+
+WIDTH = sizes(4, 32)
+FLOWS = [
+    contention_flow("SelectForUpdateFlow", lock.SelectForUpdateLock(), WIDTH),
+    contention_flow("CacheLockFlow", lock.CacheLock(), WIDTH),
+    contention_flow("AdvisoryLockFlow", lock.AdvisoryLock(timeout=60), WIDTH),
+    contention_flow("LocalLockFlow", lock.LocalLock(timeout=60), WIDTH),
+    contention_flow(
+        "OptimisticLockFlow",
+        lock.OptimisticLock(lock.RetryPolicy(attempts=WIDTH * 2)),
+        WIDTH,
+    ),
+]
+
+
+@tag("benchmark")
+@unittest.skipUnless(
+    "DATABASE_URL" in os.environ,
+    "Lock tests requires external db connection specified at DATABASE_URL env variable",
+)
+class Test(TransactionTestCase):  # noqa: D101
+    def run_contended(self, flow_class):
+        process = flow_class.start.run()
+        tasks = list(process.task_set.filter(flow_task_type="FUNCTION"))
+        failures = []
+        barrier = threading.Barrier(len(tasks))
+
+        def run_task(task):
+            try:
+                barrier.wait()
+                task.flow_task.run(task)
+            except (FlowLockFailed, DatabaseError) as exc:
+                failures.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run_task, args=[task]) for task in tasks]
+        with measure() as result:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        process.refresh_from_db()
+        return result, failures, process
+
+    @skipUnlessDBFeature("has_select_for_update")
+    def test_lock_contention(self):
+        results = []
+        for flow_class in FLOWS:
+            result, failures, process = self.run_contended(flow_class)
+            results.append(
+                (
+                    type(flow_class.lock_impl).__name__,
+                    WIDTH,
+                    len(failures),
+                    process.status,
+                    result.seconds,
+                )
+            )
+
+            if not failures:
+                self.assertEqual(process.status, PROCESS.DONE)
+
+        report(
+            "Lock contention",
+            ("lock", "tasks", "failed", "process", "seconds"),
+            results,
+        )
+
+        # optimistic lock retries all conflicts
+        self.assertEqual(results[-1][2], 0)
+        self.assertEqual(results[-1][3], PROCESS.DONE)
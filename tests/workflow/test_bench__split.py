@@ -0,0 +1,59 @@
+from django.test import TestCase, tag
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.status import STATUS
+
+from ..benchmark import measure, report, sizes
+
+
+def split_flow(width):
+    """Create a flow with a split of `width` parallel branches."""
+    split = flow.Split()
+    attrs = {
+        "__module__": __name__,
+        "start": flow.StartHandle().Next(this.split),
+        "split": split,
+    }
+    for n in range(width):
+        attrs[f"branch_{n}"] = flow.Handle()
+        split.Next(getattr(this, f"branch_{n}"))
+
+    flow_class = type(f"Split{width}Flow", (flow.Flow,), attrs)
+    globals()[flow_class.__name__] = flow_class
+    return flow_class
+
+
+WIDTHS = sizes([2, 10, 40], [10, 50, 200, 1000])
+FLOWS = {width: split_flow(width) for width in WIDTHS}
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def test_split_width_queries(self):
+        results = []
+        for width, flow_class in FLOWS.items():
+            with measure() as result:
+                process = flow_class.start.run()
+            results.append((width, result.queries, result.seconds))
+
+            self.assertEqual(
+                process.task_set.filter(
+                    flow_class=flow_class, flow_task_type="FUNCTION"
+                ).count(),
+                width,
+            )
+            self.assertEqual(process.task_set.filter(status=STATUS.NEW).count(), width)
+            branch_task = process.task_set.get(flow_task=flow_class.branch_0)
+            self.assertEqual(
+                [task.flow_task for task in branch_task.previous.all()],
+                [flow_class.split],
+            )
+
+        report("Split width", ("width", "queries", "seconds"), results)
+
+        # task rows and links are inserted in bulk, so an additional branch
+        # costs only a fraction of a query
+        min_width, min_queries, _ = results[0]
+        max_width, max_queries, _ = results[-1]
+        self.assertLess(max_queries - min_queries, (max_width - min_width) / 10)
@@ -0,0 +1,69 @@
+from django.test import TestCase, tag
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.status import STATUS
+
+from ..benchmark import measure, report, sizes
+
+COUNTS = sizes([10, 50], [100, 1000, 10000])
+
+
+class StartManyFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(this.start_process).Next(this.review)
+    review = flow.Handle().Next(this.end)
+    end = flow.End()
+
+    def start_process(self, activation, event=None):
+        activation.process.data = {"event": event}
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def test_run_many_throughput(self):
+        results = []
+        for count in COUNTS:
+            items = [{"event": n} for n in range(count)]
+
+            with measure() as single:
+                for kwargs in items:
+                    StartManyFlow.start.run(**kwargs)
+
+            with measure() as bulk:
+                processes = StartManyFlow.start.run_many(items, chunk_size=500)
+
+            results.append(
+                (
+                    count,
+                    single.queries,
+                    count / single.seconds,
+                    bulk.queries,
+                    count / bulk.seconds,
+                )
+            )
+
+            self.assertEqual(len(processes), count)
+            self.assertEqual(
+                StartManyFlow.task_class.objects.filter(
+                    process__in=processes,
+                    flow_task=StartManyFlow.review,
+                    status=STATUS.NEW,
+                ).count(),
+                count,
+            )
+
+        report(
+            "Start processes",
+            (
+                "count",
+                "run queries",
+                "run per second",
+                "run_many queries",
+                "run_many per second",
+            ),
+            results,
+        )
+
+        # processes, start tasks and the next tasks are inserted in bulk
+        for count, single_queries, _, bulk_queries, _ in results:
+            self.assertLess(bulk_queries, single_queries / 2)
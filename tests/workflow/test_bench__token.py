@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test import TestCase, tag
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.status import STATUS
+from viewflow.workflow.token import Token
+
+from ..benchmark import measure, report, sizes
+
+
+SPLITS = 10
+LOOKUPS = 100
+
+
+class TokenFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = flow.Handle().Next(this.end)
+    end = flow.End()
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def create_process(self, tasks_count):
+        """Create a process with tasks of SPLITS splits."""
+        process = Process.objects.create(flow_class=TokenFlow)
+        Task.objects.bulk_create(
+            Task(
+                process=process,
+                flow_task=TokenFlow.task,
+                flow_task_type="FUNCTION",
+                status=STATUS.DONE,
+                token=Token("start/{}_{}".format(n % SPLITS, n)),
+            )
+            for n in range(tasks_count)
+        )
+        return process
+
+    def get_active_tasks(self, process, split_pk):
+        join_prefix = Token("start/{}_1".format(split_pk)).get_common_split_prefix(
+            Token("start"), 0
+        )
+        return Task.objects.filter(process=process, token__prefix=join_prefix).exclude(
+            status__in=[STATUS.DONE, STATUS.CANCELED, STATUS.REVIVED]
+        )
+
+    def test_token_prefix_matches(self):
+        process = self.create_process(20)
+        Task.objects.create(
+            process=process,
+            flow_task=TokenFlow.task,
+            token=Token("start/11_1"),
+        )
+        self.assertEqual(
+            Task.objects.filter(process=process, token__prefix="start/1_").count(), 2
+        )
+        self.assertEqual(
+            Task.objects.filter(process=process, token__prefix="start/11_").count(), 1
+        )
+
+    def test_token_prefix_lookup_uses_index(self):
+        process = self.create_process(1000)
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("ANALYZE viewflow_task")
+            plan = self.get_active_tasks(process, 1).explain()
+        self.assertIn("viewflow_task_token_idx", plan)
+
+    def test_tokens_per_process(self):
+        results = []
+        for tasks_count in sizes([100, 1000], [1000, 10000, 100000]):
+            process = self.create_process(tasks_count)
+            with measure() as result:
+                for n in range(LOOKUPS):
+                    self.assertFalse(
+                        self.get_active_tasks(process, n % SPLITS).exists()
+                    )
+            results.append(
+                (tasks_count, result.queries, result.seconds / LOOKUPS * 1000)
+            )
+            self.assertEqual(result.queries, LOOKUPS)
+
+        report(
+            "Join lookup by token prefix",
+            ("tasks per process", "queries", "ms per lookup"),
+            results,
+        )
@@ -0,0 +1,97 @@
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature, tag
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.executors import DatabaseQueueExecutor
+from viewflow.workflow.status import STATUS
+from viewflow.workflow.worker import Worker
+
+from ..benchmark import measure, report, sizes
+
+COUNTS = sizes([20], [200, 1000])
+CONCURRENCY = sizes([2], [1, 2, 4, 8])
+
+
+class WorkerFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Executor(DatabaseQueueExecutor()).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        pass
+
+
+def schedule(count):
+    WorkerFlow.start.run_many([{}] * count)
+
+
+def scheduled_count():
+    return WorkerFlow.task_class.objects.filter(
+        flow_task=WorkerFlow.job, status=STATUS.SCHEDULED
+    ).count()
+
+
+@tag("benchmark")
+class Test(TestCase):  # noqa: D101
+    def test_worker_batch_throughput(self):
+        results = []
+        for count in COUNTS:
+            row = [count]
+            for batch_size in [1, 50]:
+                schedule(count)
+                worker = Worker(concurrency=0, batch_size=batch_size)
+                with measure() as result:
+                    self.assertEqual(worker.run(burst=True), count)
+                self.assertEqual(scheduled_count(), 0)
+                row.extend([result.queries / count, count / result.seconds])
+            results.append(row)
+
+        report(
+            "Database queue worker, single thread",
+            (
+                "jobs",
+                "batch 1 queries per job",
+                "batch 1 jobs per second",
+                "batch 50 queries per job",
+                "batch 50 jobs per second",
+            ),
+            results,
+        )
+
+        # claim queries are shared by the batch
+        for _, single_queries, _, batch_queries, _ in results:
+            self.assertLess(batch_queries, single_queries)
+
+
+@tag("benchmark")
+@skipUnlessDBFeature("has_select_for_update_skip_locked")
+class TestThreads(TransactionTestCase):  # noqa: D101
+    def setUp(self):
+        # persistent connections of the worker threads, as CONN_MAX_AGE=None
+        self.conn_max_age = connection.settings_dict["CONN_MAX_AGE"]
+        connection.settings_dict["CONN_MAX_AGE"] = None
+
+    def tearDown(self):
+        connection.settings_dict["CONN_MAX_AGE"] = self.conn_max_age
+
+    def test_worker_concurrency_throughput(self):
+        results = []
+        for count in COUNTS:
+            for concurrency in CONCURRENCY:
+                schedule(count)
+                worker = Worker(
+                    concurrency=concurrency,
+                    batch_size=concurrency * 4,
+                    poll_interval=0.01,
+                )
+                with measure() as result:
+                    self.assertEqual(worker.run(burst=True), count)
+                self.assertEqual(scheduled_count(), 0)
+                results.append((count, concurrency, count / result.seconds))
+
+        report(
+            "Database queue worker, thread pool",
+            ("jobs", "threads", "jobs per second"),
+            results,
+        )
@@ -0,0 +1,173 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import path
+
+from viewflow import this
+from viewflow.workflow import briefs, flow
+from viewflow.workflow.flow import FlowAppViewset
+from viewflow.workflow.models import Process, Task
+
+
+@override_settings(VIEWFLOW={"BRIEF_TEXT": True}, ROOT_URLCONF=__name__)
+class Test(TestCase):  # noqa: D101
+    def start(self, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            return BriefFlow.start.run(_process_data={"name": name})
+
+    def test_brief_text_refreshed(self):
+        process = self.start("Beta")
+        task = process.task_set.get(flow_task=BriefFlow.approve)
+
+        process.refresh_from_db()
+        self.assertEqual(process.brief_text, "Order Beta")
+        self.assertEqual(task.brief_text, None)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BriefFlow.approve.run(task)
+
+        task.refresh_from_db()
+        self.assertEqual(task.brief_text, "Beta approved")
+        with self.assertNumQueries(0):
+            self.assertEqual(task.brief, "Beta approved")
+
+    @override_settings(VIEWFLOW={"BRIEF_TEXT": False})
+    def test_brief_text_disabled(self):
+        process = self.start("Beta")
+        process.refresh_from_db()
+        self.assertIsNone(process.brief_text)
+        self.assertEqual(process.brief, "Order Beta")
+
+    def test_brief_text_refreshed_on_cancel(self):
+        canceled, canceled_many = [
+            CancelBriefFlow.start.run(_process_data={"name": name})
+            for name in ["Alpha", "Beta"]
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CancelBriefFlow.instance.cancel(canceled)
+        with self.captureOnCommitCallbacks(execute=True):
+            CancelBriefFlow.instance.cancel_many(
+                Process.objects.filter(pk=canceled_many.pk)
+            )
+
+        self.assertEqual(
+            dict(Process.objects.values_list("data__name", "brief_text")),
+            {"Alpha": "Order Alpha/CANCELED", "Beta": "Order Beta/CANCELED"},
+        )
+        self.assertEqual(
+            set(
+                Task.objects.filter(flow_task=CancelBriefFlow.approve).values_list(
+                    "brief_text", flat=True
+                )
+            ),
+            {"CANCELED/-"},
+        )
+
+    def test_brief_text_refreshed_on_assign(self):
+        admin = User.objects.create_superuser("admin", "admin@admin.com", "admin")
+        process = CancelBriefFlow.start.run(_process_data={"name": "Beta"})
+        task = process.task_set.get(flow_task=CancelBriefFlow.approve)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with task.activation() as activation:
+                activation.assign(admin)
+        task.refresh_from_db()
+        self.assertEqual(task.brief_text, "ASSIGNED/admin")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.filter(pk=task.pk).bulk_unassign(admin)
+        task.refresh_from_db()
+        self.assertEqual(task.brief_text, "NEW/-")
+
+    def test_refresh_command(self):
+        process = self.start("Beta")
+        Process.objects.update(brief_text=None)
+        Task.objects.update(brief_text=None)
+
+        stdout = StringIO()
+        call_command("viewflow_refresh_briefs", "--missing", stdout=stdout)
+        self.assertIn("Briefs of 1 processes refreshed", stdout.getvalue())
+        self.assertIn("Briefs of 2 tasks refreshed", stdout.getvalue())
+
+        process.refresh_from_db()
+        self.assertEqual(process.brief_text, "Order Beta")
+        self.assertEqual(
+            set(process.task_set.values_list("brief_text", flat=True)),
+            {"Start", "Order Beta/NEW"},
+        )
+
+    def test_refresh_command_commits_chunks(self):
+        self.start("Alpha")
+        self.start("Beta")
+        Process.objects.update(brief_text=None)
+
+        refresh_chunk = briefs._refresh_chunk
+
+        def fail_second_chunk(model, objects):
+            if objects[0].data["name"] == "Beta":
+                raise ValueError("Second chunk failed")
+            refresh_chunk(model, objects)
+
+        with mock.patch.object(briefs, "_refresh_chunk", fail_second_chunk):
+            with self.assertRaises(ValueError):
+                call_command(
+                    "viewflow_refresh_briefs", "--chunk-size", "1", stdout=StringIO()
+                )
+
+        self.assertEqual(
+            dict(Process.objects.values_list("data__name", "brief_text")),
+            {"Alpha": "Order Alpha", "Beta": None},
+        )
+
+    def test_process_list_ordered_and_searched_by_brief(self):
+        User.objects.create_superuser("admin", "admin@admin.com", "admin")
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+        alpha, beta = self.start("Beta"), self.start("Alpha")
+
+        response = self.client.get("/flows/?_orderby=brief")
+        self.assertEqual(list(response.context["object_list"]), [beta, alpha])
+
+        response = self.client.get("/flows/?_orderby=-brief")
+        self.assertEqual(list(response.context["object_list"]), [alpha, beta])
+
+        response = self.client.get("/flows/?_search=alpha")
+        self.assertEqual(list(response.context["object_list"]), [beta])
+
+
+class BriefFlow(flow.Flow):  # noqa: D101
+    process_summary_template = "Order {{ process.data.name }}"
+
+    start = flow.StartHandle().Next(this.approve)
+    approve = (
+        flow.Handle(this.approve_order)
+        .Annotation(
+            summary_template="Order {{ process.data.name }}/{{ task.status }}",
+            result_template="{{ process.data.name }} approved",
+        )
+        .Next(this.end)
+    )
+    end = flow.End()
+
+    def approve_order(self, activation):
+        pass
+
+
+class CancelBriefFlow(flow.Flow):  # noqa: D101
+    process_summary_template = "Order {{ process.data.name }}/{{ process.status }}"
+
+    start = flow.StartHandle().Next(this.approve)
+    approve = (
+        flow.View(lambda request, **kwargs: None)
+        .Annotation(summary_template="{{ task.status }}/{{ task.owner|default:'-' }}")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+urlpatterns = [
+    path("", FlowAppViewset(BriefFlow).urls),
+]
@@ -0,0 +1,152 @@
+from unittest import mock
+
+from django.contrib.auth.models import Permission, User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from viewflow import this
+from viewflow.workflow import bulk, flow, lock
+from viewflow.workflow.models import Task
+from viewflow.workflow.status import STATUS
+
+
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.user = User.objects.create(username="user")
+        self.other_user = User.objects.create(username="other")
+        self.user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="viewflow", codename="change_process"
+            )
+        )
+
+    def get_tasks(self, flow_class, count):
+        for _ in range(count):
+            flow_class.start.run()
+        return Task.objects.filter(flow_task=flow_class.task)
+
+    def test_bulk_assign(self):
+        tasks = self.get_tasks(BulkFlow, 3)
+        assigned = tasks.first()
+        with assigned.activation() as activation:
+            activation.assign(self.other_user)
+
+        result = tasks.bulk_assign(self.user)
+
+        self.assertEqual(
+            sorted(tasks.exclude(pk=assigned.pk).values_list("pk", flat=True)),
+            result.succeeded,
+        )
+        self.assertEqual(result.failed, {assigned.pk: bulk.NOT_ALLOWED})
+        self.assertEqual(
+            set(tasks.values_list("status", "owner")),
+            {
+                (STATUS.ASSIGNED, self.user.pk),
+                (STATUS.ASSIGNED, self.other_user.pk),
+            },
+        )
+
+    def test_bulk_assign_permission_denied(self):
+        tasks = self.get_tasks(BulkFlow, 2)
+
+        result = tasks.bulk_assign(self.other_user)
+
+        self.assertEqual(result.succeeded, [])
+        self.assertEqual(
+            result.failed, {task.pk: bulk.PERMISSION_DENIED for task in tasks}
+        )
+        self.assertEqual(set(tasks.values_list("status", flat=True)), {STATUS.NEW})
+
+    def test_bulk_assign_not_human_task(self):
+        process = BulkFlow.start.run()
+        start_task = process.task_set.filter(flow_task=BulkFlow.start)
+
+        result = start_task.bulk_assign(self.user)
+        self.assertEqual(result.failed, {start_task.get().pk: bulk.NOT_ALLOWED})
+
+    def test_bulk_unassign(self):
+        tasks = self.get_tasks(BulkFlow, 2)
+        tasks.bulk_assign(self.user)
+
+        result = tasks.bulk_unassign(self.other_user)
+        self.assertEqual(result.succeeded, [])
+        self.assertEqual(len(result.failed), 2)
+
+        result = tasks.bulk_unassign(self.user)
+        self.assertEqual(len(result.succeeded), 2)
+        self.assertEqual(
+            set(tasks.values_list("status", "owner")), {(STATUS.NEW, None)}
+        )
+
+    def test_bulk_unassign_reassigned(self):
+        tasks = self.get_tasks(BulkFlow, 2)
+        tasks.bulk_assign(self.user)
+        reassigned = tasks.first()
+        get_permitted = bulk._get_permitted
+
+        def reassign(*args, **kwargs):
+            permitted = get_permitted(*args, **kwargs)
+            Task.objects.filter(pk=reassigned.pk).update(owner=self.other_user)
+            return permitted
+
+        with mock.patch.object(bulk, "_get_permitted", reassign):
+            result = tasks.bulk_unassign(self.user)
+
+        self.assertEqual(result.failed, {reassigned.pk: bulk.MODIFIED})
+        self.assertEqual(
+            set(tasks.values_list("status", "owner")),
+            {(STATUS.ASSIGNED, self.other_user.pk), (STATUS.NEW, None)},
+        )
+
+    def test_bulk_assign_permission_checked_once(self):
+        tasks = self.get_tasks(BulkFlow, 3)
+
+        with mock.patch.object(
+            BulkFlow.task, "can_assign", wraps=BulkFlow.task.can_assign
+        ) as can_assign:
+            result = tasks.bulk_assign(self.user)
+
+        self.assertEqual(len(result.succeeded), 3)
+        self.assertEqual(can_assign.call_count, 1)
+
+    def test_bulk_assign_locked_processes(self):
+        tasks = self.get_tasks(LockedBulkFlow, 3)
+
+        result = tasks.bulk_assign(self.user, chunk_size=2)
+
+        self.assertEqual(len(result.succeeded), 3)
+        self.assertEqual(set(tasks.values_list("status", flat=True)), {STATUS.ASSIGNED})
+
+    def test_bulk_assign_queries(self):
+        counts = []
+        self.user.has_perm("viewflow.change_process")  # permissions cache
+        for count in [5, 20]:
+            tasks = self.get_tasks(BulkFlow, count).filter(status=STATUS.NEW)
+            with CaptureQueriesContext(connection) as queries:
+                result = tasks.bulk_assign(self.user)
+            self.assertEqual(len(result.succeeded), count)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+
+class BulkFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class LockedBulkFlow(flow.Flow):  # noqa: D101
+    lock_impl = lock.select_for_update_lock
+
+    start = flow.StartHandle().Next(this.task)
+    task = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process")
+        .Next(this.end)
+    )
+    end = flow.End()
@@ -0,0 +1,238 @@
+import warnings
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from viewflow import this
+from viewflow.workflow import Activation, bulk, flow, lock
+from viewflow.workflow.exceptions import FlowLockFailed
+from viewflow.workflow.fields import get_flow_ref
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.nodes.handle import HandleActivation
+from viewflow.workflow.signals import processes_canceled
+from viewflow.workflow.status import PROCESS, STATUS
+
+
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.signals = []
+        processes_canceled.connect(self.on_canceled)
+
+    def tearDown(self):
+        processes_canceled.disconnect(self.on_canceled)
+
+    def on_canceled(self, sender, process_pks, **kwargs):
+        self.signals.append((sender, process_pks))
+
+    def start_processes(self, flow_class, count):
+        return [flow_class.start.run().pk for _ in range(count)]
+
+    def test_cancel_many(self):
+        pks = self.start_processes(CancelManyFlow, 3)
+
+        result = CancelManyFlow.instance.cancel_many(
+            Process.objects.all(), chunk_size=2
+        )
+
+        self.assertEqual(result.succeeded, pks)
+        self.assertEqual(result.failed, {})
+        self.assertEqual(
+            set(Process.objects.values_list("status", flat=True)), {PROCESS.CANCELED}
+        )
+        self.assertFalse(Process.objects.filter(finished__isnull=True).exists())
+        active_tasks = Task.objects.filter(flow_task__in=[CancelManyFlow.view_task])
+        self.assertEqual(
+            set(active_tasks.values_list("status", flat=True)), {STATUS.CANCELED}
+        )
+        self.assertFalse(active_tasks.filter(finished__isnull=True).exists())
+        self.assertEqual(
+            self.signals, [(CancelManyFlow, pks[:2]), (CancelManyFlow, pks[2:])]
+        )
+
+    def test_cancel_many_skips_not_cancellable(self):
+        started, new = self.start_processes(CancelManyFlow, 2)
+        Task.objects.filter(
+            process_id=started, flow_task=CancelManyFlow.view_task
+        ).update(status=STATUS.STARTED)
+
+        result = CancelManyFlow.instance.cancel_many(Process.objects.all())
+
+        self.assertEqual(result.succeeded, [new])
+        self.assertEqual(result.failed, {started: bulk.NOT_CANCELLABLE})
+        self.assertEqual(Process.objects.get(pk=started).status, PROCESS.NEW)
+        self.assertEqual(
+            set(
+                Task.objects.filter(process_id=started).values_list("status", flat=True)
+            ),
+            {STATUS.DONE, STATUS.STARTED, STATUS.NEW},
+        )
+
+    def test_cancel_many_filters_processes(self):
+        canceled, finished = self.start_processes(CancelManyFlow, 2)
+        other = self.start_processes(CustomCancelFlow, 1)
+        Process.objects.filter(pk=finished).update(status=PROCESS.DONE)
+
+        result = CancelManyFlow.instance.cancel_many(Process.objects.all())
+
+        self.assertEqual(result.succeeded, [canceled])
+        self.assertEqual(Process.objects.get(pk=finished).status, PROCESS.DONE)
+        self.assertEqual(Process.objects.get(pk=other[0]).status, PROCESS.NEW)
+
+    def test_custom_cancel_transition(self):
+        pks = self.start_processes(CustomCancelFlow, 2)
+
+        result = CustomCancelFlow.instance.cancel_many(Process.objects.all())
+
+        self.assertEqual(result.succeeded, pks)
+        self.assertEqual(
+            list(
+                Task.objects.filter(flow_task=CustomCancelFlow.task).values_list(
+                    "status", "data"
+                )
+            ),
+            [(STATUS.CANCELED, {"canceled": True})] * 2,
+        )
+
+    def test_cancel_many_queries(self):
+        counts = []
+        for count in [5, 20]:
+            pks = self.start_processes(LockedCancelManyFlow, count)
+            with CaptureQueriesContext(connection) as queries:
+                result = LockedCancelManyFlow.instance.cancel_many(
+                    Process.objects.filter(pk__in=pks)
+                )
+            self.assertEqual(len(result.succeeded), count)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_cancel_many_optimistic_lock(self):
+        canceled, concurrent = self.start_processes(OptimisticCancelManyFlow, 2)
+        versions = dict(Process.objects.values_list("pk", "version"))
+
+        with self.assertRaises(FlowLockFailed):
+            with OptimisticCancelManyFlow.lock(concurrent):
+                OptimisticCancelManyFlow.instance.cancel_many(
+                    Process.objects.filter(pk=concurrent)
+                )
+
+        result = OptimisticCancelManyFlow.instance.cancel_many(
+            Process.objects.filter(pk=canceled)
+        )
+
+        self.assertEqual(result.succeeded, [canceled])
+        self.assertGreater(Process.objects.get(pk=canceled).version, versions[canceled])
+        self.assertEqual(Process.objects.get(pk=concurrent).status, PROCESS.NEW)
+
+    def test_cancel_single_process_signal(self):
+        (pk,) = self.start_processes(CancelManyFlow, 1)
+
+        CancelManyFlow.instance.cancel(Process.objects.get(pk=pk))
+
+        self.assertEqual(self.signals, [(CancelManyFlow, [pk])])
+
+    def test_management_command(self):
+        canceled, skipped = self.start_processes(CancelManyFlow, 2)
+        Task.objects.filter(
+            process_id=skipped, flow_task=CancelManyFlow.view_task
+        ).update(status=STATUS.STARTED)
+
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "viewflow_cancel_processes",
+            get_flow_ref(CancelManyFlow),
+            "--chunk-size",
+            "1",
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        self.assertIn("1 of 2 processes processed", stdout.getvalue())
+        self.assertIn("2 of 2 processes processed", stdout.getvalue())
+        self.assertIn("1 processes canceled, 1 skipped", stdout.getvalue())
+        self.assertIn("Process {} skipped".format(skipped), stderr.getvalue())
+        self.assertEqual(Process.objects.get(pk=canceled).status, PROCESS.CANCELED)
+
+    def test_management_command_naive_created_before(self):
+        (pk,) = self.start_processes(CancelManyFlow, 1)
+
+        stdout = StringIO()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            call_command(
+                "viewflow_cancel_processes",
+                get_flow_ref(CancelManyFlow),
+                "--created-before",
+                "2000-01-01T00:00:00",
+                stdout=stdout,
+            )
+            call_command(
+                "viewflow_cancel_processes",
+                get_flow_ref(CancelManyFlow),
+                "--created-before",
+                "2999-01-01T00:00:00",
+                stdout=stdout,
+            )
+
+        self.assertIn("0 processes canceled, 0 skipped", stdout.getvalue())
+        self.assertIn("1 processes canceled, 0 skipped", stdout.getvalue())
+        self.assertEqual(Process.objects.get(pk=pk).status, PROCESS.CANCELED)
+
+    def test_management_command_invalid_created_before(self):
+        with self.assertRaisesMessage(CommandError, "Invalid datetime yesterday"):
+            call_command(
+                "viewflow_cancel_processes",
+                get_flow_ref(CancelManyFlow),
+                "--created-before",
+                "yesterday",
+            )
+
+
+class CancelManyFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.split)
+    split = flow.Split().Next(this.view_task).Next(this.handle_task)
+    view_task = flow.View(lambda request, **kwargs: None).Next(this.join)
+    handle_task = flow.Handle().Next(this.join)
+    join = flow.Join().Next(this.end)
+    end = flow.End()
+
+
+class LockedCancelManyFlow(flow.Flow):  # noqa: D101
+    lock_impl = lock.select_for_update_lock
+
+    start = flow.StartHandle().Next(this.split)
+    split = flow.Split().Next(this.view_task).Next(this.handle_task)
+    view_task = flow.View(lambda request, **kwargs: None).Next(this.join)
+    handle_task = flow.Handle().Next(this.join)
+    join = flow.Join().Next(this.end)
+    end = flow.End()
+
+
+class OptimisticCancelManyFlow(flow.Flow):  # noqa: D101
+    lock_impl = lock.OptimisticLock(lock.RetryPolicy(attempts=1, delay=0))
+
+    start = flow.StartHandle().Next(this.split)
+    split = flow.Split().Next(this.view_task).Next(this.handle_task)
+    view_task = flow.View(lambda request, **kwargs: None).Next(this.join)
+    handle_task = flow.Handle().Next(this.join)
+    join = flow.Join().Next(this.end)
+    end = flow.End()
+
+
+class CustomCancelActivation(HandleActivation):  # noqa: D101
+    @Activation.status.super()
+    def cancel(self):
+        self.task.data = {"canceled": True}
+        super().cancel.original()
+
+
+class CustomCancelHandle(flow.Handle):  # noqa: D101
+    activation_class = CustomCancelActivation
+
+
+class CustomCancelFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = CustomCancelHandle().Next(this.end)
+    end = flow.End()
@@ -0,0 +1,229 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import Group, Permission, User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from guardian.shortcuts import assign_perm, remove_perm
+
+from viewflow import this
+from viewflow.workflow import candidates, flow
+from viewflow.workflow.models import Task, TaskCandidate
+from viewflow.workflow.status import STATUS
+
+
+@override_settings(VIEWFLOW={"TASK_CANDIDATES": True})
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.user = User.objects.create(username="user")
+        self.other_user = User.objects.create(username="other")
+        self.group = Group.objects.create(name="group")
+        self.permission = Permission.objects.get(
+            content_type__app_label="viewflow", codename="change_process"
+        )
+
+    def get_candidates(self, task):
+        return {
+            (candidate.user_id, candidate.group_id)
+            for candidate in TaskCandidate.objects.filter(task=task)
+        }
+
+    def get_queue(self, user):
+        return set(
+            Task.objects.user_queue(User.objects.get(pk=user.pk)).filter(
+                status=STATUS.NEW
+            )
+        )
+
+    def test_candidates_created(self):
+        self.user.user_permissions.add(self.permission)
+        self.group.permissions.add(self.permission)
+
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+
+        self.assertEqual(
+            self.get_candidates(task), {(self.user.pk, None), (None, self.group.pk)}
+        )
+        self.assertEqual(self.get_queue(self.user), {task})
+        self.assertEqual(self.get_queue(self.other_user), set())
+
+        self.other_user.groups.add(self.group)
+        self.assertEqual(self.get_queue(self.other_user), {task})
+
+    def test_candidates_updated_on_permission_change(self):
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+        self.assertEqual(self.get_candidates(task), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.add(self.permission)
+        self.assertEqual(self.get_candidates(task), {(self.user.pk, None)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.permission.group_set.add(self.group)
+        self.assertEqual(
+            self.get_candidates(task), {(self.user.pk, None), (None, self.group.pk)}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.remove(self.permission)
+            self.group.permissions.clear()
+        self.assertEqual(self.get_candidates(task), set())
+
+    def test_cleared_permissions_rebuilt_after_commit(self):
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+        self.user.user_permissions.add(self.permission)
+
+        rebuilt = []
+        with mock.patch.object(
+            candidates, "rebuild_candidates", lambda tasks: rebuilt.append(tasks)
+        ):
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.user.user_permissions.clear()
+            self.assertEqual(rebuilt, [])
+
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual([set(tasks) for tasks in rebuilt], [{task}])
+        self.assertEqual(
+            set(rebuilt[0].values_list("owner_permission", flat=True)),
+            {"viewflow.change_process"},
+        )
+
+    def test_split_candidates_added_at_once(self):
+        self.user.user_permissions.add(self.permission)
+
+        with mock.patch.object(
+            candidates, "add_candidates", wraps=candidates.add_candidates
+        ) as add_candidates:
+            process = SplitCandidateFlow.start.run()
+
+        self.assertEqual(add_candidates.call_count, 1)
+        for flow_task in [SplitCandidateFlow.first, SplitCandidateFlow.second]:
+            task = process.task_set.get(flow_task=flow_task)
+            self.assertEqual(self.get_candidates(task), {(self.user.pk, None)})
+
+    def test_revived_task_candidates(self):
+        self.user.user_permissions.add(self.permission)
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+        with task.activation() as activation:
+            activation.cancel()
+        with task.activation() as activation:
+            revived = activation.revive()
+
+        self.assertEqual(revived.owner_permission, "viewflow.change_process")
+        self.assertEqual(self.get_candidates(revived), {(self.user.pk, None)})
+        self.assertEqual(self.get_queue(self.other_user), set())
+
+    def test_canceled_task_candidates_removed(self):
+        self.user.user_permissions.add(self.permission)
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+        self.assertEqual(self.get_candidates(task), {(self.user.pk, None)})
+
+        CandidateFlow.instance.cancel_many(CandidateFlow.process_class.objects.all())
+
+        self.assertEqual(self.get_candidates(task), set())
+
+    def test_object_permission_candidates(self):
+        process = ObjectCandidateFlow.start.run()
+        task = process.task_set.get(flow_task=ObjectCandidateFlow.task)
+        self.assertEqual(self.get_queue(self.user), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_perm("viewflow.change_process", self.user, process)
+        self.assertEqual(self.get_candidates(task), {(self.user.pk, None)})
+        self.assertEqual(self.get_queue(self.user), {task})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            remove_perm("viewflow.change_process", self.user, process)
+        self.assertEqual(self.get_candidates(task), set())
+
+    @override_settings(VIEWFLOW={"TASK_CANDIDATES": False})
+    def test_candidates_disabled(self):
+        self.user.user_permissions.add(self.permission)
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+
+        self.assertEqual(self.get_candidates(task), set())
+        self.assertEqual(self.get_queue(self.user), {task})
+
+    def test_rebuild_command(self):
+        self.user.user_permissions.add(self.permission)
+        process = CandidateFlow.start.run()
+        task = process.task_set.get(flow_task=CandidateFlow.task)
+        TaskCandidate.objects.all().delete()
+
+        output = StringIO()
+        call_command("viewflow_rebuild_candidates", stdout=output)
+
+        self.assertEqual(output.getvalue(), "Candidates of 1 tasks rebuilt\n")
+        self.assertEqual(self.get_candidates(task), {(self.user.pk, None)})
+
+    def test_rebuild_command_commits_chunks(self):
+        self.user.user_permissions.add(self.permission)
+        first, second = [
+            CandidateFlow.start.run().task_set.get(flow_task=CandidateFlow.task)
+            for _ in range(2)
+        ]
+        TaskCandidate.objects.all().delete()
+
+        add_candidates = candidates.add_candidates
+
+        def fail_second_chunk(tasks):
+            if tasks[0] == second:
+                raise ValueError("Second chunk failed")
+            add_candidates(tasks)
+
+        with mock.patch.object(candidates, "add_candidates", fail_second_chunk):
+            with self.assertRaises(ValueError):
+                call_command(
+                    "viewflow_rebuild_candidates",
+                    "--chunk-size",
+                    "1",
+                    stdout=StringIO(),
+                )
+
+        self.assertEqual(self.get_candidates(first), {(self.user.pk, None)})
+        self.assertEqual(self.get_candidates(second), set())
+
+
+class CandidateFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class ObjectCandidateFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process", obj=lambda process: process)
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class SplitCandidateFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.split)
+    split = flow.Split().Next(this.first).Next(this.second)
+    first = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process")
+        .Next(this.join)
+    )
+    second = (
+        flow.View(lambda request, **kwargs: None)
+        .Permission("viewflow.change_process")
+        .Next(this.join)
+    )
+    join = flow.Join().Next(this.end)
+    end = flow.End()
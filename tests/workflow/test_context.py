@@ -1,3 +1,7 @@
+import asyncio
+import threading
+
+from asgiref.sync import async_to_sync, sync_to_async
 from django.test import TestCase
 from viewflow.workflow.context import context, Context
 
@@ -15,3 +19,47 @@ class Test(TestCase):
 
         self.assertFalse(hasattr(context, 'first_scope'))
         self.assertFalse(hasattr(context, 'second_scope'))
+
+    def test_context_default(self):
+        self.assertTrue(context.propagate_exception)
+        with Context(propagate_exception=False):
+            self.assertFalse(context.propagate_exception)
+            with Context(propagate_exception=True):
+                self.assertTrue(context.propagate_exception)
+            self.assertFalse(context.propagate_exception)
+        self.assertTrue(context.propagate_exception)
+
+    def test_context_thread_local(self):
+        results = []
+
+        def lookup():
+            results.append(context.propagate_exception)
+
+        with Context(propagate_exception=False):
+            thread = threading.Thread(target=lookup)
+            thread.start()
+            thread.join()
+        self.assertEqual(results, [True])
+
+    def test_context_task_local(self):
+        async def lookup(value, started, entered):
+            with Context(value=value):
+                started.set()
+                await entered.wait()
+                return context.value
+
+        async def run():
+            first_started, second_started = asyncio.Event(), asyncio.Event()
+            first = asyncio.create_task(lookup(1, first_started, second_started))
+            second = asyncio.create_task(lookup(2, second_started, first_started))
+            return await asyncio.gather(first, second)
+
+        self.assertEqual(asyncio.run(run()), [1, 2])
+        self.assertFalse(hasattr(context, 'value'))
+
+    def test_context_sync_to_async(self):
+        async def run():
+            return await sync_to_async(lambda: context.propagate_exception)()
+
+        with Context(propagate_exception=False):
+            self.assertFalse(async_to_sync(run)())
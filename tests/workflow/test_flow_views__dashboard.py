@@ -0,0 +1,119 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.flow.views import DashboardView
+
+
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser("admin", "admin@admin.com", "admin")
+        self.user = User.objects.create_user("user", "user@user.com", "user")
+
+    def execute(self, process, flow_task):
+        task = process.task_set.get(flow_task=flow_task)
+        with task.activation() as activation:
+            activation.assign(self.admin)
+            activation.start(None)
+            activation.execute()
+
+    def get_context(self, flow_class, user, **kwargs):
+        request = RequestFactory().get("/")
+        request.user = user
+        view = DashboardView(flow_class=flow_class, **kwargs)
+        view.setup(request)
+        return view.get_context_data()
+
+    def test_dashboard_columns(self):
+        processes = [DashboardFlow.start.run() for _ in range(6)]
+        for process in processes[:4]:
+            self.execute(process, DashboardFlow.review)
+        for process in processes[:1]:
+            self.execute(process, DashboardFlow.approve)
+
+        context = self.get_context(DashboardFlow, self.admin, MAX_ROWS=3)
+
+        review, approve = context["columns"]
+        self.assertEqual(review["count"], 2)
+        self.assertEqual(
+            [task.process_id for task in review["tasks"]],
+            [process.pk for process in reversed(processes[4:])],
+        )
+        self.assertEqual(approve["count"], 3)
+        self.assertEqual(
+            [task.process_id for task in approve["tasks"]],
+            [process.pk for process in reversed(processes[1:4])],
+        )
+        self.assertEqual(context["finished_count"], 1)
+        self.assertEqual(
+            [task.process_id for task in context["finished"]], [processes[0].pk]
+        )
+
+    def test_dashboard_not_permitted_flow(self):
+        DashboardFlow.start.run()
+
+        context = self.get_context(DashboardFlow, self.user)
+
+        self.assertEqual(
+            [(column["tasks"], column["count"]) for column in context["columns"]],
+            [([], 0), ([], 0)],
+        )
+
+    def test_dashboard_queries(self):
+        counts = []
+        for flow_class in [DashboardFlow, WideDashboardFlow]:
+            process = flow_class.start.run()
+            self.execute(process, flow_class.review)
+            with CaptureQueriesContext(connection) as queries:
+                self.get_context(flow_class, self.admin)
+            counts.append(len(queries))
+        self.assertEqual(counts, [2, 2])
+
+    def test_dashboard_cache(self):
+        process = DashboardFlow.start.run()
+        context = self.get_context(DashboardFlow, self.admin, cache_timeout=5)
+        self.assertEqual(len(context["columns"][0]["tasks"]), 1)
+
+        self.execute(process, DashboardFlow.review)
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.get_context(DashboardFlow, self.admin, cache_timeout=5)
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            [(column["node"], column["count"]) for column in context["columns"]],
+            [(column["node"], column["count"]) for column in cached["columns"]],
+        )
+        self.assertEqual([column["tasks"] for column in cached["columns"]], [[], []])
+
+    def test_dashboard_not_cached_by_default(self):
+        process = DashboardFlow.start.run()
+        self.get_context(DashboardFlow, self.admin)
+
+        self.execute(process, DashboardFlow.review)
+        context = self.get_context(DashboardFlow, self.admin)
+
+        review, approve = context["columns"]
+        self.assertEqual((review["tasks"], review["count"]), ([], 0))
+        self.assertEqual([task.process_id for task in approve["tasks"]], [process.pk])
+
+
+class DashboardFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.review)
+    review = flow.View(lambda request, **kwargs: None).Next(this.approve)
+    approve = flow.View(lambda request, **kwargs: None).Next(this.end)
+    end = flow.End()
+
+
+class WideDashboardFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.review)
+    review = flow.View(lambda request, **kwargs: None).Next(this.approve)
+    approve = flow.View(lambda request, **kwargs: None).Next(this.check)
+    check = flow.View(lambda request, **kwargs: None).Next(this.sign)
+    sign = flow.View(lambda request, **kwargs: None).Next(this.publish)
+    publish = flow.View(lambda request, **kwargs: None).Next(this.end)
+    end = flow.End()
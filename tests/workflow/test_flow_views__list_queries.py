@@ -0,0 +1,171 @@
+from django.contrib.auth.models import Permission, User
+from django.db import connection, models
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+from django.utils.timezone import now
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.status import STATUS
+
+LIST_URLS = [
+    "/flow/flows/",
+    "/flow/tasks/",
+    "/flow/inbox/",
+    "/flow/queue/",
+    "/flow/archive/",
+    "/workflow/inbox/",
+    "/workflow/queue/",
+    "/workflow/archive/",
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin", "admin@admin.com", "admin")
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+
+    def execute(self, task):
+        with task.activation() as activation:
+            activation.assign(self.admin)
+            activation.start(None)
+            activation.execute()
+
+    def start_processes(self, count, owner=None):
+        for flow_class in [ListQueriesFlow, WorkflowListQueriesFlow]:
+            for n in range(count):
+                process = flow_class.start.run(comment="Process {}".format(n))
+                self.execute(process.task_set.get(flow_task=flow_class.review))
+                approve = process.task_set.get(flow_task=flow_class.approve)
+                if n % 2:
+                    with approve.activation() as activation:
+                        activation.assign(owner or self.admin)
+
+    def get_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_list_views_queries(self):
+        self.start_processes(2)
+        for url in LIST_URLS:
+            self.get_queries(url)  # warm up the caches
+        counts = [self.get_queries(url) for url in LIST_URLS]
+
+        self.start_processes(6)
+        for url, count in zip(LIST_URLS, counts):
+            with self.subTest(url=url):
+                self.assertEqual(self.get_queries(url), count)
+
+    def test_user_list_views_queries(self):
+        user = User.objects.create_user("user", "user@user.com", "user")
+        user.user_permissions.add(
+            *Permission.objects.filter(
+                codename__in=["view_listqueriesprocess", "change_process"]
+            )
+        )
+        self.assertTrue(self.client.login(username="user", password="user"))
+        urls = [url for url in LIST_URLS if url.endswith(("/inbox/", "/queue/"))]
+
+        self.start_processes(2, owner=user)
+        for url in urls:
+            self.get_queries(url)  # warm up the caches
+        counts = [self.get_queries(url) for url in urls]
+
+        self.start_processes(6, owner=user)
+        for url, count in zip(urls, counts):
+            with self.subTest(url=url):
+                self.assertEqual(self.get_queries(url), count)
+
+    def test_active_tasks_column(self):
+        self.start_processes(2)
+        Task.objects.filter(
+            flow_task=ListQueriesFlow.approve, status=STATUS.NEW
+        ).update(finished=now())
+
+        response = self.client.get("/flow/flows/")
+
+        self.assertEqual(
+            {
+                process.pk: process.active_tasks
+                for process in response.context["object_list"]
+            },
+            {
+                process.pk: process.task_set.filter(finished__isnull=True).count()
+                for process in Process.objects.filter(flow_class=ListQueriesFlow)
+            },
+        )
+
+        response = self.client.get("/flow/flows/?_orderby=-active_tasks")
+        self.assertEqual(
+            [process.active_tasks for process in response.context["object_list"]],
+            [1, 0],
+        )
+
+        response = self.client.get("/flow/flows/?_orderby=active_tasks")
+        self.assertEqual(
+            [process.active_tasks for process in response.context["object_list"]],
+            [0, 1],
+        )
+
+
+class ListQueriesProcess(Process):  # noqa: D101
+    comment = models.CharField(max_length=50)
+
+
+def start_process(activation, comment=""):
+    activation.process.comment = comment
+    return activation.process
+
+
+class ListQueriesFlow(flow.Flow):  # noqa: D101
+    process_class = ListQueriesProcess
+    process_summary_template = "{{ process.comment }}"
+
+    start = flow.StartHandle(start_process).Next(this.review)
+    review = (
+        flow.View(lambda request, **kwargs: None)
+        .Annotation(summary_template="Review {{ process.comment }}")
+        .Next(this.approve)
+    )
+    approve = (
+        flow.View(lambda request, **kwargs: None)
+        .Annotation(summary_template="Approve {{ process.comment }}")
+        .Permission("viewflow.change_process")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class WorkflowListQueriesFlow(flow.Flow):  # noqa: D101
+    process_class = ListQueriesProcess
+    process_summary_template = "{{ process.comment }}"
+
+    start = flow.StartHandle(start_process).Next(this.review)
+    review = (
+        flow.View(lambda request, **kwargs: None)
+        .Annotation(summary_template="Review {{ process.comment }}")
+        .Next(this.approve)
+    )
+    approve = (
+        flow.View(lambda request, **kwargs: None)
+        .Annotation(summary_template="Approve {{ process.comment }}")
+        .Permission("viewflow.change_process")
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+urlpatterns = [
+    path("flow/", flow.FlowAppViewset(ListQueriesFlow).urls),
+    path(
+        "workflow/",
+        flow.WorkflowAppViewset(
+            flow_viewsets=[flow.FlowViewset(WorkflowListQueriesFlow)]
+        ).urls,
+    ),
+]
@@ -5,6 +5,7 @@ import time
 import unittest
 
 from django.db import connection, DatabaseError
+from django.db.models import F
 from django.test import skipUnlessDBFeature, TransactionTestCase
 
 from viewflow import this
@@ -117,3 +118,235 @@ class Test(TransactionTestCase):
 
         thread1.join()
         thread2.join()
+
+
+class OptimisticLockTest(TransactionTestCase):
+    def setUp(self):
+        self.process = OptimisticLockFlow.process_class.objects.create(
+            flow_class=OptimisticLockFlow
+        )
+
+    def bump_version(self):
+        OptimisticLockFlow.process_class.objects.filter(pk=self.process.pk).update(
+            version=F("version") + 1
+        )
+
+    def test_version_incremented(self):
+        with OptimisticLockFlow.lock(self.process.pk):
+            pass
+        self.process.refresh_from_db()
+        self.assertEqual(self.process.version, 1)
+
+    def test_conflict_rolled_back(self):
+        with self.assertRaises(FlowLockFailed):
+            with OptimisticLockFlow.lock(self.process.pk):
+                self.process.status = "DONE"
+                self.process.save()
+                self.bump_version()
+
+        self.process.refresh_from_db()
+        self.assertEqual(self.process.status, "NEW")
+        self.assertEqual(self.process.version, 0)
+
+    def test_process_save_keeps_version(self):
+        self.bump_version()
+        self.process.status = "DONE"
+        self.process.save()
+        self.process.refresh_from_db()
+        self.assertEqual(self.process.version, 1)
+
+    def test_process_save_without_optimistic_lock(self):
+        process = Test.TestFlow.process_class.objects.create(flow_class=Test.TestFlow)
+        Test.TestFlow.process_class.objects.filter(pk=process.pk).delete()
+
+        process.status = "DONE"
+        process.save()
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, "DONE")
+
+    def test_retry_policy_reruns_function(self):
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                self.bump_version()  # concurrent modification
+            return len(calls)
+
+        result = OptimisticLockFlow.run_locked(self.process.pk, func)
+        self.assertEqual(result, 2)
+
+    def test_retry_policy_gives_up(self):
+        with self.assertRaises(FlowLockFailed):
+            OptimisticLockFlow.run_locked(self.process.pk, self.bump_version)
+
+    def test_join(self):
+        process = OptimisticLockFlow.start.run()
+        for flow_task in [OptimisticLockFlow.first, OptimisticLockFlow.second]:
+            task = process.task_set.get(flow_task=flow_task)
+            flow_task.run(task)
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, "DONE")
+        self.assertEqual(process.version, 3)
+
+
+class AdvisoryLockTest(TransactionTestCase):
+    def setUp(self):
+        self.process = Test.TestFlow.process_class.objects.create(
+            flow_class=Test.TestFlow
+        )
+        self.acquired = threading.Event()
+        self.release = threading.Event()
+
+    def hold_lock(self, lock_impl):
+        try:
+            with lock_impl(Test.TestFlow, self.process.pk):
+                self.acquired.set()
+                self.release.wait(10)
+        finally:
+            connection.close()
+
+    def start_holder(self, lock_impl):
+        thread = threading.Thread(target=self.hold_lock, args=[lock_impl])
+        thread.start()
+        self.assertTrue(self.acquired.wait(10))
+        return thread
+
+    def test_lock_key(self):
+        lock_impl = lock.AdvisoryLock()
+        key = lock_impl.get_key(Test.TestFlow, 1)
+        self.assertEqual(key, lock_impl.get_key(Test.TestFlow, 1))
+        self.assertNotEqual(key, lock_impl.get_key(Test.TestFlow, 2))
+        self.assertTrue(-(2**63) <= key < 2**63)
+
+    def test_stats_snapshot(self):
+        lock_impl = lock.AdvisoryLock()
+        with lock_impl(Test.TestFlow, self.process.pk):
+            pass
+        stats = lock_impl.get_stats(Test.TestFlow)
+
+        with lock_impl(Test.TestFlow, self.process.pk):
+            pass
+        self.assertEqual(stats.acquired, 1)
+        self.assertEqual(lock_impl.get_stats(Test.TestFlow).acquired, 2)
+
+        lock_impl.reset_stats()
+        self.assertEqual(lock_impl.get_stats(Test.TestFlow).acquired, 0)
+
+    def test_non_blocking_lock_fails(self):
+        lock_impl = lock.AdvisoryLock(blocking=False)
+        thread = self.start_holder(lock_impl)
+        try:
+            with self.assertRaises(FlowLockFailed):
+                with lock_impl(Test.TestFlow, self.process.pk):
+                    pass
+        finally:
+            self.release.set()
+            thread.join()
+
+        stats = lock_impl.get_stats(Test.TestFlow)
+        self.assertEqual((stats.acquired, stats.contended, stats.failed), (1, 1, 1))
+
+    def test_blocking_lock_timeout(self):
+        lock_impl = lock.AdvisoryLock(timeout=0.1)
+        thread = self.start_holder(lock_impl)
+        try:
+            with self.assertRaises(FlowLockFailed):
+                with lock_impl(Test.TestFlow, self.process.pk):
+                    pass
+        finally:
+            self.release.set()
+            thread.join()
+
+        stats = lock_impl.get_stats(Test.TestFlow)
+        self.assertEqual(stats.failed, 1)
+        self.assertGreaterEqual(stats.max_wait_time, 0.1)
+
+    def test_blocking_lock_waits(self):
+        lock_impl = lock.AdvisoryLock(timeout=10)
+        thread = self.start_holder(lock_impl)
+        threading.Timer(0.1, self.release.set).start()
+        try:
+            with lock_impl(Test.TestFlow, self.process.pk):
+                pass
+        finally:
+            thread.join()
+
+        stats = lock_impl.get_stats(Test.TestFlow)
+        self.assertEqual((stats.acquired, stats.contended, stats.failed), (2, 1, 0))
+        self.assertGreater(stats.wait_time, 0)
+
+
+class LocalLockTest(TransactionTestCase):
+    key = ("test", 1)
+
+    def test_fifo_order(self):
+        lock_impl = lock.LocalLock()
+        order = []
+
+        def acquire(n):
+            lock_impl.acquire(self.key)
+            order.append(n)
+            lock_impl.release(self.key)
+
+        lock_impl.acquire(self.key)
+        threads = []
+        for n in range(5):
+            thread = threading.Thread(target=acquire, args=[n])
+            thread.start()
+            while len(lock_impl._get_stripe(self.key)[1][self.key].waiters) <= n:
+                time.sleep(0.001)
+            threads.append(thread)
+        lock_impl.release(self.key)
+
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+
+    def test_idle_entries_cleanup(self):
+        lock_impl = lock.LocalLock(stripes=1)
+        lock_impl.acquire(self.key)
+        self.assertEqual(len(lock_impl._stripes[0][1]), 1)
+        lock_impl.release(self.key)
+        self.assertEqual(len(lock_impl._stripes[0][1]), 0)
+
+    def test_timeout(self):
+        lock_impl = lock.LocalLock(timeout=0.05)
+        process = Test.TestFlow.process_class.objects.create(flow_class=Test.TestFlow)
+        key = (Test.TestFlow.instance.flow_label, process.pk)
+
+        thread = threading.Thread(target=lock_impl.acquire, args=[key])
+        thread.start()
+        thread.join()
+        try:
+            with self.assertRaises(FlowLockFailed):
+                with lock_impl(Test.TestFlow, process.pk):
+                    pass
+            self.assertEqual(len(lock_impl._get_stripe(key)[1][key].waiters), 0)
+        finally:
+            lock_impl.release(key)
+
+    def test_reentrant_acquisition_detected(self):
+        lock_impl = lock.LocalLock(debug=True)
+        process = Test.TestFlow.process_class.objects.create(flow_class=Test.TestFlow)
+        with lock_impl(Test.TestFlow, process.pk):
+            with self.assertRaises(FlowLockFailed):
+                with lock_impl(Test.TestFlow, process.pk):
+                    pass
+
+        # released
+        with lock_impl(Test.TestFlow, process.pk):
+            pass
+
+
+class OptimisticLockFlow(flow.Flow):
+    lock_impl = lock.OptimisticLock(lock.RetryPolicy(attempts=3, delay=0))
+
+    start = flow.StartHandle().Next(this.split)
+    split = flow.Split().Next(this.first).Next(this.second)
+    first = flow.Handle().Next(this.join)
+    second = flow.Handle().Next(this.join)
+    join = flow.Join().Next(this.end)
+    end = flow.End()
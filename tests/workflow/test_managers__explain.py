@@ -0,0 +1,70 @@
+from django.contrib.auth.models import Permission, User
+from django.db import connection
+from django.test import TestCase
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.status import STATUS
+
+
+class Test(TestCase):  # noqa: D101
+    """Check that the task lists are executed as index scans."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="user")
+        cls.user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="viewflow", codename="view_process"
+            )
+        )
+        other_users = User.objects.bulk_create(
+            User(username="user_{}".format(n)) for n in range(50)
+        )
+        process = Process.objects.create(flow_class=ExplainFlow)
+        statuses = [STATUS.NEW, STATUS.ASSIGNED] + [STATUS.DONE] * 18
+        Task.objects.bulk_create(
+            Task(
+                process=process,
+                flow_class=ExplainFlow,
+                flow_task=ExplainFlow.task,
+                flow_task_type="HUMAN" if n % 5 else "FUNCTION",
+                status=statuses[n % len(statuses)],
+                owner=other_users[n % len(other_users)] if n % 4 else None,
+                finished=process.created if n % 20 > 1 else None,
+            )
+            for n in range(5000)
+        )
+
+    def setUp(self):
+        if connection.vendor != "postgresql":
+            self.skipTest("EXPLAIN output is checked on PostgreSQL only")
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE viewflow_task")
+
+    def assertIndexUsed(self, queryset, index_name):
+        plan = queryset[:25].explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("Seq Scan on viewflow_task", plan)
+
+    def test_inbox(self):
+        self.assertIndexUsed(
+            Task.objects.inbox([ExplainFlow], self.user), "viewflow_task_inbox_idx"
+        )
+
+    def test_queue(self):
+        self.assertIndexUsed(
+            Task.objects.queue([ExplainFlow], self.user), "viewflow_task_queue_idx"
+        )
+
+    def test_archive(self):
+        self.assertIndexUsed(
+            Task.objects.archive([ExplainFlow], self.user), "viewflow_task_archive_idx"
+        )
+
+
+class ExplainFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = flow.View(lambda request, **kwargs: None).Next(this.end)
+    end = flow.End()
@@ -18,8 +18,8 @@ class Test(TestCase):  # noqa: D101
         self.assertEqual(
             str(queryset.query).strip(),
             'SELECT "viewflow_process"."id", "viewflow_process"."flow_class", "viewflow_process"."status",'
-            ' "viewflow_process"."created", "viewflow_process"."finished", "viewflow_process"."data",'
-            ' "viewflow_process"."parent_task_id", "viewflow_process"."seed_content_type_id",'
+            ' "viewflow_process"."created", "viewflow_process"."finished", "viewflow_process"."version",'
+            ' "viewflow_process"."brief_text", "viewflow_process"."data", "viewflow_process"."parent_task_id", "viewflow_process"."seed_content_type_id",'
             ' "viewflow_process"."seed_object_id", "viewflow_process"."artifact_content_type_id",'
             ' "viewflow_process"."artifact_object_id" FROM "viewflow_process"'
             ' WHERE "viewflow_process"."flow_class" = tests/workflow.test_managers__sql.ChildFlow'
@@ -36,6 +36,8 @@ class Test(TestCase):  # noqa: D101
             '       "viewflow_process"."status",\n'
             '       "viewflow_process"."created",\n'
             '       "viewflow_process"."finished",\n'
+            '       "viewflow_process"."version",\n'
+            '       "viewflow_process"."brief_text",\n'
             '       "viewflow_process"."data",\n'
             '       "viewflow_process"."parent_task_id",\n'
             '       "viewflow_process"."seed_content_type_id",\n'
@@ -95,12 +97,14 @@ class Test(TestCase):  # noqa: D101
 
         self.assertEqual(
             str(queryset.query).strip(),
-            'SELECT "viewflow_task"."id", "viewflow_task"."flow_task", "viewflow_task"."flow_task_type",'
-            ' "viewflow_task"."status", "viewflow_task"."created", "viewflow_task"."assigned",'
+            'SELECT "viewflow_task"."id", "viewflow_task"."flow_class", "viewflow_task"."flow_task",'
+            ' "viewflow_task"."flow_task_type", "viewflow_task"."status", "viewflow_task"."created",'
+            ' "viewflow_task"."assigned",'
             ' "viewflow_task"."started", "viewflow_task"."finished", "viewflow_task"."token",'
             ' "viewflow_task"."external_task_id", "viewflow_task"."owner_id",'
             ' "viewflow_task"."owner_permission", "viewflow_task"."owner_permission_content_type_id",'
-            ' "viewflow_task"."owner_permission_obj_pk", "viewflow_task"."process_id",'
+            ' "viewflow_task"."owner_permission_obj_pk", "viewflow_task"."owner_permission_obj_check",'
+            ' "viewflow_task"."brief_text", "viewflow_task"."process_id",'
             ' "viewflow_task"."data", "viewflow_task"."seed_content_type_id",'
             ' "viewflow_task"."seed_object_id", "viewflow_task"."artifact_content_type_id",'
             ' "viewflow_task"."artifact_object_id"'
@@ -132,6 +136,11 @@ class Test(TestCase):  # noqa: D101
                          ' WHERE "viewflow_process"."flow_class" IN (tests/workflow.test_managers__sql.ChildFlow)')
         """
 
+    def test_task_flow_class_from_flow_task(self):
+        process = ChildProcess.objects.create(flow_class=ChildFlow)
+        task = ChildTask.objects.create(process=process, flow_task=ChildFlow.start)
+        self.assertEqual(task.flow_class, ChildFlow)
+
     def test_task_queryset_coerce_classes(self):
         process1 = ChildProcess.objects.create(flow_class=ChildFlow)
         process2 = GrandChildProcess.objects.create(flow_class=GrandChildFlow)
@@ -145,6 +154,25 @@ class Test(TestCase):  # noqa: D101
             )
             self.assertEqual(set(queryset), set([task1, task2]))
 
+    def test_task_queryset_prefetch_coerced_processes(self):
+        process1 = ChildProcess.objects.create(flow_class=ChildFlow)
+        process2 = GrandChildProcess.objects.create(flow_class=GrandChildFlow)
+
+        Task.objects.create(process=process1, flow_task=ChildFlow.start)
+        Task.objects.create(process=process2, flow_task=GrandChildFlow.start)
+
+        with self.assertNumQueries(4):
+            queryset = (
+                managers.TaskQuerySet(model=Task)
+                .order_by("pk")
+                .prefetch_coerced_processes()
+            )
+            processes = [task.process.coerced for task in queryset]
+
+        self.assertEqual(processes, [process1, process2])
+        self.assertIsInstance(processes[0], ChildProcess)
+        self.assertIsInstance(processes[1], GrandChildProcess)
+
     def test_task_queryset_coerce_values_list(self):
         process = ChildProcess.objects.create(flow_class=ChildFlow)
         task = ChildTask.objects.create(process=process, flow_task=ChildFlow.start)
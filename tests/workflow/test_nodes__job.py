@@ -0,0 +1,197 @@
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.executors import ThreadExecutor, get_executor, run_job
+from viewflow.workflow.fields import get_task_ref
+from viewflow.workflow.status import STATUS
+
+
+class Test(TestCase):  # noqa: D101
+    def test_job_scheduled_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            process = TestJobWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestJobWorkflow.job)
+        self.assertEqual(job_task.status, STATUS.SCHEDULED)
+        self.assertIn("scheduled", job_task.data["_job"])
+        self.assertEqual(len(callbacks), 1)
+
+    def test_job_executed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestJobWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestJobWorkflow.job)
+        self.assertEqual(job_task.status, STATUS.DONE)
+        self.assertEqual(
+            set(job_task.data["_job"]),
+            {"scheduled", "started", "finished", "wait", "duration"},
+        )
+        self.assertGreaterEqual(job_task.data["_job"]["duration"], 0)
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, STATUS.DONE)
+        self.assertEqual(process.data, {"executed": 1})
+
+    def test_job_failed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestFailedJobWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestFailedJobWorkflow.job)
+        self.assertEqual(job_task.status, STATUS.ERROR)
+        self.assertEqual(job_task.data["_exception"]["title"], "Job failed")
+        self.assertIn("duration", job_task.data["_job"])
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, STATUS.NEW)
+        self.assertEqual(process.data, {})
+
+    def test_job_delivered_twice(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestJobWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestJobWorkflow.job)
+        job = {
+            "task": get_task_ref(TestJobWorkflow.job),
+            "process_pk": process.pk,
+            "task_pk": job_task.pk,
+            "external_task_id": job_task.external_task_id,
+        }
+        self.assertIsNone(run_job(**job))
+
+        process.refresh_from_db()
+        self.assertEqual(process.data, {"executed": 1})
+
+    def test_job_external_id_mismatch(self):
+        with self.captureOnCommitCallbacks():
+            process = TestJobWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestJobWorkflow.job)
+        self.assertIsNone(
+            run_job(
+                get_task_ref(TestJobWorkflow.job),
+                process.pk,
+                job_task.pk,
+                external_task_id="outdated",
+            )
+        )
+        job_task.refresh_from_db()
+        self.assertEqual(job_task.status, STATUS.SCHEDULED)
+
+    def test_job_canceled(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            process = TestJobWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestJobWorkflow.job)
+        activation = TestJobWorkflow.job.activation_class(job_task)
+        with self.captureOnCommitCallbacks():
+            activation.cancel()
+
+        callbacks[0]()
+        job_task.refresh_from_db()
+        self.assertEqual(job_task.status, STATUS.CANCELED)
+
+    def test_job_executor_selection(self):
+        self.assertIs(TestExecutorWorkflow.flow_job.get_executor(), RECORDER)
+        self.assertIs(TestExecutorWorkflow.node_job.get_executor(), NODE_RECORDER)
+        self.assertIs(
+            TestJobWorkflow.job.get_executor(),
+            get_executor("viewflow.workflow.executors.ImmediateExecutor"),
+        )
+
+        with override_settings(
+            VIEWFLOW={"JOB_EXECUTOR": "tests.workflow.test_nodes__job.RECORDER"}
+        ):
+            self.assertIs(TestJobWorkflow.job.get_executor(), RECORDER)
+
+    def test_job_submitted_to_executor(self):
+        RECORDER.jobs.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestExecutorWorkflow.start.run()
+
+        job_task = process.task_set.get(flow_task=TestExecutorWorkflow.flow_job)
+        self.assertEqual(
+            RECORDER.jobs,
+            [
+                {
+                    "task": "tests/workflow.test_nodes__job.TestExecutorWorkflow.flow_job",
+                    "process_pk": process.pk,
+                    "task_pk": job_task.pk,
+                    "external_task_id": job_task.external_task_id,
+                }
+            ],
+        )
+
+
+class TestThreadExecutor(TransactionTestCase):  # noqa: D101
+    def test_thread_executor(self):
+        try:
+            process = TestThreadJobWorkflow.start.run()
+        finally:
+            THREAD_EXECUTOR.shutdown()
+
+        job_task = process.task_set.get(flow_task=TestThreadJobWorkflow.job)
+        self.assertEqual(job_task.status, STATUS.DONE)
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, STATUS.DONE)
+        self.assertEqual(process.data, {"executed": 1})
+
+
+class RecordingExecutor(object):
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+
+
+RECORDER = RecordingExecutor()
+NODE_RECORDER = RecordingExecutor()
+THREAD_EXECUTOR = ThreadExecutor(max_workers=1)
+
+
+class TestJobWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        activation.process.data["executed"] = 1
+        activation.process.save()
+
+
+class TestFailedJobWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        activation.process.data["executed"] = 1
+        activation.process.save()
+        raise ValueError("Job failed")
+
+
+class TestExecutorWorkflow(flow.Flow):  # noqa: D101
+    job_executor = RECORDER
+
+    start = flow.StartHandle().Next(this.split)
+    split = flow.Split().Next(this.flow_job).Next(this.node_job)
+    flow_job = flow.Job(this.execute).Next(this.end)
+    node_job = flow.Job(this.execute).Executor(NODE_RECORDER).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        pass
+
+
+class TestThreadJobWorkflow(flow.Flow):  # noqa: D101
+    job_executor = THREAD_EXECUTOR
+
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        activation.process.data["executed"] = 1
+        activation.process.save()
@@ -25,6 +25,54 @@ class Test(TestCase):  # noqa: D101
         self.assertEqual(process.status, STATUS.DONE)
         self.assertEqual(process.task_set.count(), 6)
 
+    def test_join_arrivals_counted(self):
+        process = TestASyncWorkflow.start.run()
+        first_task = process.task_set.get(flow_task=TestASyncWorkflow.first)
+        TestASyncWorkflow.first.run(first_task)
+
+        join_task = process.task_set.get(flow_task=TestASyncWorkflow.join)
+        self.assertEqual(
+            join_task.data["_join"],
+            {
+                "prefix": first_task.token.get_common_split_prefix(
+                    join_task.token, first_task.pk
+                ),
+                "expected": 2,
+                "arrived": 1,
+            },
+        )
+
+    def test_join_without_counters(self):
+        process = TestASyncWorkflow.start.run()
+        first_task = process.task_set.get(flow_task=TestASyncWorkflow.first)
+        second_task = process.task_set.get(flow_task=TestASyncWorkflow.second)
+        TestASyncWorkflow.first.run(first_task)
+
+        join_task = process.task_set.get(flow_task=TestASyncWorkflow.join)
+        del join_task.data["_join"]
+        join_task.save()
+
+        TestASyncWorkflow.second.run(second_task)
+        join_task.refresh_from_db()
+        self.assertEqual(join_task.status, STATUS.DONE)
+        self.assertEqual(join_task.data["_join"]["arrived"], 2)
+
+    def test_join_branch_finished_by_end(self):
+        process = TestEndBranchWorkflow.start.run()
+        first_task = process.task_set.get(flow_task=TestEndBranchWorkflow.first)
+        second_task = process.task_set.get(flow_task=TestEndBranchWorkflow.second)
+
+        TestEndBranchWorkflow.second.run(second_task)
+        TestEndBranchWorkflow.first.run(first_task)
+
+        join_task = process.task_set.get(flow_task=TestEndBranchWorkflow.join)
+        self.assertEqual(join_task.status, STATUS.DONE)
+        self.assertEqual(join_task.data["_join"]["expected"], 3)
+        self.assertEqual(join_task.data["_join"]["arrived"], 2)
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, STATUS.DONE)
+
     def test_join_sync(self):
         process = TestSyncWorkflow.start.run()
         process.refresh_from_db()
@@ -70,3 +118,24 @@ class TestASyncWorkflow(flow.Flow):  # noqa: D101
 
     def handler(self, activation):
         pass
+
+
+class TestEndBranchWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.split)
+
+    split = (
+        flow.Split()
+        .Next(this.first)
+        .Next(this.second)
+        .Next(this.join)
+    )
+
+    first = flow.Handle(this.handler).Next(this.join)
+    second = flow.Handle(this.handler).Next(this.end)
+
+    join = flow.Join().Next(this.end)
+
+    end = flow.End()
+
+    def handler(self, activation):
+        pass
@@ -2,7 +2,8 @@ from django.urls import path, reverse
 from django.test import TestCase, override_settings
 
 from viewflow import this
-from viewflow.workflow import flow, STATUS
+from viewflow.workflow import flow, PROCESS, STATUS
+from viewflow.workflow.signals import flow_started, task_finished
 from viewflow.workflow.flow import views
 
 
@@ -34,6 +35,41 @@ class Test(TestCase):  # noqa: D101
 
         self.assertEqual(params, ['param1', 'param2'])
 
+    def test_start_handle_run_many(self):
+        started, finished = [], []
+
+        def on_flow_started(sender, process, **kwargs):
+            started.append(process.pk)
+
+        def on_task_finished(sender, task, **kwargs):
+            finished.append(task.flow_task)
+
+        flow_started.connect(on_flow_started)
+        task_finished.connect(on_task_finished)
+        self.addCleanup(flow_started.disconnect, on_flow_started)
+        self.addCleanup(task_finished.disconnect, on_task_finished)
+
+        processes = TestWorkflow.custom_start.run_many(
+            [{'param1': n, '_process_data': {'n': n}} for n in range(5)],
+            chunk_size=2,
+        )
+
+        self.assertEqual(len(processes), 5)
+        self.assertEqual([process.data['n'] for process in processes], [0, 1, 2, 3, 4])
+        self.assertEqual(started, [process.pk for process in processes])
+        self.assertEqual(finished.count(TestWorkflow.custom_start), 5)
+        for process in processes:
+            process.refresh_from_db()
+            self.assertEqual(process.status, PROCESS.DONE)
+
+            start_task = process.task_set.get(flow_task=TestWorkflow.custom_start)
+            self.assertEqual(start_task.status, STATUS.DONE)
+            self.assertEqual(start_task.flow_class, TestWorkflow)
+            self.assertEqual(
+                [task.flow_task for task in start_task.leading.all()],
+                [TestWorkflow.end],
+            )
+
     def test_start_view(self):
         start_url = reverse('testworkflow:view_start:execute')
         self.assertEqual(start_url, '/view_start/')
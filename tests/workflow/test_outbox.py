@@ -0,0 +1,185 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from viewflow import this
+from viewflow.workflow import flow, outbox
+from viewflow.workflow.models import OutboxMessage
+from viewflow.workflow.signals import flow_event
+from viewflow.workflow.status import STATUS
+
+
+@override_settings(VIEWFLOW={"OUTBOX": True})
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.events, self.event_processes = [], []
+        flow_event.connect(self.on_flow_event, sender=OutboxFlow)
+        RECORDER.jobs.clear()
+
+    def tearDown(self):
+        flow_event.disconnect(self.on_flow_event, sender=OutboxFlow)
+
+    def on_flow_event(self, sender, event, process, task, **kwargs):
+        self.events.append((event, task.flow_task.name if task else None))
+        self.event_processes.append(process)
+
+    def test_job_delivered_from_outbox(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            process = OutboxFlow.start.run()
+        self.assertEqual(callbacks, [])
+
+        job_task = process.task_set.get(flow_task=OutboxFlow.job)
+        self.assertEqual(job_task.status, STATUS.SCHEDULED)
+        self.assertTrue(
+            OutboxMessage.objects.filter(
+                kind="job", dedup_key=job_task.external_task_id
+            ).exists()
+        )
+
+        outbox.deliver_pending()
+
+        job_task.refresh_from_db()
+        self.assertEqual(job_task.status, STATUS.DONE)
+        self.assertFalse(OutboxMessage.objects.exists())
+        self.assertEqual(
+            self.events,
+            [
+                ("task_started", "start"),
+                ("task_finished", "start"),
+                ("flow_started", "start"),
+                ("task_started", "job"),
+                ("task_finished", "job"),
+                ("task_started", "end"),
+                ("task_finished", "end"),
+                ("flow_finished", "end"),
+                ("task_finished", "end"),
+            ],
+        )
+
+    def test_start_events_carry_process_and_task(self):
+        process = OutboxFlow.start.run()
+        start_task = process.task_set.get(flow_task=OutboxFlow.start)
+
+        outbox.deliver_batch(batch_size=3)
+
+        self.assertEqual(
+            self.events,
+            [
+                ("task_started", "start"),
+                ("task_finished", "start"),
+                ("flow_started", "start"),
+            ],
+        )
+        self.assertEqual(self.event_processes, [process] * 3)
+        self.assertEqual(
+            OutboxMessage.objects.filter(payload__task_pk=start_task.pk).count(), 0
+        )
+
+    def test_rolled_back_messages_discarded(self):
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                OutboxFlow.start.run()
+                raise ValueError("Rollback")
+
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_events_not_recorded_without_receivers(self):
+        flow_event.disconnect(self.on_flow_event, sender=OutboxFlow)
+        OutboxFlow.start.run()
+        self.assertEqual(
+            list(OutboxMessage.objects.values_list("kind", flat=True)), ["job"]
+        )
+
+    @override_settings(VIEWFLOW={"OUTBOX": False})
+    def test_outbox_disabled(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            OutboxFlow.start.run()
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_failed_delivery_retried(self):
+        process = OutboxFlow.start.run()
+        flow_event.disconnect(self.on_flow_event, sender=OutboxFlow)
+        flow_event.connect(self.on_failed_event, sender=OutboxFlow)
+        try:
+            self.assertEqual(outbox.deliver_batch(), 1)
+        finally:
+            flow_event.disconnect(self.on_failed_event, sender=OutboxFlow)
+
+        failed = OutboxMessage.objects.filter(attempts=1)
+        self.assertEqual(failed.count(), 3)
+        for message in failed:
+            self.assertEqual(message.attempts, 1)
+            self.assertIn("Receiver failed", message.last_error)
+            self.assertGreater(message.available, message.created)
+
+        job_task = process.task_set.get(flow_task=OutboxFlow.job)
+        self.assertEqual(job_task.status, STATUS.DONE)
+
+    def on_failed_event(self, sender, **kwargs):
+        raise ValueError("Receiver failed")
+
+    def test_duplicate_jobs_delivered_once(self):
+        flow_event.disconnect(self.on_flow_event, sender=OutboxFlow)
+        process = RecordedOutboxFlow.start.run()
+        job_task = process.task_set.get(flow_task=RecordedOutboxFlow.job)
+        message = OutboxMessage.objects.get()
+        OutboxMessage.objects.create(
+            kind=message.kind, payload=message.payload, dedup_key=message.dedup_key
+        )
+
+        self.assertEqual(outbox.deliver_pending(), 2)
+        self.assertEqual(
+            RECORDER.jobs,
+            [
+                {
+                    "task": "tests/workflow.test_outbox.RecordedOutboxFlow.job",
+                    "process_pk": process.pk,
+                    "task_pk": job_task.pk,
+                    "external_task_id": job_task.external_task_id,
+                }
+            ],
+        )
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_relay_command(self):
+        OutboxFlow.start.run()
+
+        stdout = StringIO()
+        call_command("viewflow_relay_outbox", stdout=stdout)
+        self.assertIn("10 messages delivered", stdout.getvalue())
+
+        with override_settings(VIEWFLOW={"OUTBOX": False}):
+            with self.assertRaises(CommandError):
+                call_command("viewflow_relay_outbox")
+
+
+class RecordingExecutor(object):
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+
+
+RECORDER = RecordingExecutor()
+
+
+class OutboxFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        pass
+
+
+class RecordedOutboxFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Executor(RECORDER).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        pass
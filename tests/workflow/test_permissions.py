@@ -0,0 +1,106 @@
+from django.contrib.auth.models import Group, Permission, User
+from django.test import TestCase, override_settings
+from guardian.shortcuts import assign_perm
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.models import Process, Task
+from viewflow.workflow.permissions import get_permission_snapshot
+
+
+@override_settings(VIEWFLOW={"PERMISSION_CACHE": "default"})
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        self.user = User.objects.create(username="user")
+        self.permission = Permission.objects.get(
+            content_type__app_label="viewflow", codename="change_process"
+        )
+        self.process = Process.objects.create(flow_class=PermissionFlow)
+
+    def create_task(self, **kwargs):
+        return Task.objects.create(
+            process=self.process,
+            flow_task=PermissionFlow.task,
+            flow_task_type="HUMAN",
+            **kwargs
+        )
+
+    def get_snapshot(self):
+        # get_all_permissions caches the result on the user instance
+        return get_permission_snapshot(User.objects.get(pk=self.user.pk))
+
+    def test_snapshot_cached(self):
+        self.get_snapshot()
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            snapshot = get_permission_snapshot(user)
+        self.assertEqual(snapshot.perms, frozenset())
+
+    def test_snapshot_invalidated_on_user_permissions(self):
+        self.get_snapshot()
+        self.user.user_permissions.add(self.permission)
+        self.assertEqual(self.get_snapshot().perms, {"viewflow.change_process"})
+
+        self.permission.user_set.remove(self.user)
+        self.assertEqual(self.get_snapshot().perms, frozenset())
+
+    def test_snapshot_invalidated_on_groups(self):
+        group = Group.objects.create(name="group")
+        self.user.groups.add(group)
+        self.get_snapshot()
+
+        group.permissions.add(self.permission)
+        self.assertEqual(self.get_snapshot().perms, {"viewflow.change_process"})
+
+        self.user.groups.clear()
+        self.assertEqual(self.get_snapshot().perms, frozenset())
+
+    def test_snapshot_invalidated_on_object_permissions(self):
+        self.get_snapshot()
+        assign_perm("viewflow.change_process", self.user, self.process)
+        self.assertEqual(
+            self.get_snapshot().object_perms,
+            {"viewflow.change_process_{}".format(self.process.pk)},
+        )
+
+    @override_settings(VIEWFLOW={"PERMISSION_CACHE": None})
+    def test_snapshot_not_cached(self):
+        self.get_snapshot()
+        user = User.objects.get(pk=self.user.pk)
+        # user and group permissions, user and group object permissions
+        with self.assertNumQueries(4):
+            get_permission_snapshot(user)
+
+    def test_owner_permission_obj_check(self):
+        task = self.create_task(
+            owner_permission="viewflow.change_process",
+            owner_permission_obj=self.process,
+        )
+        self.assertEqual(
+            task.owner_permission_obj_check,
+            "viewflow.change_process_{}".format(self.process.pk),
+        )
+        self.assertIsNone(self.create_task().owner_permission_obj_check)
+
+    def test_user_queue(self):
+        public_task = self.create_task()
+        model_task = self.create_task(owner_permission="viewflow.change_process")
+        object_task = self.create_task(
+            owner_permission="viewflow.delete_process",
+            owner_permission_obj=self.process,
+        )
+
+        self.assertEqual(set(Task.objects.user_queue(self.user)), {public_task})
+
+        self.user.user_permissions.add(self.permission)
+        assign_perm("viewflow.delete_process", self.user, self.process)
+        self.assertEqual(
+            set(Task.objects.user_queue(User.objects.get(pk=self.user.pk))),
+            {public_task, model_task, object_task},
+        )
+
+
+class PermissionFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.task)
+    task = flow.View(lambda request, **kwargs: None).Next(this.end)
+    end = flow.End()
@@ -0,0 +1,248 @@
+from collections import Counter
+from functools import partial
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from viewflow import this
+from viewflow.workflow import flow, retry
+from viewflow.workflow.context import Context
+from viewflow.workflow.executors import DatabaseQueueExecutor, ThreadExecutor
+from viewflow.workflow.models import JobClaim, OutboxMessage
+from viewflow.workflow.status import STATUS
+from viewflow.workflow.worker import Worker
+
+
+class Test(TestCase):  # noqa: D101
+    def setUp(self):
+        CALLS.clear()
+
+    def test_function_retried(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestRetryWorkflow.start.run(failures=2)
+
+        task = process.task_set.get(flow_task=TestRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.DONE)
+        attempts = task.data["_attempts"]
+        self.assertEqual([attempt["attempt"] for attempt in attempts], [1, 2, 3])
+        self.assertEqual(attempts[0]["error"], "ValueError: Attempt 1 failed")
+        self.assertNotIn("error", attempts[2])
+        for attempt in attempts:
+            self.assertGreaterEqual(attempt["duration"], 0)
+
+        process.refresh_from_db()
+        self.assertEqual(process.status, STATUS.DONE)
+        self.assertEqual(CALLS[process.pk], 3)
+
+    def test_function_retries_exhausted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestRetryWorkflow.start.run(failures=5)
+
+        task = process.task_set.get(flow_task=TestRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.ERROR)
+        self.assertEqual(len(task.data["_attempts"]), 3)
+        self.assertEqual(task.data["_exception"]["title"], "Attempt 3 failed")
+        self.assertEqual(CALLS[process.pk], 3)
+
+    def test_function_first_attempt_scheduled(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            process = TestRetryWorkflow.start.run(failures=1)
+
+        task = process.task_set.get(flow_task=TestRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.SCHEDULED)
+        self.assertIsNotNone(task.external_task_id)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_function_exception_not_retried(self):
+        with self.assertRaises(KeyError):
+            TestRetryWorkflow.start.run(failures=1, exception=KeyError)
+        self.assertEqual(sum(CALLS.values()), 1)
+
+        with Context(propagate_exception=False):
+            process = TestRetryWorkflow.start.run(failures=1, exception=KeyError)
+
+        task = process.task_set.get(flow_task=TestRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.ERROR)
+        self.assertEqual(len(task.data["_attempts"]), 1)
+
+    def test_job_retried(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestRetryJobWorkflow.start.run(failures=1)
+
+        task = process.task_set.get(flow_task=TestRetryJobWorkflow.job)
+        self.assertEqual(task.status, STATUS.DONE)
+        self.assertEqual(len(task.data["_attempts"]), 2)
+        self.assertIn("duration", task.data["_job"])
+
+    @override_settings(VIEWFLOW={"OUTBOX": True})
+    def test_delayed_retry_in_outbox(self):
+        process = TestDelayedRetryWorkflow.start.run(failures=1)
+
+        task = process.task_set.get(flow_task=TestDelayedRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.SCHEDULED)
+        self.assertEqual(task.data["_attempts"][0]["delay"], 60)
+
+        message = OutboxMessage.objects.get(kind="job")
+        self.assertEqual(message.dedup_key, task.external_task_id)
+        self.assertGreater(
+            message.available, timezone.now() + timezone.timedelta(seconds=50)
+        )
+
+    @override_settings(VIEWFLOW={"OUTBOX": True})
+    def test_delayed_retry_in_database_queue_with_outbox(self):
+        process = TestQueueRetryWorkflow.start.run(failures=1)
+
+        task = process.task_set.get(flow_task=TestQueueRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.SCHEDULED)
+        self.assertEqual(JobClaim.objects.get(task=task).worker, "")
+        self.assertFalse(OutboxMessage.objects.filter(kind="job").exists())
+        self.assertEqual(Worker(concurrency=0).claim(10), [])
+
+    def test_delayed_retry_in_immediate_executor(self):
+        with self.assertRaisesMessage(
+            ImproperlyConfigured, "ImmediateExecutor can't run jobs with a delay"
+        ):
+            type(
+                "ImmediateDelayedRetryWorkflow",
+                (flow.Flow,),
+                {
+                    "__module__": __name__,
+                    "start": flow.StartHandle(start_process).Next(this.func),
+                    "func": flow.Function(failing).Retry(backoff=60).Next(this.end),
+                    "end": flow.End(),
+                },
+            )
+
+    def test_default_backoff_in_immediate_executor(self):
+        self.assertIsNone(TestDefaultRetryWorkflow.func._retry_policy.backoff)
+        self.assertIs(
+            TestQueueDefaultRetryWorkflow.func._retry_policy.backoff,
+            retry.exponential,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestDefaultRetryWorkflow.start.run(failures=1)
+
+        task = process.task_set.get(flow_task=TestDefaultRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.DONE)
+        self.assertEqual(task.data["_attempts"][0]["delay"], 0)
+
+    def test_delayed_retry_in_database_queue(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process = TestQueueRetryWorkflow.start.run(failures=1)
+
+        task = process.task_set.get(flow_task=TestQueueRetryWorkflow.func)
+        self.assertEqual(task.status, STATUS.SCHEDULED)
+        claim = JobClaim.objects.get(task=task)
+        self.assertEqual(claim.worker, "")
+
+        worker = Worker(concurrency=0, poll_interval=0)
+        self.assertEqual(worker.claim(10), [])
+
+        JobClaim.objects.filter(task=task).update(heartbeat=timezone.now())
+        self.assertEqual(worker.run(burst=True), 1)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, STATUS.DONE)
+        self.assertFalse(JobClaim.objects.exists())
+
+    def test_delayed_retry_claimed_in_transaction(self):
+        with self.captureOnCommitCallbacks():
+            process = TestQueueRetryWorkflow.start.run(failures=1)
+
+            task = process.task_set.get(flow_task=TestQueueRetryWorkflow.func)
+            self.assertEqual(task.status, STATUS.SCHEDULED)
+            self.assertEqual(JobClaim.objects.get(task=task).worker, "")
+
+    def test_retry_policy(self):
+        policy = retry.RetryPolicy(max_attempts=3, on=(ValueError,))
+        self.assertTrue(policy.should_retry(1, ValueError()))
+        self.assertFalse(policy.should_retry(3, ValueError()))
+        self.assertFalse(policy.should_retry(1, KeyError()))
+        self.assertEqual(
+            [policy.get_delay(attempt) for attempt in (1, 2, 3)], [1, 2, 4]
+        )
+        self.assertEqual(retry.RetryPolicy(backoff=10).get_delay(5), 10)
+        self.assertEqual(retry.RetryPolicy(backoff=None).get_delay(5), 0)
+
+    def test_backoff_functions(self):
+        self.assertEqual(retry.exponential(20), 3600)
+        self.assertEqual(partial(retry.exponential, base=0.5)(3), 2)
+        self.assertEqual([retry.linear(attempt) for attempt in (1, 2)], [5, 10])
+        self.assertEqual(retry.linear(10, step=1000), 3600)
+
+
+CALLS = Counter()  # the process changes of a failed attempt are rolled back
+
+
+def failing(activation):
+    CALLS[activation.process.pk] += 1
+    calls = CALLS[activation.process.pk]
+    if calls <= activation.process.data["failures"]:
+        exception = (
+            KeyError
+            if activation.process.data["exception"] == "KeyError"
+            else ValueError
+        )
+        raise exception("Attempt {} failed".format(calls))
+
+
+def start_process(activation, failures, exception=ValueError):
+    activation.process.data = {
+        "failures": failures,
+        "exception": exception.__name__,
+    }
+    return activation.process
+
+
+class TestRetryWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(start_process).Next(this.func)
+    func = (
+        flow.Function(failing)
+        .Retry(max_attempts=3, backoff=0, on=(ValueError,))
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class TestRetryJobWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(start_process).Next(this.job)
+    job = flow.Job(failing).Retry(backoff=None).Next(this.end)
+    end = flow.End()
+
+
+class TestDelayedRetryWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(start_process).Next(this.func)
+    func = (
+        flow.Function(failing)
+        .Retry(backoff=60)
+        .Executor(ThreadExecutor(max_workers=1))
+        .Next(this.end)
+    )
+    end = flow.End()
+
+
+class TestDefaultRetryWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(start_process).Next(this.func)
+    func = flow.Function(failing).Retry().Next(this.end)
+    end = flow.End()
+
+
+class TestQueueDefaultRetryWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(start_process).Next(this.func)
+    func = (
+        flow.Function(failing).Retry().Executor(DatabaseQueueExecutor()).Next(this.end)
+    )
+    end = flow.End()
+
+
+class TestQueueRetryWorkflow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle(start_process).Next(this.func)
+    func = (
+        flow.Function(failing)
+        .Retry(backoff=60)
+        .Executor(DatabaseQueueExecutor())
+        .Next(this.end)
+    )
+    end = flow.End()
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from viewflow import this
+from viewflow.workflow import flow
+from viewflow.workflow.executors import DatabaseQueueExecutor, JobExecutor
+from viewflow.workflow.fields import get_task_ref
+from viewflow.workflow.models import JobClaim, Task
+from viewflow.workflow.status import STATUS
+from viewflow.workflow.worker import Worker
+
+
+class Test(TestCase):  # noqa: D101
+    def start(self, count, flow_class=None):
+        flow_class = flow_class or QueueFlow
+        with self.captureOnCommitCallbacks(execute=True):
+            return [flow_class.start.run() for _ in range(count)]
+
+    def test_worker_executes_scheduled_jobs(self):
+        processes = self.start(3)
+        self.assertEqual(
+            Task.objects.filter(
+                flow_task=QueueFlow.job, status=STATUS.SCHEDULED
+            ).count(),
+            3,
+        )
+
+        self.assertEqual(Worker(concurrency=0).run(burst=True), 3)
+
+        for process in processes:
+            process.refresh_from_db()
+            self.assertEqual(process.status, STATUS.DONE)
+            self.assertEqual(process.data, {"executed": True})
+        self.assertFalse(JobClaim.objects.exists())
+
+    def test_claimed_jobs_skipped(self):
+        self.start(3)
+
+        first, second = Worker(name="first"), Worker(name="second")
+        first_jobs = first.claim(2)
+        second_jobs = second.claim(10)
+
+        self.assertEqual(len(first_jobs), 2)
+        self.assertEqual(len(second_jobs), 1)
+        self.assertFalse(
+            {job["task_pk"] for job in first_jobs}
+            & {job["task_pk"] for job in second_jobs}
+        )
+        self.assertEqual(second.claim(10), [])
+
+    def test_concurrent_claim_skipped(self):
+        self.start(2)
+        bulk_create = JobClaim.objects.bulk_create
+
+        def concurrent_bulk_create(claims, **kwargs):
+            claims = list(claims)
+            JobClaim.objects.create(task_id=claims[0].task_id, worker="second")
+            return bulk_create(claims, **kwargs)
+
+        worker = Worker(name="first")
+        with mock.patch.object(JobClaim.objects, "bulk_create", concurrent_bulk_create):
+            jobs = worker.claim(10)
+
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(JobClaim.objects.get(task=jobs[0]["task_pk"]).worker, "first")
+        self.assertEqual(JobClaim.objects.filter(worker="second").count(), 1)
+
+    def test_other_executor_jobs_skipped(self):
+        self.start(1, OtherExecutorFlow)
+        self.start(1)
+
+        jobs = Worker().claim(10)
+
+        self.assertEqual([job["task"] for job in jobs], [get_task_ref(QueueFlow.job)])
+        self.assertEqual(
+            Task.objects.get(flow_task=OtherExecutorFlow.job).status,
+            STATUS.SCHEDULED,
+        )
+
+    def test_stale_claims_recovered(self):
+        self.start(1)
+
+        first, second = Worker(name="first"), Worker(name="second")
+        self.assertEqual(len(first.claim(1)), 1)
+
+        second.heartbeat()
+        self.assertEqual(second.recover_stale(), 0)
+        self.assertEqual(second.claim(1), [])
+
+        JobClaim.objects.update(heartbeat=timezone.now() - timedelta(minutes=5))
+        self.assertEqual(second.recover_stale(), 1)
+        self.assertEqual(len(second.claim(1)), 1)
+        self.assertEqual(JobClaim.objects.get().worker, "second")
+
+    def test_failed_job(self):
+        (process,) = self.start(1, FailedQueueFlow)
+
+        worker = Worker(concurrency=0)
+        self.assertEqual(worker.run(burst=True), 1)
+
+        job_task = process.task_set.get(flow_task=FailedQueueFlow.job)
+        self.assertEqual(job_task.status, STATUS.ERROR)
+        self.assertEqual(job_task.data["_exception"]["title"], "Job failed")
+
+    def test_worker_command(self):
+        self.start(2)
+
+        stdout = StringIO()
+        call_command("viewflow_worker", "--concurrency", "0", "--burst", stdout=stdout)
+        self.assertIn("2 jobs executed, 0 failed", stdout.getvalue())
+
+
+@skipUnlessDBFeature("has_select_for_update_skip_locked")
+class TestThreads(TransactionTestCase):  # noqa: D101
+    def test_thread_worker(self):
+        processes = [QueueFlow.start.run() for _ in range(5)]
+
+        worker = Worker(concurrency=1, batch_size=2, poll_interval=0.01)
+        self.assertEqual(worker.run(burst=True), 5)
+
+        for process in processes:
+            process.refresh_from_db()
+            self.assertEqual(process.status, STATUS.DONE)
+        self.assertFalse(JobClaim.objects.exists())
+
+
+class QueueFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Executor(DatabaseQueueExecutor()).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        activation.process.data["executed"] = True
+        activation.process.save()
+
+
+class FailedQueueFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Executor(DatabaseQueueExecutor()).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        raise ValueError("Job failed")
+
+
+class SkippedExecutor(JobExecutor):  # noqa: D101
+    def submit(self, job, delay=None):
+        pass
+
+
+class OtherExecutorFlow(flow.Flow):  # noqa: D101
+    start = flow.StartHandle().Next(this.job)
+    job = flow.Job(this.execute).Executor(SkippedExecutor()).Next(this.end)
+    end = flow.End()
+
+    def execute(self, activation):
+        pass
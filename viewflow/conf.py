@@ -29,6 +29,11 @@ from viewflow.forms import renderers
 DEFAULTS = {
     "AUTOREGISTER": "viewflow" in django_settings.INSTALLED_APPS,
     "WIDGET_RENDERERS": renderers.WIDGET_RENDERERS,
+    "PERMISSION_CACHE": None,
+    "TASK_CANDIDATES": False,
+    "BRIEF_TEXT": False,
+    "JOB_EXECUTOR": "viewflow.workflow.executors.ImmediateExecutor",
+    "OUTBOX": False,
 }
 
 
@@ -38,6 +43,16 @@ class Settings(object):
             custom = getattr(django_settings, "VIEWFLOW", {})
         self.settings = deepcopy(DEFAULTS)
 
+        for key in [
+            "PERMISSION_CACHE",
+            "TASK_CANDIDATES",
+            "BRIEF_TEXT",
+            "JOB_EXECUTOR",
+            "OUTBOX",
+        ]:
+            if key in custom:
+                self.settings[key] = custom[key]
+
         for key, value in custom.get("WIDGET_RENDERERS", {}).items():
             widget_class, renderer_class = import_string(key), import_string(value)
             self.settings["WIDGET_RENDERERS"][widget_class] = renderer_class
@@ -10,7 +10,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Dict, Mapping, Iterable, List, Type, Optional
+from typing import Any, Callable, Dict, Mapping, Iterable, List, Tuple, Type, Optional
 from viewflow.this_object import ThisObject
 from viewflow.utils import DEFAULT, MARKER
 from .typing import (
@@ -27,6 +27,14 @@ class TransitionNotAllowed(Exception):
     """Exception raised when a state transition is not permitted."""
 
 
+def _deny(instance: object, user: UserModel) -> bool:
+    return False  # Protected by default
+
+
+def _allow(instance: object, user: UserModel) -> bool:
+    return True  # Explicitly allowed to any
+
+
 class Transition:
     """
     Represents a state transition with associated conditions and permissions.
@@ -50,6 +58,10 @@ class Transition:
         self.conditions = conditions if conditions else []
         self.custom = custom if custom is not None else {}
 
+        # compiled per owner class, conditions and permission are resolved
+        # against the class, subclasses could override referenced methods
+        self._compiled: Dict[type, Tuple[Tuple[Callable, ...], Callable]] = {}
+
     def __repr__(self) -> str:
         return f"<Transition({self.label} {self.source} -> {self.target}) object at {id(self)}>"
 
@@ -72,31 +84,58 @@ class Transition:
         """Return the slugified version of the transition function name."""
         return self.func.__name__
 
+    def compile(self, owner: type) -> Tuple[Tuple[Callable, ...], Callable]:
+        """Resolve the conditions and the permission check for the class."""
+        compiled = self._compiled.get(owner)
+        if compiled is None:
+            conditions = tuple(
+                (
+                    condition.resolve(owner)
+                    if isinstance(condition, ThisObject)
+                    else condition
+                )
+                for condition in self.conditions
+            )
+            compiled = self._compiled[owner] = (conditions, self._compile_perm(owner))
+        return compiled
+
+    def _compile_perm(self, owner: type) -> Callable:
+        permission = self.permission
+        if permission is DEFAULT:
+            return _deny
+        if permission is None:
+            return _allow
+        elif callable(permission):
+            return permission
+        elif isinstance(permission, ThisObject):
+            # a plain method is called unbound, skipping the per-call lookup
+            method = inspect.getattr_static(owner, permission.name, None)
+            if inspect.isfunction(method):
+                return method
+
+            def check_perm(instance: object, user: UserModel) -> bool:
+                return permission.resolve(instance)(user)  # type: ignore
+
+            return check_perm
+        else:
+            raise ValueError(f"Unknown permission type {type(permission)}")
+
     def conditions_met(self, instance: object) -> bool:
         """Checks if all conditions are met for this transition."""
-        conditions = [
-            (
-                condition.resolve(instance.__class__)
-                if isinstance(condition, ThisObject)
-                else condition
-            )
-            for condition in self.conditions
-        ]
-        return all(map(lambda condition: condition(instance), conditions))
+        compiled = self._compiled.get(instance.__class__)
+        if compiled is None:
+            compiled = self.compile(instance.__class__)
+        for condition in compiled[0]:
+            if not condition(instance):
+                return False
+        return True
 
     def has_perm(self, instance: object, user: UserModel) -> bool:
         """Checks if the given user has permission to perform this transition."""
-        if self.permission is DEFAULT:
-            return False  # Protected by default
-        if self.permission is None:
-            return True  # Explicitly allowed to any
-        elif callable(self.permission):
-            return self.permission(instance, user)
-        elif isinstance(self.permission, ThisObject):
-            permission = self.permission.resolve(instance)
-            return permission(user)  # type: ignore
-        else:
-            raise ValueError(f"Unknown permission type {type(self.permission)}")
+        compiled = self._compiled.get(instance.__class__)
+        if compiled is None:
+            compiled = self.compile(instance.__class__)
+        return compiled[1](instance, user)
 
 
 class TransitionMethod:
@@ -242,6 +281,7 @@ class TransitionDescriptor:
         self._state = state
         self._func = func
         self._transitions: Dict[StateValue, Transition] = {}
+        self._any_transition: Optional[Transition] = None
 
     def __get__(
         self, instance: object, owner: Optional[Type[object]] = None
@@ -254,6 +294,8 @@ class TransitionDescriptor:
 
     def add_transition(self, transition: Transition) -> None:
         self._transitions[transition.source] = transition
+        if transition.source == State.ANY:
+            self._any_transition = transition
 
     def get_transitions(self) -> Iterable[Transition]:
         """List of all transitions."""
@@ -264,10 +306,7 @@ class TransitionDescriptor:
 
         Returns None if there is no outgoing transitions.
         """
-        transition = self._transitions.get(source_state, None)
-        if transition is None:
-            transition = self._transitions.get(State.ANY, None)
-        return transition
+        return self._transitions.get(source_state, self._any_transition)
 
 
 class SuperTransitionDescriptor:
@@ -276,6 +315,7 @@ class SuperTransitionDescriptor:
     def __init__(self, state: State, func: TransitionFunction):  # noqa D102
         self._state = state
         self._func = func
+        self._descriptors: Dict[type, TransitionDescriptor] = {}
 
     def __get__(
         self, instance: object, owner: Optional[Type[object]] = None
@@ -295,6 +335,12 @@ class SuperTransitionDescriptor:
 
     def get_descriptor(self, owner: Type[object]) -> TransitionDescriptor:
         """Lookup for the transition descriptor in the base classes."""
+        descriptor = self._descriptors.get(owner)
+        if descriptor is None:
+            descriptor = self._descriptors[owner] = self._lookup_descriptor(owner)
+        return descriptor
+
+    def _lookup_descriptor(self, owner: Type[object]) -> TransitionDescriptor:
         for cls in owner.__mro__[1:]:
             if hasattr(cls, self._func.__name__):
                 super_method = getattr(cls, self._func.__name__)
@@ -336,13 +382,22 @@ class StateDescriptor:
         return transitions
 
     def get_outgoing_transitions(self, state: State) -> List[Transition]:
-        return [
-            transition
-            for transitions in self.get_transitions().values()
-            for transition in transitions
-            if transition.source == state
-            or (transition.source == State.ANY and transition.target != state)
-        ]
+        propname = "__fsm_{}_outgoing".format(self._state.propname)
+        outgoing = self._owner.__dict__.get(propname, None)
+        if outgoing is None:
+            outgoing = {}
+            setattr(self._owner, propname, outgoing)
+
+        transitions = outgoing.get(state, None)
+        if transitions is None:
+            transitions = outgoing[state] = tuple(
+                transition
+                for transitions in self.get_transitions().values()
+                for transition in transitions
+                if transition.source == state
+                or (transition.source == State.ANY and transition.target != state)
+            )
+        return list(transitions)
 
     def get_available_transitions(self, flow, state: State, user):
         return [
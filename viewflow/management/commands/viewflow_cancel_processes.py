@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from viewflow.workflow.fields import import_flow_by_ref
+
+
+class Command(BaseCommand):
+    help = "Cancel unfinished processes of a flow"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "flow_label",
+            nargs=1,
+            type=str,
+            help="Flow label, i.e. app_label/flows.MyFlow",
+        )
+
+        parser.add_argument(
+            "--pk",
+            action="append",
+            dest="pks",
+            type=int,
+            help="Cancel the process with the primary key, could be repeated",
+        )
+
+        parser.add_argument(
+            "--created-before",
+            action="store",
+            dest="created_before",
+            help="Cancel processes created before the ISO 8601 datetime",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            action="store",
+            dest="chunk_size",
+            default=500,
+            type=int,
+            help="Number of processes canceled at once",
+        )
+
+    def handle(self, **options):
+        flow_class = import_flow_by_ref(options["flow_label"][0])
+        if flow_class is None:
+            raise CommandError("Unknown flow {}".format(options["flow_label"][0]))
+
+        queryset = flow_class.process_class._default_manager.all()
+        if options["pks"]:
+            queryset = queryset.filter(pk__in=options["pks"])
+        if options["created_before"]:
+            created_before = parse_datetime(options["created_before"])
+            if created_before is None:
+                raise CommandError(
+                    "Invalid datetime {}".format(options["created_before"])
+                )
+            if timezone.is_naive(created_before):
+                created_before = timezone.make_aware(created_before)
+            queryset = queryset.filter(created__lt=created_before)
+
+        def progress(result, total):
+            self.stdout.write(
+                "{} of {} processes processed".format(
+                    len(result.succeeded) + len(result.failed), total
+                )
+            )
+
+        result = flow_class.instance.cancel_many(
+            queryset, chunk_size=options["chunk_size"], progress=progress
+        )
+
+        for pk, reason in result.failed.items():
+            self.stderr.write("Process {} skipped: {}".format(pk, reason))
+        self.stdout.write(
+            "{} processes canceled, {} skipped".format(
+                len(result.succeeded), len(result.failed)
+            )
+        )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from viewflow.workflow import candidates
+from viewflow.workflow.models import Task
+
+
+class Command(BaseCommand):
+    help = "Recalculate users and groups permitted to assign unfinished tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--permission",
+            action="append",
+            dest="permissions",
+            help="Rebuild tasks with the owner permission only, i.e. app_label.codename",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            action="store",
+            dest="chunk_size",
+            default=1000,
+            type=int,
+            help="Number of tasks updated at once",
+        )
+
+    def handle(self, **options):
+        if not candidates.is_enabled():
+            raise CommandError(
+                'Task candidates are disabled, set VIEWFLOW["TASK_CANDIDATES"] = True'
+            )
+
+        task_queryset = None
+        if options["permissions"]:
+            task_queryset = Task._default_manager.filter(
+                owner_permission__in=options["permissions"]
+            )
+
+        count = candidates.rebuild_candidates(
+            task_queryset, chunk_size=options["chunk_size"]
+        )
+
+        self.stdout.write("Candidates of {} tasks rebuilt".format(count))
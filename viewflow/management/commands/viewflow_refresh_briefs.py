@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from viewflow.workflow import briefs
+from viewflow.workflow.models import Process, Task
+
+
+class Command(BaseCommand):
+    help = "Render and store briefs of existing processes and tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            dest="missing",
+            help="Refresh rows without a stored brief only",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            action="store",
+            dest="chunk_size",
+            default=1000,
+            type=int,
+            help="Number of rows updated at once",
+        )
+
+    def handle(self, **options):
+        if not briefs.is_enabled():
+            raise CommandError(
+                'Stored briefs are disabled, set VIEWFLOW["BRIEF_TEXT"] = True'
+            )
+
+        for model, name in [(Process, "processes"), (Task, "tasks")]:
+            queryset = model._default_manager.all()
+            if options["missing"]:
+                queryset = queryset.filter(brief_text__isnull=True)
+
+            count = briefs.refresh_all_brief_text(
+                queryset, chunk_size=options["chunk_size"]
+            )
+
+            self.stdout.write("Briefs of {} {} refreshed".format(count, name))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from viewflow.workflow import outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver pending jobs and flow events from the outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            action="store",
+            dest="batch_size",
+            default=100,
+            type=int,
+            help="Number of messages delivered in one transaction",
+        )
+
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            dest="loop",
+            help="Keep polling for the new messages",
+        )
+
+        parser.add_argument(
+            "--interval",
+            action="store",
+            dest="interval",
+            default=1.0,
+            type=float,
+            help="Seconds between polls of the empty outbox",
+        )
+
+    def handle(self, **options):
+        if not outbox.is_enabled():
+            raise CommandError('Outbox is disabled, set VIEWFLOW["OUTBOX"] = True')
+
+        count = outbox.deliver_pending(
+            batch_size=options["batch_size"],
+            loop=options["loop"],
+            interval=options["interval"],
+        )
+        self.stdout.write("{} messages delivered".format(count))
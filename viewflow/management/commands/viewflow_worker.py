@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand
+
+from viewflow.workflow.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Execute scheduled jobs from the database queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            action="store",
+            dest="concurrency",
+            default=1,
+            type=int,
+            help="Number of jobs executed at once, 0 to run in the main thread",
+        )
+
+        parser.add_argument(
+            "--processes",
+            action="store_true",
+            dest="processes",
+            help="Execute jobs in worker processes instead of threads",
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            action="store",
+            dest="batch_size",
+            default=10,
+            type=int,
+            help="Max number of jobs claimed by the worker",
+        )
+
+        parser.add_argument(
+            "--poll-interval",
+            action="store",
+            dest="poll_interval",
+            default=1.0,
+            type=float,
+            help="Seconds between polls of the empty queue",
+        )
+
+        parser.add_argument(
+            "--heartbeat-interval",
+            action="store",
+            dest="heartbeat_interval",
+            default=10.0,
+            type=float,
+            help="Seconds between the heartbeats of claimed jobs",
+        )
+
+        parser.add_argument(
+            "--stale-timeout",
+            action="store",
+            dest="stale_timeout",
+            default=60.0,
+            type=float,
+            help="Seconds without a heartbeat to release a claimed job",
+        )
+
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            dest="burst",
+            help="Exit when no scheduled jobs left",
+        )
+
+    def handle(self, **options):
+        worker = Worker(
+            concurrency=options["concurrency"],
+            processes=options["processes"],
+            batch_size=options["batch_size"],
+            poll_interval=options["poll_interval"],
+            heartbeat_interval=options["heartbeat_interval"],
+            stale_timeout=options["stale_timeout"],
+        )
+        try:
+            worker.run(burst=options["burst"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(
+            "{} jobs executed, {} failed".format(worker.processed, worker.failed)
+        )
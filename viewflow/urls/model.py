@@ -58,6 +58,8 @@ class BaseModelViewset(Viewset):
     list_view_class = ListModelView
     list_columns = DEFAULT
     list_paginate_by = DEFAULT
+    list_keyset_pagination = DEFAULT
+    list_estimated_count = DEFAULT
     list_object_link_columns = DEFAULT
     list_page_actions = DEFAULT
     list_filterset_class = DEFAULT
@@ -80,6 +82,8 @@ class BaseModelViewset(Viewset):
         view_kwargs = {
             "columns": self.list_columns,
             "paginate_by": self.list_paginate_by,
+            "keyset_pagination": self.list_keyset_pagination,
+            "estimated_count": self.list_estimated_count,
             "object_link_columns": self.list_object_link_columns,
             "filterset_class": self.list_filterset_class,
             "filterset_initial": self.list_filterset_initial,
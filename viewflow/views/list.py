@@ -10,18 +10,31 @@ import decimal
 from functools import lru_cache
 
 from django.contrib.auth.decorators import login_required
-from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    FieldError,
+    ImproperlyConfigured,
+    PermissionDenied,
+)
 from django.db import models
 from django.forms.utils import pretty_name
+from django.http import Http404
 from django.utils import formats, timezone
 from django.utils.decorators import method_decorator
 from django.utils.encoding import force_str
 from django.utils.functional import cached_property
 from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
 from django.views import generic
 
 from viewflow.utils import Icon, has_object_perm, viewprop
 from .filters import FilterableViewMixin
+from .pagination import (
+    EstimatedCountPaginator,
+    InvalidCursor,
+    KeysetPaginator,
+    get_keyset,
+)
 from .search import SearchableViewMixin
 
 
@@ -201,6 +214,38 @@ class ObjectAttrColumn(DataSourceColumn):
         return attr
 
 
+class AnnotationColumn(BaseColumn):
+    """
+    Retrieve a value annotated to the list queryset.
+
+    Annotation output field defines the column type.
+    """
+
+    def __init__(self, attr_name, expression):
+        super().__init__(attr_name)
+        self.expression = expression
+
+    def get_value(self, obj):
+        return getattr(obj, self.attr_name)
+
+    def header(self):
+        return pretty_name(self.attr_name)
+
+    def column_type(self):
+        try:
+            output_field = self.expression.output_field
+        except (AttributeError, FieldError):
+            return "text"
+        if isinstance(output_field, ModelFieldColumn.NUMBER_FIELD_TYPES):
+            return "numeric"
+        elif isinstance(output_field, ModelFieldColumn.BOOLEAN_FIELD_TYPES):
+            return "boolean"
+        return "text"
+
+    def orderby(self):
+        return self.attr_name
+
+
 class OrderableListViewMixin(object):
     ordering = None
     ordering_kwarg = "_orderby"
@@ -311,11 +356,19 @@ class BaseListModelView(generic.ListView):
     columns = None
     object_link_columns = None
     paginate_by = 25
+    keyset_pagination = False
+    keyset_paginated = False
+    cursor_kwarg = "cursor"
+    estimated_count = False
+    count_cap = 10000
 
     page_actions = None
 
     empty_value_display = ""
 
+    list_annotations = None  # {column name: queryset expression}
+    list_select_related = None
+
     def has_view_permission(self, user, obj=None):
         if self.viewset is not None:
             return self.viewset.has_view_permission(user, obj=obj)
@@ -350,6 +403,11 @@ class BaseListModelView(generic.ListView):
             if hasattr(data_source, attr_name):
                 return DataSourceColumn(data_source, attr_name)
 
+        # a queryset annotation
+        annotations = self.get_list_annotations()
+        if attr_name in annotations:
+            return AnnotationColumn(attr_name, annotations[attr_name])
+
         # an object field
         try:
             model_field = opts.get_field(attr_name)
@@ -403,6 +461,37 @@ class BaseListModelView(generic.ListView):
                 for column_def in self.list_columns.values()
             ]
 
+    @property
+    def pagination_kwarg(self):
+        """URL parameter of the current page."""
+        return self.cursor_kwarg if self.keyset_paginated else self.page_kwarg
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        if self.estimated_count:
+            return EstimatedCountPaginator(
+                queryset, per_page, count_cap=self.count_cap, **kwargs
+            )
+        return super().get_paginator(queryset, per_page, **kwargs)
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate the queryset by the cursor, if the keyset pagination is
+        enabled and the ordering allows it.
+        """
+        keyset = get_keyset(queryset) if self.keyset_pagination else None
+        if keyset is None:
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(
+            queryset, page_size, keyset, count_cap=self.count_cap
+        )
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404(_("Invalid cursor"))
+        self.keyset_paginated = True
+        return paginator, page, page.object_list, page.has_other_pages()
+
     def get_page_actions(self, *actions):
         if self.viewset is not None and hasattr(self.viewset, "get_list_page_actions"):
             actions = self.viewset.get_list_page_actions(self.request) + actions
@@ -410,6 +499,46 @@ class BaseListModelView(generic.ListView):
             actions = self.page_actions + actions
         return actions
 
+    def get_list_annotations(self):
+        """
+        Annotations computing the list columns in the page query.
+
+        An annotated column doesn't need a per-row query, and could be
+        ordered.
+        """
+        return self.list_annotations or {}
+
+    def get_list_select_related(self):
+        """Relations of the list columns, fetched in the page query."""
+        return self.list_select_related or ()
+
+    def get_queryset(self):
+        """List queryset, annotated before the ordering by the annotations."""
+        if self.queryset is not None:
+            queryset = self.queryset.all()
+        elif self.model is not None:
+            queryset = self.model._default_manager.all()
+        else:
+            raise ImproperlyConfigured(
+                "%(cls)s is missing a QuerySet. Define "
+                "%(cls)s.model, %(cls)s.queryset, or override "
+                "%(cls)s.get_queryset()." % {"cls": self.__class__.__name__}
+            )
+
+        annotations = self.get_list_annotations()
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        select_related = self.get_list_select_related()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        ordering = self.get_ordering()
+        if ordering:
+            if isinstance(ordering, str):
+                ordering = (ordering,)
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
     @viewprop
     def queryset(self):
         if self.viewset is not None and hasattr(self.viewset, "get_queryset"):
@@ -0,0 +1,319 @@
+"""
+Keyset pagination and estimated counts for large list views.
+
+OFFSET paging reads and throws away all rows before the page, and the
+page summary runs a full `COUNT(*)`. On tables with millions of rows both
+dominate the list latency.
+
+Keyset pagination continues from the ordering values of the last (or
+first) row of the current page, encoded in an URL cursor, so any page
+costs the same index range scan. The queryset ordering, with the primary
+key as the tie breaker, should consist of non-null local fields or
+annotations. Otherwise the view falls back to the OFFSET pagination.
+
+Instead of an exact count, the PostgreSQL planner estimate of the table
+size is used for unfiltered lists, and rows are counted up to a cap for
+the rest.
+"""
+
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+
+from django.core.exceptions import FieldError, ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import OrderBy
+from django.utils import formats
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(Exception):
+    """The cursor can't be decoded for the list ordering."""
+
+
+def estimate_count(queryset, cap):
+    """
+    Row count of the queryset, without a full table scan.
+
+    Returns the count and its label for the end user: exact, `~N` for the
+    planner estimate of an unfiltered PostgreSQL table, or `N+` if there
+    are more than `cap` rows.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    if (
+        connection.vendor == "postgresql"
+        and not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.low_mark == 0
+        and query.high_mark is None
+    ):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        if row is not None and row[0] > cap:
+            return row[0], "~{}".format(formats.number_format(row[0]))
+
+    count = queryset.order_by()[: cap + 1].count()
+    if count > cap:
+        return cap, "{}+".format(formats.number_format(cap))
+    return count, formats.number_format(count)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    OFFSET paginator with an estimated count.
+
+    The next page presence is checked by fetching an extra row, so the
+    pages beyond the estimate stay reachable.
+    """
+
+    def __init__(self, object_list, per_page, count_cap=10000, **kwargs):  # noqa D102
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cap = count_cap
+
+    @cached_property
+    def _estimate(self):
+        return estimate_count(self.object_list, self.count_cap)
+
+    @property
+    def count(self):
+        return self._estimate[0]
+
+    @property
+    def count_label(self):
+        return self._estimate[1]
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedCountPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page
+        )
+
+
+class EstimatedCountPage(Page):
+    """OFFSET page, with the next page presence known from the fetched rows."""
+
+    def __init__(self, object_list, number, paginator, has_next):  # noqa D102
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        return (self.number - 1) * self.paginator.per_page + len(self.object_list)
+
+
+def get_keyset(queryset):
+    """
+    Ordering of the queryset, as a list of (name, descending, output field).
+
+    The primary key is appended as the tie breaker. Returns None if the
+    ordering can't be used for the keyset pagination.
+    """
+    query = queryset.query
+    ordering = list(query.order_by)
+    if not ordering and query.default_ordering:
+        ordering = list(query.get_meta().ordering)
+
+    keyset, names = [], set()
+    for item in ordering:
+        if isinstance(item, OrderBy) and isinstance(item.expression, F):
+            name, descending = item.expression.name, item.descending
+        elif isinstance(item, str) and item != "?":
+            name, descending = item.lstrip("-"), item.startswith("-")
+        else:
+            return None
+
+        if name == "pk":
+            name = query.get_meta().pk.name
+        if LOOKUP_SEP in name:
+            return None
+        if name in names:
+            continue
+
+        try:
+            expression = query.chain().resolve_ref(name)
+            output_field = expression.output_field
+        except FieldError:
+            return None
+        if getattr(output_field, "null", False) or getattr(
+            output_field, "is_relation", False
+        ):
+            return None
+
+        keyset.append((name, descending, output_field))
+        names.add(name)
+
+    pk = query.get_meta().pk
+    if pk.name not in names:
+        descending = keyset[-1][1] if keyset else False
+        keyset.append((pk.name, descending, pk))
+
+    return keyset
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError("Can't encode {!r} to a cursor".format(value))
+
+
+def encode_cursor(keyset, obj, previous=False):
+    """Cursor of the rows before or after the object."""
+    values = [getattr(obj, name) for name, _, _ in keyset]
+    data = json.dumps(["p" if previous else "n", values], default=_encode_value)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(keyset, cursor):
+    """Direction and the ordering values of the cursor."""
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        direction, values = json.loads(data)
+        if direction not in ("n", "p") or len(values) != len(keyset):
+            raise InvalidCursor(cursor)
+        values = [
+            output_field.to_python(value)
+            for (_, _, output_field), value in zip(keyset, values)
+        ]
+    except (binascii.Error, TypeError, ValueError, ValidationError):
+        raise InvalidCursor(cursor)
+    return direction == "p", values
+
+
+def keyset_filter(keyset, values, previous=False):
+    """Rows after the values in the keyset order, or before if `previous`."""
+    condition, equal = Q(), Q()
+    for (name, descending, _), value in zip(keyset, values):
+        lookup = "lt" if descending != previous else "gt"
+        condition |= equal & Q(**{"{}__{}".format(name, lookup): value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def keyset_ordering(keyset, previous=False):
+    return [
+        "-" + name if descending != previous else name for name, descending, _ in keyset
+    ]
+
+
+class KeysetPaginator(object):
+    """
+    Paginate a queryset by the ordering values of the page boundary rows.
+
+    Keyset pages have no numbers, and the count is estimated.
+    """
+
+    def __init__(self, queryset, per_page, keyset, count_cap=10000):  # noqa D102
+        self.object_list = queryset
+        self.per_page = int(per_page)
+        self.keyset = keyset
+        self.count_cap = count_cap
+
+    @cached_property
+    def _estimate(self):
+        return estimate_count(self.object_list, self.count_cap)
+
+    @property
+    def count(self):
+        return self._estimate[0]
+
+    @property
+    def count_label(self):
+        return self._estimate[1]
+
+    def page(self, cursor=None):
+        """Page after or before the cursor row, or the first page."""
+        previous, queryset = False, self.object_list
+        if cursor:
+            previous, values = decode_cursor(self.keyset, cursor)
+            queryset = queryset.filter(keyset_filter(self.keyset, values, previous))
+
+        queryset = queryset.order_by(*keyset_ordering(self.keyset, previous))
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if previous:
+            if not has_more:
+                return self.page()
+            rows.reverse()
+            return KeysetPage(rows, self, has_next=True, has_previous=True)
+        return KeysetPage(rows, self, has_next=has_more, has_previous=bool(cursor))
+
+
+class KeysetPage(object):
+    """A page of the keyset paginator."""
+
+    def __init__(self, object_list, paginator, has_next, has_previous):  # noqa D102
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return "<Keyset page of {} rows>".format(len(self.object_list))
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if self.has_next():
+            return encode_cursor(self.paginator.keyset, self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous():
+            return encode_cursor(
+                self.paginator.keyset, self.object_list[0], previous=True
+            )
@@ -1,14 +1,16 @@
 import json
 import traceback
+from collections import defaultdict
 from contextlib import ContextDecorator
-from typing import Any, List, Optional, Set
+from typing import Any, List, Optional, Set, Tuple
 
 from django.db import connection, transaction
 from django.utils.timezone import now
 
 from viewflow import fsm
+from . import candidates
 from .context import context
-from .signals import task_finished, task_failed
+from .signals import task_changed, task_finished, task_failed
 from .status import STATUS, PROCESS
 
 
@@ -76,6 +78,148 @@ def has_manage_permission(activation: "Activation", user: Any) -> bool:
     return activation.flow_class.instance.has_manage_permission(user)
 
 
+def get_exception_data(exception: BaseException) -> dict:
+    """Exception title, traceback and the failed frame locals, for the task data."""
+    tb = exception.__traceback__
+    while tb.tb_next:
+        tb = tb.tb_next
+
+    try:
+        serialized_locals = json.dumps(
+            tb.tb_frame.f_locals, default=lambda obj: str(obj)
+        )
+    except Exception as ex:
+        serialized_locals = json.dumps({"_serialization_exception": str(ex)})
+
+    return {
+        "title": str(exception),
+        "traceback": "".join(
+            traceback.format_exception(
+                type(exception), exception, exception.__traceback__
+            )
+        ),
+        "locals": json.loads(serialized_locals),
+    }
+
+
+def can_bulk_insert(model: Any) -> bool:
+    """
+    Check if the model rows could be inserted in bulk with primary keys returned.
+
+    Models with multi-table inheritance are saved one by one.
+    """
+    if not connection.features.can_return_rows_from_bulk_insert:
+        return False
+    concrete_model = model._meta.concrete_model
+    return all(
+        parent._meta.concrete_model is concrete_model
+        for parent in model._meta.get_parent_list()
+    )
+
+
+def _can_bulk_create(activation_class: Any, task_class: Any) -> bool:
+    """
+    Check if tasks of the activation class could be inserted in bulk.
+
+    Activations with a custom `create` method, like the Join, and task models
+    with multi-table inheritance are created one by one.
+    """
+    if getattr(activation_class.create, "__func__", None) is not (
+        Activation.create.__func__  # type: ignore
+    ):
+        return False
+    return can_bulk_insert(task_class)
+
+
+def create_tasks(
+    prev_activation: "Activation", next_tasks: List[Tuple[Any, Any, Any, Any]]
+) -> List["Activation"]:
+    """
+    Create a wave of the next tasks following a single activation.
+
+    Tasks of nodes that use the default `Activation.create` are inserted with
+    one `bulk_create` for the task rows and one for the `previous` links, so
+    a wide split costs a constant number of queries. Other tasks are created
+    one by one, after the bulk inserted ones.
+
+    Note, that the `pre_save` and `post_save` signals are not sent for bulk
+    inserted tasks.
+
+    Args:
+        prev_activation (Activation): The activation the new tasks follow.
+        next_tasks (List[Tuple]): The (flow_task, token, data, seed) tuples.
+
+    Returns:
+        List[Activation]: Activations in the `next_tasks` order.
+    """
+    return create_task_waves([(prev_activation, next_tasks)])[0]
+
+
+def create_task_waves(
+    waves: List[Tuple["Activation", List[Tuple[Any, Any, Any, Any]]]],
+) -> List[List["Activation"]]:
+    """
+    Create waves of the next tasks following several activations at once.
+
+    Same as `create_tasks`, but the tasks following all the activations are
+    inserted together.
+
+    Args:
+        waves (List[Tuple]): The (prev_activation, next_tasks) pairs.
+
+    Returns:
+        List[List[Activation]]: Activations of each wave, in the waves order.
+    """
+    activations: List[List[Optional[Activation]]] = [
+        [None] * len(next_tasks) for _, next_tasks in waves
+    ]
+
+    prepared = defaultdict(list)  # task_class -> [(wave, n, task, prev_task), ...]
+    for wave, (prev_activation, next_tasks) in enumerate(waves):
+        for n, (flow_task, token, data, seed) in enumerate(next_tasks):
+            activation_class = flow_task.activation_class
+            task_class = flow_task.flow_class.task_class
+            if _can_bulk_create(activation_class, task_class):
+                task = activation_class.prepare(
+                    flow_task, prev_activation, token, data=data, seed=seed
+                )
+                prepared[task_class].append((wave, n, task, prev_activation.task))
+
+    for task_class, items in prepared.items():
+        tasks = [task for _, _, task, _ in items]
+        task_class._default_manager.bulk_create(tasks)
+
+        previous = task_class._meta.get_field("previous")
+        through = previous.remote_field.through
+        from_field = through._meta.get_field(previous.m2m_field_name()).attname
+        to_field = through._meta.get_field(previous.m2m_reverse_field_name()).attname
+        through._default_manager.bulk_create(
+            [
+                through(**{from_field: task.pk, to_field: prev_task.pk})
+                for _, _, task, prev_task in items
+            ]
+        )
+
+        by_class = defaultdict(list)
+        for item in items:
+            by_class[item[2].flow_task.activation_class].append(item)
+        for activation_class, class_items in by_class.items():
+            created = activation_class.created_many(
+                [task for _, _, task, _ in class_items]
+            )
+            for (wave, n, _, _), activation in zip(class_items, created):
+                activations[wave][n] = activation
+
+    for wave, (prev_activation, next_tasks) in enumerate(waves):
+        for n, (flow_task, token, data, seed) in enumerate(next_tasks):
+            if activations[wave][n] is None:
+                activations[wave][n] = flow_task._create(
+                    prev_activation=prev_activation, token=token, data=data, seed=seed
+                )
+
+    return activations  # type: ignore
+
+
 class Activation:
     """
     Base class for flow task activations.
@@ -86,6 +230,9 @@ class Activation:
 
     status: fsm.State = fsm.State(STATUS, default=STATUS.NEW)
     type: str = "node"
+    # the `cancel` of the class only marks the task finished, and could be
+    # applied with a single UPDATE, see `cancel_many`
+    bulk_cancel: bool = False
 
     def __init__(self, task: Any) -> None:
         """
@@ -95,7 +242,7 @@ class Activation:
             task (Any): The task instance associated with the activation.
         """
         self.task = task
-        self.process = task.process.coerced
+        self._process = None
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Activation):
@@ -105,6 +252,31 @@ class Activation:
     def __hash__(self) -> int:
         return hash(self.task)
 
+    @property
+    def process(self) -> Any:
+        """Task process of the flow class type, coerced on first access."""
+        if self._process is None:
+            self._process = self.task.process.coerced
+        return self._process
+
+    @process.setter
+    def process(self, value: Any) -> None:
+        self._process = value
+
+    @status.on_success()
+    def _status_changed(
+        self, descriptor: Any, source: Any, target: Any, **kwargs: Any
+    ) -> None:
+        """Send `task_changed` when the transition has no signal of its own."""
+        if target is not None and target not in [
+            STATUS.STARTED,
+            STATUS.DONE,
+            STATUS.ERROR,
+        ]:
+            task_changed.send(
+                sender=self.flow_class, process=self.process, task=self.task
+            )
+
     @status.setter()
     def _set_status(self, value: Any) -> None:
         """Set the status to the underline task."""
@@ -140,24 +312,7 @@ class Activation:
                 if exc_type is not None:
                     if not context.propagate_exception:
                         # Keep error state
-                        tb = exc_val.__traceback__
-                        while tb.tb_next:
-                            tb = tb.tb_next
-
-                        try:
-                            serialized_locals = json.dumps(
-                                tb.tb_frame.f_locals, default=lambda obj: str(obj)
-                            )
-                        except Exception as ex:
-                            serialized_locals = json.dumps(
-                                {"_serialization_exception": str(ex)}
-                            )
-
-                        self.task.data["_exception"] = {
-                            "title": str(exc_val),
-                            "traceback": traceback.format_exc(),
-                            "locals": json.loads(serialized_locals),
-                        }
+                        self.task.data["_exception"] = get_exception_data(exc_val)
 
                         # Set status
                         self.task.finished = now()
@@ -195,18 +350,103 @@ class Activation:
         Returns:
             Activation: The newly created activation instance.
         """
+        task = cls.prepare(flow_task, prev_activation, token, data=data, seed=seed)
+        task.save()
+        task.previous.add(prev_activation.task)
+        return cls.created(task)
+
+    @classmethod
+    def prepare(
+        cls,
+        flow_task: Any,
+        prev_activation: "Activation",
+        token: Any,
+        data: Optional[Any] = None,
+        seed: Optional[Any] = None,
+    ) -> Any:
+        """
+        Instantiate a new flow task without saving it to the database.
+
+        Args:
+            flow_task (Any): The flow task instance.
+            prev_activation (Activation): The previous activation instance.
+            token (Any): The token for the new task.
+            data (Optional[Any]): Additional data for the new task.
+
+        Returns:
+            Any: The unsaved task instance.
+        """
         flow_class = flow_task.flow_class
         task = flow_class.task_class(
             process=prev_activation.process,
+            flow_class=flow_class,
             flow_task=flow_task,
+            flow_task_type=flow_task.task_type,
             token=token,
         )
         task.data = data if data is not None else {}
         task.seed = seed
-        task.save()
-        task.previous.add(prev_activation.task)
+        return task
+
+    @classmethod
+    def created(cls, task: Any) -> "Activation":
+        """
+        Instantiate an activation for a just persisted task.
+
+        Args:
+            task (Any): The saved task instance.
+
+        Returns:
+            Activation: The activation instance.
+        """
         return cls(task)
 
+    @classmethod
+    def created_many(cls, tasks: List[Any]) -> List["Activation"]:
+        """
+        Instantiate activations for the tasks inserted in bulk.
+
+        Args:
+            tasks (List[Any]): The saved task instances.
+
+        Returns:
+            List[Activation]: The activations in the tasks order.
+        """
+        return [cls.created(task) for task in tasks]
+
+    @classmethod
+    def cancel_many(cls, activations: List["Activation"]) -> None:
+        """
+        Cancel the activations of the class at once.
+
+        The tasks are updated with a single query, if the class defining
+        the `cancel` transition sets `bulk_cancel = True`. A subclass that
+        overrides `cancel` is canceled one by one, unless it sets the flag
+        too. Candidates of the tasks are deleted.
+
+        Args:
+            activations (List[Activation]): The activations of the class.
+        """
+        if not activations:
+            return
+
+        owner = next(klass for klass in cls.__mro__ if "cancel" in vars(klass))
+        if not vars(owner).get("bulk_cancel", False):
+            for activation in activations:
+                activation.cancel()
+            return
+
+        finished = now()
+        tasks = [activation.task for activation in activations]
+        type(tasks[0])._default_manager.filter(
+            pk__in=[task.pk for task in tasks]
+        ).update(status=STATUS.CANCELED, finished=finished)
+        if candidates.is_enabled(type(tasks[0])):
+            candidates.remove_candidates(tasks)
+        for task in tasks:
+            task.status = STATUS.CANCELED
+            task.finished = finished
+
     @status.transition(source=STATUS.NEW)
     def activate(self) -> None:
         """Activate the task."""
@@ -303,7 +543,14 @@ class Activation:
         task.seed = self.task.seed
         task.data = self.task.data
         task.artifact = self.task.artifact
+        task.owner_permission = self.task.owner_permission
+        task.owner_permission_content_type_id = (
+            self.task.owner_permission_content_type_id
+        )
+        task.owner_permission_obj_pk = self.task.owner_permission_obj_pk
         task.save()
+        if candidates.is_enabled(type(task)):
+            candidates.add_candidates([task])
 
         for prev_task in self.task.previous.all():
             task.previous.add(prev_task)
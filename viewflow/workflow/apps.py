@@ -9,3 +9,11 @@ class WorkflowConfig(AppConfig):
     name = "viewflow.workflow"
     label = "viewflow"  # keep backward compatible with 1.x
     verbose_name = _("Workflow")
+
+    def ready(self):  # noqa D102
+        from . import briefs, candidates, outbox, permissions
+
+        permissions.connect_signals()
+        candidates.connect_signals()
+        briefs.connect_signals()
+        outbox.connect_signals()
@@ -1,20 +1,25 @@
 import copy
 from collections import defaultdict
+from contextlib import ExitStack, contextmanager
 from textwrap import dedent
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from django.apps import apps
 from django.db import transaction
+from django.template import Template
 from django.urls import include, path
 from django.urls.exceptions import NoReverseMatch
+from django.utils.encoding import force_str
 from django.utils.timezone import now
 
 from viewflow.utils import LazySingletonDescriptor, camel_case_to_title, strip_suffixes
 from viewflow.urls import Viewset, ViewsetMeta
 from .activation import Activation
 from .exceptions import FlowRuntimeError
+from .signals import processes_canceled
 from .status import STATUS, PROCESS
-from . import lock
+from .utils import run_in_thread
+from . import bulk, lock
 
 
 class Edge:
@@ -68,6 +73,15 @@ class Edge:
         return "[{}] {} ---> {}".format(self._edge_class, self._src, self._dst)
 
 
+def _get_cached_template(cache: Dict[str, Template], template_content: Any) -> Template:
+    # lazy translated strings are resolved, so each language gets own template
+    template_content = force_str(template_content)
+    template = cache.get(template_content)
+    if template is None:
+        template = cache[template_content] = Template(template_content)
+    return template
+
+
 class Node(Viewset):
     """
     Base class for a flow task definition.
@@ -91,6 +105,7 @@ class Node(Viewset):
         **kwargs: Any,
     ):  # noqa D102
         self._incoming_edges = []
+        self._brief_templates = {}
 
         if activation_class:
             self.activation_class = activation_class
@@ -203,6 +218,32 @@ class Node(Viewset):
             self.task_result_template = result_template
         return self
 
+    def get_brief_template(self, finished: bool = False) -> Template:
+        """
+        Return the compiled template of the task brief.
+
+        Templates are compiled once per node, the flow class redefinition
+        creates the new nodes with an empty cache.
+        """
+        template_content = ""
+
+        if finished:
+            template_content = self.task_result_template
+
+        if not template_content:
+            template_content = self.task_summary_template
+
+        if not template_content:
+            template_content = self.task_description
+
+        if not template_content:
+            template_content = self.task_title
+
+        if not template_content:
+            template_content = "{{ flow_task }}/{{ task.status }}"
+
+        return _get_cached_template(self._brief_templates, template_content)
+
     def _get_transition_url(self, activation: Activation, transition: Any) -> str:
         url_name = transition.slug
         if url_name == "start":
@@ -259,6 +300,7 @@ class Flow(Viewset, metaclass=FlowMetaClass):
     process_class: Optional[type] = None
     task_class: Optional[type] = None
     lock_impl: Any = lock.no_lock
+    job_executor: Any = None
 
     process_title: str = ""
     process_description: str = ""
@@ -301,6 +343,9 @@ class Flow(Viewset, metaclass=FlowMetaClass):
                         strip_suffixes(cls.__name__, ["Flow"])
                     )
 
+        # compiled brief templates
+        cls._brief_templates = {}
+
         # nodes collect/copy
         cls._nodes_by_name = {}
         for attr_name in dir(cls):
@@ -311,6 +356,7 @@ class Flow(Viewset, metaclass=FlowMetaClass):
                 continue
 
             node = copy.copy(node)
+            node._brief_templates = {}
             node.name = attr_name
             node.flow_class = cls
             cls._nodes_by_name[attr_name] = node
@@ -347,6 +393,29 @@ class Flow(Viewset, metaclass=FlowMetaClass):
         """
         return {"flow": self}
 
+    @classmethod
+    def get_brief_template(cls, finished: bool = False) -> Template:
+        """
+        Return the compiled template of the process brief.
+
+        Templates are compiled once per flow class.
+        """
+        template_content = ""
+
+        if finished:
+            template_content = cls.process_result_template
+
+        if not template_content:
+            template_content = cls.process_summary_template
+
+        if not template_content:
+            template_content = cls.process_description
+
+        if not template_content:
+            template_content = "{{ flow_class.process_title }} - {{ process.status }}"
+
+        return _get_cached_template(cls._brief_templates, template_content)
+
     @classmethod
     def lock(cls, process_pk: int) -> Any:
         """
@@ -354,6 +423,56 @@ class Flow(Viewset, metaclass=FlowMetaClass):
         """
         return cls.lock_impl(cls, process_pk)
 
+    @classmethod
+    @contextmanager
+    def lock_many(cls, process_pks: Iterable[int]) -> Iterator[None]:
+        """
+        Acquire locks for the processes, in the pk order to avoid deadlocks.
+
+        Lock implementations could provide a `lock_many` method to take all
+        locks at once.
+        """
+        process_pks = sorted(set(process_pks))
+        lock_many = getattr(cls.lock_impl, "lock_many", None)
+        if lock_many is not None:
+            with lock_many(cls, process_pks):
+                yield
+        else:
+            with ExitStack() as stack:
+                for process_pk in process_pks:
+                    stack.enter_context(cls.lock(process_pk))
+                yield
+
+    @classmethod
+    def run_locked(cls, process_pk: int, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call the function with the process lock acquired.
+
+        If the lock implementation has a retry policy, the function would be
+        called again on the lock failure.
+        """
+
+        def locked_func():
+            with cls.lock(process_pk):
+                return func(*args, **kwargs)
+
+        retry_policy = getattr(cls.lock_impl, "retry_policy", None)
+        if retry_policy is not None:
+            return retry_policy(locked_func)
+        return locked_func()
+
+    @classmethod
+    async def arun_locked(
+        cls, process_pk: int, func: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Async version of `run_locked`.
+
+        The lock and the transaction are bound to a database connection, so
+        the function is executed with the lock acquired in a worker thread.
+        """
+        return await run_in_thread(cls.run_locked, process_pk, func, *args, **kwargs)
+
     @property
     def app_label(self) -> str:
         """
@@ -467,9 +586,12 @@ class Flow(Viewset, metaclass=FlowMetaClass):
                 status__in=[STATUS.DONE, STATUS.CANCELED, STATUS.REVIVED]
             )
 
-            activations = [
-                task.flow_task.activation_class(task) for task in active_tasks
-            ]
+            coerced = process.coerced
+            activations = []
+            for task in active_tasks:
+                activation = task.flow_task.activation_class(task)
+                activation.process = coerced
+                activations.append(activation)
 
             not_cancellable = [
                 activation
@@ -489,3 +611,22 @@ class Flow(Viewset, metaclass=FlowMetaClass):
             process.status = PROCESS.CANCELED
             process.finished = now()
             process.save()
+            processes_canceled.send(sender=self.__class__, process_pks=[process.pk])
+
+    def cancel_many(
+        self,
+        process_queryset: Any,
+        chunk_size: int = 500,
+        progress: Optional[Any] = None,
+    ) -> "bulk.BulkResult":
+        """
+        Cancel the unfinished processes of the queryset, in chunks.
+
+        A chunk of processes is locked at once, the active tasks are checked
+        in memory, and canceled with a set-based UPDATE per activation class.
+        Processes with a task that can't be canceled are skipped, and listed
+        in the `failed` dict of the result.
+        """
+        return bulk.cancel_processes(
+            self.__class__, process_queryset, chunk_size=chunk_size, progress=progress
+        )
@@ -0,0 +1,131 @@
+"""
+Rendered process and task briefs, stored in the `brief_text` columns.
+
+The `brief` of a process or a task is rendered from the flow templates,
+that needs the coerced process and task instances for each list row. When
+enabled, the rendered brief is stored in the database, so list pages read
+it directly, and could be ordered and searched by it.
+
+Briefs are refreshed after the transaction commit, when a flow or a task is
+started, finished or failed, the task status or owner is changed, or the
+processes are canceled. Rows without a stored brief are rendered as usual.
+Existing rows could be filled with::
+
+    ./manage.py viewflow_refresh_briefs
+
+The feature is enabled in the settings::
+
+    VIEWFLOW = {
+        'BRIEF_TEXT': True,
+    }
+"""
+
+from django.db import transaction
+
+from .signals import (
+    flow_finished,
+    flow_started,
+    processes_canceled,
+    task_changed,
+    task_failed,
+    task_finished,
+    task_started,
+    tasks_changed,
+)
+from .status import STATUS
+
+
+def is_enabled():
+    """Check that briefs are stored in the database."""
+    from viewflow.conf import settings as viewflow_settings
+
+    return viewflow_settings.BRIEF_TEXT
+
+
+def is_stored(obj):
+    """Check that the process or task brief could be read from the database."""
+    return obj.brief_text is not None and is_enabled()
+
+
+def refresh_brief_text(process=None, task=None):
+    """Render and store the brief of the process and the task."""
+    for obj in [process, task]:
+        if obj is None or obj.pk is None:
+            continue
+        obj.__dict__.pop("_brief", None)
+        obj.brief_text = obj.render_brief()
+        obj.__class__._default_manager.filter(pk=obj.pk).update(
+            brief_text=obj.brief_text
+        )
+
+
+def refresh_all_brief_text(queryset, chunk_size=1000):
+    """
+    Render and store briefs of the processes or tasks, and return the count.
+
+    Each chunk is updated in a separate transaction.
+    """
+    model = queryset.model
+    queryset = queryset.order_by("pk")
+
+    count, chunk = 0, []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) == chunk_size:
+            with transaction.atomic():
+                _refresh_chunk(model, chunk)
+            count, chunk = count + len(chunk), []
+    if chunk:
+        with transaction.atomic():
+            _refresh_chunk(model, chunk)
+        count += len(chunk)
+    return count
+
+
+def _refresh_chunk(model, objects):
+    for obj in objects:
+        obj.brief_text = None
+    model.render_briefs(objects)
+    for obj in objects:
+        obj.brief_text = obj.brief
+    model._default_manager.bulk_update(objects, ["brief_text"])
+
+
+def _on_activation_changed(sender, process, task, **kwargs):
+    if is_enabled():
+        transaction.on_commit(lambda: refresh_brief_text(process, task))
+
+
+def _on_tasks_changed(sender, task_pks, **kwargs):
+    if is_enabled():
+        tasks = sender.task_class._default_manager.filter(pk__in=task_pks)
+        transaction.on_commit(lambda: refresh_all_brief_text(tasks))
+
+
+def _on_processes_canceled(sender, process_pks, **kwargs):
+    if is_enabled():
+        processes = sender.process_class._default_manager.filter(pk__in=process_pks)
+        tasks = sender.task_class._default_manager.filter(
+            process_id__in=process_pks, status=STATUS.CANCELED
+        )
+
+        def refresh():
+            refresh_all_brief_text(processes)
+            refresh_all_brief_text(tasks)
+
+        transaction.on_commit(refresh)
+
+
+def connect_signals():
+    """Refresh stored briefs on the flow and task state changes."""
+    for signal in [
+        flow_started,
+        flow_finished,
+        task_started,
+        task_finished,
+        task_failed,
+        task_changed,
+    ]:
+        signal.connect(_on_activation_changed)
+    tasks_changed.connect(_on_tasks_changed)
+    processes_canceled.connect(_on_processes_canceled)
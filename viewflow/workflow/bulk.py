@@ -0,0 +1,239 @@
+"""
+Set-based task transitions.
+
+Assigning a queue of thousands tasks one by one, with an activation lock,
+refresh and save per task, is slow. Bulk transitions check the
+transition availability and permission in memory, for a chunk of tasks
+fetched in a single query, lock the affected processes in the pk order,
+and write the change with a single UPDATE per chunk::
+
+    result = Task.objects.filter(pk__in=pks).bulk_assign(request.user)
+    result.succeeded  # [task pks]
+    result.failed  # {task pk: reason}
+
+Mass process cancellation works the same way, with a chunk of processes
+locked at once, and the tasks of each activation class canceled together,
+see `Activation.cancel_many`::
+
+    result = MyFlow.instance.cancel_many(MyFlow.process_class.objects.filter(...))
+
+The task `pre_save` and `post_save` signals are not sent.
+"""
+
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+from . import candidates
+from .signals import processes_canceled, tasks_changed
+from .status import PROCESS, STATUS
+
+NOT_ALLOWED = _("Transition is not allowed")
+PERMISSION_DENIED = _("Permission denied")
+MODIFIED = _("Task was modified concurrently")
+NOT_CANCELLABLE = _("Process has active tasks that can't be canceled")
+
+
+class BulkResult(object):
+    """Transitioned task or process pks, and failure reasons of the rest."""
+
+    def __init__(self):  # noqa D102
+        self.succeeded = []
+        self.failed = {}
+
+    def __repr__(self):
+        return "<BulkResult succeeded={} failed={}>".format(
+            len(self.succeeded), len(self.failed)
+        )
+
+
+def _chunks(queryset, chunk_size):
+    chunk = []
+    queryset = queryset.select_related("process").order_by("pk")
+    for task in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(task)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _get_permitted(tasks, transition_name, user, result):
+    """
+    Tasks of the chunk, with the transition available for the user.
+
+    The permission is checked once per flow task, owner and owner
+    permission, unless the node permission object depends on the process.
+    """
+    permitted, perms = [], {}
+    for task in tasks:
+        activation = task.flow_task.activation_class(task)
+        transition = getattr(activation, transition_name, None)
+        if transition is None or not transition.can_proceed():
+            result.failed[task.pk] = NOT_ALLOWED
+            continue
+
+        if callable(getattr(task.flow_task, "_owner_permission_obj", None)):
+            has_perm = transition.has_perm(user)
+        else:
+            key = (task.flow_task, task.owner_id, task.owner_permission)
+            if key not in perms:
+                perms[key] = transition.has_perm(user)
+            has_perm = perms[key]
+
+        if has_perm:
+            permitted.append(task)
+        else:
+            result.failed[task.pk] = PERMISSION_DENIED
+    return permitted
+
+
+def _update(manager, tasks, source, values, result, expected=()):
+    """
+    Update tasks unchanged since the check, under the process locks.
+
+    The `expected` task fields should keep the values seen at the check.
+    """
+    if not tasks:
+        return
+
+    unchanged = Q()
+    groups = defaultdict(list)
+    for task in tasks:
+        groups[tuple(getattr(task, field) for field in expected)].append(task.pk)
+    for group_values, pks in groups.items():
+        unchanged |= Q(pk__in=pks, **dict(zip(expected, group_values)))
+
+    processes = defaultdict(set)
+    for task in tasks:
+        processes[task.flow_task.flow_class].add(task.process_id)
+
+    with transaction.atomic(), ExitStack() as stack:
+        for flow_class in sorted(processes, key=lambda flow: flow.instance.flow_label):
+            stack.enter_context(flow_class.lock_many(processes[flow_class]))
+
+        locked = set(
+            manager.filter(unchanged, **source)
+            .select_for_update()
+            .values_list("pk", flat=True)
+        )
+        manager.filter(pk__in=locked).update(**values)
+
+        changed = defaultdict(list)
+        for task in tasks:
+            if task.pk in locked:
+                changed[task.flow_task.flow_class].append(task.pk)
+                result.succeeded.append(task.pk)
+            else:
+                result.failed[task.pk] = MODIFIED
+
+        for flow_class, pks in changed.items():
+            tasks_changed.send(sender=flow_class, task_pks=pks)
+
+
+def bulk_transition(
+    queryset, transition_name, user, source, values, chunk_size, expected=()
+):
+    """Perform the activation transition for the queryset tasks, in chunks."""
+    result = BulkResult()
+    manager = queryset.model._default_manager
+    for chunk in _chunks(queryset, chunk_size):
+        permitted = _get_permitted(chunk, transition_name, user, result)
+        _update(manager, permitted, source, values, result, expected=expected)
+    return result
+
+
+def assign(queryset, user, chunk_size=500):
+    """Assign the queryset tasks to the user."""
+    return bulk_transition(
+        queryset,
+        "assign",
+        user,
+        source={"status": STATUS.NEW, "owner__isnull": True},
+        values={"status": STATUS.ASSIGNED, "owner": user},
+        chunk_size=chunk_size,
+    )
+
+
+def unassign(queryset, user, chunk_size=500):
+    """Return the queryset tasks to the queue, on behalf of the user."""
+    return bulk_transition(
+        queryset,
+        "unassign",
+        user,
+        source={"status": STATUS.ASSIGNED},
+        values={"status": STATUS.NEW, "owner": None},
+        chunk_size=chunk_size,
+        expected=["owner_id"],
+    )
+
+
+def _cancel_chunk(flow_class, pks, result):
+    """Cancel the chunk processes, under the process locks."""
+    process_manager = flow_class.process_class._default_manager
+    task_manager = flow_class.task_class._default_manager
+
+    with transaction.atomic(), flow_class.lock_many(pks):
+        pks = list(
+            process_manager.filter(pk__in=pks)
+            .exclude(status__in=[PROCESS.DONE, PROCESS.CANCELED])
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        active_tasks = task_manager.filter(process_id__in=pks).exclude(
+            status__in=[STATUS.DONE, STATUS.CANCELED, STATUS.REVIVED]
+        )
+
+        activations = defaultdict(list)
+        for task in active_tasks.order_by("pk"):
+            activations[task.process_id].append(task.flow_task.activation_class(task))
+
+        canceled, by_class = [], defaultdict(list)
+        for pk in pks:
+            if all(activation.cancel.can_proceed() for activation in activations[pk]):
+                canceled.append(pk)
+                for activation in activations[pk]:
+                    by_class[type(activation)].append(activation)
+            else:
+                result.failed[pk] = NOT_CANCELLABLE
+
+        for activation_class, class_activations in by_class.items():
+            activation_class.cancel_many(class_activations)
+
+        process_manager.filter(pk__in=canceled).update(
+            status=PROCESS.CANCELED, finished=now(), version=F("version") + 1
+        )
+        if candidates.is_enabled(task_manager.model):
+            candidates.remove_candidates(
+                task_manager.filter(process_id__in=canceled, status=STATUS.CANCELED)
+            )
+        if canceled:
+            processes_canceled.send(sender=flow_class, process_pks=canceled)
+
+    result.succeeded.extend(canceled)
+
+
+def cancel_processes(flow_class, queryset, chunk_size=500, progress=None):
+    """
+    Cancel the unfinished queryset processes of the flow, in chunks.
+
+    Processes with an active task that can't be canceled are skipped.
+    The `progress(result, total)` callback is called after each chunk.
+    """
+    result = BulkResult()
+    pks = list(
+        queryset.filter(flow_class=flow_class)
+        .exclude(status__in=[PROCESS.DONE, PROCESS.CANCELED])
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    for start in range(0, len(pks), chunk_size):
+        _cancel_chunk(flow_class, pks[start : start + chunk_size], result)
+        if progress is not None:
+            progress(result, len(pks))
+    return result
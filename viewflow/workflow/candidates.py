@@ -0,0 +1,311 @@
+"""
+Precomputed users and groups permitted to assign a task.
+
+With thousands of user permissions, `TaskQuerySet.user_queue` filter by
+the permission list gets slow. When enabled, each NEW task with an
+`owner_permission` gets a `TaskCandidate` row for every user and group
+having the permission, directly or per-object with django-guardian, and
+the queue is selected by an indexed lookup of the user and user groups.
+
+Candidates are kept for all unfinished tasks, so a task unassigned back
+to the queue is found without a recalculation.
+
+Candidates are updated on the task creation, and after the commit of the
+user, group and object permission changes. Permissions granted by other authentication
+backends are not tracked. After bulk permission changes, made with
+`QuerySet.update` or raw SQL, rebuild the table with::
+
+    ./manage.py viewflow_rebuild_candidates
+
+The feature is enabled in the settings::
+
+    VIEWFLOW = {
+        'TASK_CANDIDATES': True,
+    }
+"""
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+def is_enabled(task_model=None):
+    """Check that candidates are maintained for the task model."""
+    from viewflow.conf import settings as viewflow_settings
+
+    from .models import Task
+
+    if not viewflow_settings.TASK_CANDIDATES:
+        return False
+    return task_model is None or issubclass(task_model, Task)
+
+
+def _get_permissions(perm_names):
+    """Map of "app_label.codename" to the Permission pk."""
+    from django.contrib.auth.models import Permission
+
+    lookup = Q(pk__in=[])
+    for perm_name in perm_names:
+        app_label, _, codename = perm_name.partition(".")
+        lookup |= Q(content_type__app_label=app_label, codename=codename)
+
+    return {
+        "{}.{}".format(app_label, codename): pk
+        for pk, app_label, codename in Permission.objects.filter(lookup).values_list(
+            "pk", "content_type__app_label", "codename"
+        )
+    }
+
+
+def _get_model_candidates(permission_pks):
+    """Users and groups with the permissions, by permission pk."""
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group
+
+    users, groups = defaultdict(set), defaultdict(set)
+    field = get_user_model()._meta.get_field("user_permissions")
+    user_perms = field.remote_field.through.objects.filter(
+        **{"{}__in".format(field.m2m_reverse_field_name()): permission_pks}
+    ).values_list(field.m2m_field_name(), field.m2m_reverse_field_name())
+    for user_pk, permission_pk in user_perms:
+        users[permission_pk].add(user_pk)
+    group_perms = Group.permissions.through.objects.filter(
+        permission__in=permission_pks
+    )
+    for group_pk, permission_pk in group_perms.values_list("group", "permission"):
+        groups[permission_pk].add(group_pk)
+    return users, groups
+
+
+def _get_object_candidates(tasks, permissions):
+    """Users and groups with per-object permissions, by task pk."""
+    from guardian.models import GroupObjectPermission, UserObjectPermission
+
+    users, groups = defaultdict(set), defaultdict(set)
+    tasks_by_obj = defaultdict(list)
+    for task in tasks:
+        if task.owner_permission_content_type_id and task.owner_permission_obj_pk:
+            key = (
+                permissions.get(task.owner_permission),
+                task.owner_permission_content_type_id,
+                str(task.owner_permission_obj_pk),
+            )
+            tasks_by_obj[key].append(task.pk)
+
+    if not tasks_by_obj:
+        return users, groups
+
+    lookup = Q(pk__in=[])
+    for permission_pk, content_type_pk, object_pk in tasks_by_obj:
+        lookup |= Q(
+            permission=permission_pk,
+            content_type=content_type_pk,
+            object_pk=object_pk,
+        )
+
+    fields = ["permission", "content_type", "object_pk"]
+    for model, field_name, result in [
+        (UserObjectPermission, "user", users),
+        (GroupObjectPermission, "group", groups),
+    ]:
+        for *key, candidate_pk in model.objects.filter(lookup).values_list(
+            *fields, field_name
+        ):
+            for task_pk in tasks_by_obj[tuple(key)]:
+                result[task_pk].add(candidate_pk)
+
+    return users, groups
+
+
+def add_candidates(tasks):
+    """Create candidates of the new tasks."""
+    from .models import TaskCandidate
+
+    tasks = [task for task in tasks if task.owner_permission and task.finished is None]
+    if not tasks:
+        return
+
+    permissions = _get_permissions({task.owner_permission for task in tasks})
+    users, groups = _get_model_candidates(permissions.values())
+    if "guardian" in settings.INSTALLED_APPS:
+        object_users, object_groups = _get_object_candidates(tasks, permissions)
+    else:
+        object_users, object_groups = {}, {}
+
+    candidates = []
+    for task in tasks:
+        permission_pk = permissions.get(task.owner_permission)
+        candidates.extend(
+            TaskCandidate(task=task, user_id=user_pk)
+            for user_pk in users[permission_pk] | object_users.get(task.pk, set())
+        )
+        candidates.extend(
+            TaskCandidate(task=task, group_id=group_pk)
+            for group_pk in groups[permission_pk] | object_groups.get(task.pk, set())
+        )
+    TaskCandidate.objects.bulk_create(candidates)
+
+
+def update_candidates(tasks):
+    """Recalculate candidates of the tasks."""
+    from .models import TaskCandidate
+
+    tasks = list(tasks)
+    TaskCandidate.objects.filter(task__in=tasks).delete()
+    add_candidates(tasks)
+
+
+def remove_candidates(tasks):
+    """Delete candidates of the finished tasks."""
+    from .models import TaskCandidate
+
+    TaskCandidate.objects.filter(task__in=tasks).delete()
+
+
+def rebuild_candidates(task_queryset=None, chunk_size=1000):
+    """
+    Recalculate candidates of unfinished tasks, and return the tasks count.
+
+    Each chunk of tasks is updated in a separate transaction.
+    """
+    from .models import Task, TaskCandidate
+
+    if task_queryset is None:
+        task_queryset = Task._default_manager.all()
+        TaskCandidate.objects.filter(task__finished__isnull=False).delete()
+
+    task_queryset = task_queryset.filter(
+        finished__isnull=True, owner_permission__isnull=False
+    ).order_by("pk")
+
+    count, chunk = 0, []
+    for task in task_queryset.iterator(chunk_size=chunk_size):
+        chunk.append(task)
+        if len(chunk) == chunk_size:
+            with transaction.atomic():
+                update_candidates(chunk)
+            count, chunk = count + len(chunk), []
+    if chunk:
+        with transaction.atomic():
+            update_candidates(chunk)
+        count += len(chunk)
+    return count
+
+
+def candidate_filter(user):
+    """Lookup for the tasks where the user or one of the user groups is a candidate."""
+    from .models import TaskCandidate
+
+    return Exists(
+        TaskCandidate.objects.filter(
+            Q(user=user) | Q(group__in=user.groups.all()), task=OuterRef("pk")
+        )
+    )
+
+
+def _rebuild_permissions(perm_names):
+    """Recalculate candidates of the tasks with the permissions, after the commit."""
+    from .models import Task
+
+    if is_enabled() and perm_names:
+        transaction.on_commit(
+            lambda: rebuild_candidates(
+                Task._default_manager.filter(owner_permission__in=perm_names)
+            )
+        )
+
+
+def _get_perm_names(permissions):
+    return [
+        "{}.{}".format(app_label, codename)
+        for app_label, codename in permissions.values_list(
+            "content_type__app_label", "codename"
+        )
+    ]
+
+
+def _get_cleared_permissions(through, instance, model):
+    """Permissions of the user or group, to be removed by the clear()."""
+    perm_field, owner_field = None, None
+    for field in through._meta.fields:
+        if field.is_relation and field.related_model is model:
+            perm_field = field.name
+        elif field.is_relation and isinstance(instance, field.related_model):
+            owner_field = field.name
+    return model.objects.filter(
+        pk__in=through.objects.filter(**{owner_field: instance.pk}).values(perm_field)
+    )
+
+
+def _on_permissions_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    from django.contrib.auth.models import Permission
+
+    if not is_enabled():
+        return
+    if action == "pre_clear" and not reverse:
+        # the cleared permissions are not known after the clear
+        instance.__dict__["_viewflow_cleared_perms"] = _get_perm_names(
+            _get_cleared_permissions(sender, instance, model)
+        )
+        return
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+
+    if reverse:
+        perm_names = _get_perm_names(Permission.objects.filter(pk=instance.pk))
+    elif action == "post_clear":
+        perm_names = instance.__dict__.pop("_viewflow_cleared_perms", [])
+    else:
+        perm_names = _get_perm_names(Permission.objects.filter(pk__in=pk_set))
+    _rebuild_permissions(perm_names)
+
+
+def _on_permission_deleted(sender, instance, **kwargs):
+    _rebuild_permissions(
+        ["{}.{}".format(instance.content_type.app_label, instance.codename)]
+    )
+
+
+def _on_object_permission_changed(sender, instance, **kwargs):
+    from .models import Task
+
+    if not is_enabled():
+        return
+
+    tasks = Task._default_manager.filter(
+        owner_permission="{}.{}".format(
+            instance.content_type.app_label, instance.permission.codename
+        ),
+        owner_permission_content_type=instance.content_type_id,
+        owner_permission_obj_pk=instance.object_pk,
+    )
+    transaction.on_commit(lambda: rebuild_candidates(tasks))
+
+
+def connect_signals():
+    """Update candidates on the permission changes."""
+    from django.apps import apps
+
+    if not apps.is_installed("django.contrib.auth"):
+        return
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group, Permission
+
+    user_model = get_user_model()
+    if hasattr(user_model, "user_permissions"):
+        m2m_changed.connect(
+            _on_permissions_changed, sender=user_model.user_permissions.through
+        )
+    m2m_changed.connect(_on_permissions_changed, sender=Group.permissions.through)
+    post_delete.connect(_on_permission_deleted, sender=Permission)
+
+    if "guardian" in settings.INSTALLED_APPS:
+        from guardian.models import GroupObjectPermission, UserObjectPermission
+
+        for model in [UserObjectPermission, GroupObjectPermission]:
+            post_save.connect(_on_object_permission_changed, sender=model)
+            post_delete.connect(_on_object_permission_changed, sender=model)
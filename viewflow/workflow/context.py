@@ -1,11 +1,18 @@
-import threading
+import contextvars
 
 
-_context_stack = threading.local()
+_EMPTY_SCOPE = ({}, None)
+
+_context_scope = contextvars.ContextVar("viewflow_context_scope", default=_EMPTY_SCOPE)
+"""(merged values of the entered scopes, parent scope)"""
 
 
 class Context(object):
-    """Thread-local activation context, dynamically scoped.
+    """Activation context, dynamically scoped.
+
+    The scope is kept in a `contextvars.ContextVar`, so it is local for a
+    thread and an asyncio task, and follows the `sync_to_async` and
+    `async_to_sync` calls.
 
     :keyword propagate_exception: If True, on activation failure
                                   exception will be propagated to
@@ -23,31 +30,26 @@ class Context(object):
     """
 
     def __init__(self, default=None, **kwargs):  # noqa D102
-        self.default = default
+        self.default = default if default is not None else {}
         self.current_context_data = kwargs
 
     def __getattr__(self, name):
-        stack = []
-
-        if hasattr(_context_stack, "data"):
-            stack = _context_stack.data
-
-        for scope in reversed(stack):
-            if name in scope:
-                return scope[name]
+        values = _context_scope.get()[0]
+        if name in values:
+            return values[name]
 
-        if name in self.default:
-            return self.default[name]
+        default = self.__dict__.get("default", {})
+        if name in default:
+            return default[name]
 
         raise AttributeError(name)
 
     def __enter__(self):
-        if not hasattr(_context_stack, "data"):
-            _context_stack.data = []
-        _context_stack.data.append(self.current_context_data)
+        scope = _context_scope.get()
+        _context_scope.set(({**scope[0], **self.current_context_data}, scope))
 
     def __exit__(self, t, v, tb):
-        _context_stack.data.pop()
+        _context_scope.set(_context_scope.get()[1])
 
     @staticmethod
     def create(**kwargs):  # noqa D102
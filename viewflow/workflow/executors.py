@@ -0,0 +1,330 @@
+"""
+Executors of the job tasks.
+
+A `Job` task is put into the `SCHEDULED` state on activation, and handed
+to an executor after the transaction commits. The executor calls
+`run_job`, which starts the task, executes the job callback under the
+flow lock, and completes the task or marks it failed.
+
+A job is passed around as a dict of json-serializable values, so it
+could be sent to a worker process or to a message broker as is::
+
+    {
+        'task': 'app_label/flows.MyFlow.job',
+        'process_pk': 1,
+        'task_pk': 2,
+        'external_task_id': '...',
+    }
+
+An executor is selected per node, per flow or for the whole project::
+
+    class MyFlow(flow.Flow):
+        job_executor = 'viewflow.workflow.executors.ThreadExecutor'
+
+        job = flow.Job(this.send_email).Executor(CeleryExecutor(queue='mail'))
+
+    VIEWFLOW = {
+        'JOB_EXECUTOR': 'viewflow.workflow.executors.ImmediateExecutor',
+    }
+"""
+
+import threading
+from concurrent import futures
+from datetime import datetime, timedelta
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .status import STATUS
+from .utils import run_callback
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _get_timings(task):
+    """Wait and run time of the job, in seconds."""
+    timings = dict(task.data.get("_job", {}))
+    timings["started"] = task.started.isoformat()
+    timings["finished"] = task.finished.isoformat()
+    timings["duration"] = (task.finished - task.started).total_seconds()
+    if "scheduled" in timings:
+        scheduled = datetime.fromisoformat(timings["scheduled"])
+        timings["wait"] = (task.started - scheduled).total_seconds()
+    return timings
+
+
+def run_job(task, process_pk, task_pk, external_task_id=None):
+    """
+    Execute a scheduled job task, and return the task.
+
+    The job already run, canceled or rescheduled with another external
+    id is skipped, so a job delivered twice is executed once.
+    """
+    from .fields import import_task_by_ref
+
+    flow_task = import_task_by_ref(task)
+    flow_class = flow_task.flow_class
+
+    def execute():
+        job_task = (
+            flow_class.task_class._default_manager.filter(
+                pk=task_pk, process_id=process_pk, status=STATUS.SCHEDULED
+            )
+            .select_related("process")
+            .first()
+        )
+        if job_task is None or (
+            external_task_id is not None
+            and job_task.external_task_id != external_task_id
+        ):
+            return None
+
+        activation = flow_task.activation_class(job_task)
+        activation.start()
+        try:
+            with transaction.atomic(savepoint=True):
+                run_callback(flow_task._func, activation)
+        except Exception as exc:
+            job_task.finished = timezone.now()
+            job_task.data["_job"] = _get_timings(job_task)
+            if activation.can_retry(exc):
+                activation.retry(exc)
+            else:
+                activation.record_attempt(exc)
+                activation.error(exc)
+        else:
+            job_task.finished = timezone.now()
+            job_task.data["_job"] = _get_timings(job_task)
+            activation.record_attempt()
+            activation.execute()
+        return job_task
+
+    return flow_class.run_locked(process_pk, execute)
+
+
+def schedule_job(activation, delay=None):
+    """
+    Hand the scheduled task to the node executor, after the commit.
+
+    Executors with `submit_on_commit = False`, like the database queue, get
+    the job in the current transaction. Otherwise, with the outbox enabled,
+    the job is saved to the outbox instead.
+    """
+    from . import outbox
+    from .fields import get_task_ref
+
+    job = {
+        "task": get_task_ref(activation.flow_task),
+        "process_pk": activation.process.pk,
+        "task_pk": activation.task.pk,
+        "external_task_id": activation.task.external_task_id,
+    }
+    executor = activation.flow_task.get_executor()
+    if not getattr(executor, "submit_on_commit", True):
+        executor.submit(job, delay=delay)
+    elif outbox.is_enabled():
+        outbox.enqueue_job(job, delay=delay)
+    elif delay:
+        if not executor.supports_delay:
+            raise ImproperlyConfigured(
+                "{} can't run jobs with a delay. Use an executor with the "
+                "delays support, like ThreadExecutor, CeleryExecutor or "
+                "DatabaseQueueExecutor, or the outbox, for {} retries".format(
+                    type(executor).__name__, activation.flow_task
+                )
+            )
+        transaction.on_commit(lambda: executor.submit(job, delay=delay))
+    else:
+        transaction.on_commit(lambda: executor.submit(job))
+
+
+class JobExecutor(object):
+    """Base class of the job executors."""
+
+    # the `delay` of submit() is supported without blocking the caller
+    supports_delay = True
+    # submit() is called after the commit of the scheduling transaction
+    submit_on_commit = True
+
+    def submit(self, job, delay=None):
+        """Schedule the job execution, in `delay` seconds if given."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} class should override submit() method"
+        )
+
+
+class ImmediateExecutor(JobExecutor):
+    """
+    Run jobs in the current thread, right after the transaction commit.
+
+    Intended for tests and development, no broker or worker is required.
+    Delayed jobs, like the retries with a backoff, are not supported.
+    """
+
+    supports_delay = False
+
+    def submit(self, job, delay=None):  # noqa D102
+        if delay:
+            raise ImproperlyConfigured("ImmediateExecutor can't run jobs with a delay")
+        return run_job(**job)
+
+
+def _submit_later(executor, job, delay):
+    timer = threading.Timer(delay, executor.submit, args=[job])
+    timer.daemon = True
+    timer.start()
+
+
+def _run_and_close(job):
+    try:
+        return run_job(**job)
+    finally:
+        close_old_connections()
+
+
+class ThreadExecutor(JobExecutor):
+    """
+    Run jobs in a pool of threads of the current process.
+
+    Database connections of the threads are kept according to the
+    `CONN_MAX_AGE`, and closed on the shutdown.
+    """
+
+    def __init__(self, max_workers=None):  # noqa D102
+        self.max_workers = max_workers
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._connections = set()
+
+    def get_pool(self):  # noqa D102
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="viewflow-job"
+                )
+            return self._pool
+
+    def _run(self, job):
+        try:
+            return _run_and_close(job)
+        finally:
+            with self._pool_lock:
+                self._connections.update(connections.all(initialized_only=True))
+
+    def submit(self, job, delay=None):  # noqa D102
+        if delay:
+            return _submit_later(self, job, delay)
+        return self.get_pool().submit(self._run, job)
+
+    def shutdown(self, wait=True):
+        """Wait for the submitted jobs and stop the threads."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+        with self._pool_lock:
+            thread_connections, self._connections = self._connections, set()
+        for connection in thread_connections:
+            connection.inc_thread_sharing()
+            try:
+                connection.close()
+            finally:
+                connection.dec_thread_sharing()
+
+
+def _setup_process():
+    import django
+
+    django.setup()
+
+
+class ProcessExecutor(ThreadExecutor):
+    """
+    Run jobs in a pool of worker processes.
+
+    Workers are spawned with the same `DJANGO_SETTINGS_MODULE`, and get
+    own database connections.
+    """
+
+    def get_pool(self):  # noqa D102
+        import multiprocessing
+
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_setup_process,
+                )
+            return self._pool
+
+    def submit(self, job, delay=None):  # noqa D102
+        if delay:
+            return _submit_later(self, job, delay)
+        return self.get_pool().submit(_run_and_close, job)
+
+
+class CeleryExecutor(JobExecutor):
+    """
+    Send jobs to the Celery workers.
+
+    The `viewflow.workflow.tasks` module is picked by the
+    `app.autodiscover_tasks()`, when `viewflow.workflow` is in the
+    INSTALLED_APPS.
+    """
+
+    def __init__(self, **options):  # noqa D102
+        self.options = options
+
+    def submit(self, job, delay=None):  # noqa D102
+        from .tasks import run_job_task
+
+        return run_job_task.apply_async(kwargs=job, countdown=delay, **self.options)
+
+
+class DatabaseQueueExecutor(JobExecutor):
+    """
+    Leave scheduled jobs in the database, for the `viewflow_worker`.
+
+    Delayed jobs are kept as claims without a worker, until the delay
+    passes. See `viewflow.workflow.worker`.
+    """
+
+    # the delayed claim is written with the task, so a worker never sees
+    # the task scheduled without it
+    submit_on_commit = False
+
+    def submit(self, job, delay=None):  # noqa D102
+        from .models import JobClaim
+
+        if delay:
+            JobClaim.objects.update_or_create(
+                task_id=job["task_pk"],
+                defaults={
+                    "worker": "",
+                    "heartbeat": timezone.now() + timedelta(seconds=delay),
+                },
+            )
+
+
+def get_executor(executor=None):
+    """Resolve an executor instance, or an import path to it, to the executor."""
+    if executor is None:
+        from viewflow.conf import settings as viewflow_settings
+
+        executor = viewflow_settings.JOB_EXECUTOR
+
+    if not isinstance(executor, str):
+        return executor
+
+    with _executors_lock:
+        if executor not in _executors:
+            instance = import_string(executor)
+            if isinstance(instance, type):
+                instance = instance()
+            _executors[executor] = instance
+        return _executors[executor]
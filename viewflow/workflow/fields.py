@@ -2,6 +2,7 @@ import warnings
 from functools import lru_cache
 
 from django.db import models
+from django.db.models.lookups import StartsWith
 from django.utils.module_loading import import_string
 
 from viewflow.utils import get_app_package, get_containing_app_data
@@ -161,3 +162,29 @@ class TokenField(models.CharField):
 
     def get_prep_value(self, value):
         return value.token
+
+
+@TokenField.register_lookup
+class TokenPrefix(models.Lookup):
+    """
+    Tokens starting with a split prefix, `token__prefix='start/3_'`.
+
+    On PostgreSQL `LIKE 'start/3_%'` is executed as an index range scan
+    over the `varchar_pattern_ops` index. SQLite can't use indexes for
+    `LIKE ... ESCAPE`, so the prefix is converted to a range of binary
+    collated strings.
+    """
+
+    lookup_name = "prefix"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        return compiler.compile(StartsWith(self.lhs, self.rhs))
+
+    def as_sqlite(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        low, high = Token.get_prefix_range(self.rhs)
+        return (
+            "{lhs} >= %s AND {lhs} < %s".format(lhs=lhs_sql),
+            (*lhs_params, low, *lhs_params, high),
+        )
@@ -5,6 +5,7 @@ from .nodes import (
     Function,
     Handle,
     If,
+    Job,
     Join,
     Obsolete,
     Split,
@@ -25,6 +26,7 @@ __all__ = (
     "Function",
     "Handle",
     "If",
+    "Job",
     "Join",
     "NodeDetailMixin",
     "NodeExecuteMixin",
@@ -270,6 +270,36 @@ class Function(
     revive_view_class = views.ReviveTaskView
 
 
+class Job(
+    mixins.NodeDetailMixin,
+    mixins.NodeCancelMixin,
+    nodes.Job,
+):
+    """
+    Represents a callback executed asynchronously by a job executor.
+
+    The task is scheduled on activation, and handed to the executor after
+    the transaction commits. The callback runs with the flow lock acquired.
+
+    .. code-block:: python
+
+        class MyFlow(flow.Flow):
+            job_executor = "viewflow.workflow.executors.ThreadExecutor"
+
+            ...
+
+            send_email = flow.Job(this.send_email).Next(this.end)
+
+            def send_email(self, activation):
+                send_mail(...)
+
+    """
+
+    index_view_class = views.IndexTaskView
+    detail_view_class = views.DetailTaskView
+    cancel_view_class = views.CancelTaskView
+
+
 class Handle(
     mixins.NodeDetailMixin,
     mixins.NodeCancelMixin,
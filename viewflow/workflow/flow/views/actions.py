@@ -1,6 +1,5 @@
 from django import forms
 from django.contrib import messages
-from django.db import transaction
 from django.http import HttpResponseRedirect
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -184,24 +183,34 @@ class CancelProcessView(mixins.ProcessViewTemplateNames, generic.DetailView):
             return self.get(request, *args, **kwargs)
 
 
+def message_failed(request, result):
+    """Report tasks skipped by a bulk transition."""
+    if result.failed:
+        message = _("{count} tasks were skipped: {reasons}").format(
+            count=len(result.failed),
+            reasons=", ".join(
+                sorted({str(reason) for reason in result.failed.values()})
+            ),
+        )
+        messages.add_message(request, messages.WARNING, message, fail_silently=True)
+
+
 class BulkUnassignTasksActionView(BaseBulkActionView):
     model = Task
     template_name = "viewflow/workflow/tasks_unassign.html"
     template_name_suffix = "s_unassign"
 
     def form_valid(self, form):
-        with transaction.atomic():
-            for task in self.get_queryset():
-                with task.activation() as activation:
-                    activation.unassign()
-        self.message_user()
+        result = self.get_queryset().bulk_unassign(self.request.user)
+        self.message_user(result)
         return HttpResponseRedirect(self.get_success_url())
 
-    def message_user(self):
+    def message_user(self, result):
         message = "Tasks was unassigned"
         messages.add_message(
             self.request, messages.SUCCESS, message, fail_silently=True
         )
+        message_failed(self.request, result)
 
 
 class BulkAssignTasksActionView(BaseBulkActionView):
@@ -210,15 +219,13 @@ class BulkAssignTasksActionView(BaseBulkActionView):
     template_name_suffix = "s_assign"
 
     def form_valid(self, form):
-        with transaction.atomic():
-            for task in self.get_queryset():
-                with task.activation() as activation:
-                    activation.assign(self.request.user)
-        self.message_user()
+        result = self.get_queryset().bulk_assign(self.request.user)
+        self.message_user(result)
         return HttpResponseRedirect(self.get_success_url())
 
-    def message_user(self):
+    def message_user(self, result):
         message = "Tasks was assigned"
         messages.add_message(
             self.request, messages.SUCCESS, message, fail_silently=True
         )
+        message_failed(self.request, result)
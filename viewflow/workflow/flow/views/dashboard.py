@@ -1,6 +1,18 @@
+from collections import defaultdict
+
+from django.core.cache import caches
 from django.core.exceptions import PermissionDenied
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.db.models import (
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Window,
+)
+from django.db.models.functions import Coalesce, RowNumber
 from django.utils.decorators import method_decorator
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
@@ -25,6 +37,8 @@ class DashboardView(
     flow_class = None
     template_filename = "process_dashboard.html"
     MAX_ROWS = 26
+    cache_name = "default"
+    cache_timeout = None
 
     # TODO queryset from viewset
     # @viewprop
@@ -33,6 +47,100 @@ class DashboardView(
     #        return self.viewset.get_queryset(self.request)
     #    return self.flow_class.task_class._default_manager
 
+    def get_task_queryset(self, available):
+        """Tasks shown on the dashboard, coerced to the flow task class."""
+        manager = self.flow_class.task_class._default_manager
+        return manager.coerce_for([self.flow_class] if available else [])
+
+    def get_board_filter(self, nodes, end_nodes):
+        """Active tasks of the columns, and finished tasks of the end nodes."""
+        return Q(flow_task__in=nodes) & (
+            Q(finished__isnull=True) | Q(status=STATUS.ERROR)
+        ) | Q(flow_task__in=end_nodes, finished__isnull=False)
+
+    def get_board(self, queryset, nodes, end_nodes):
+        """
+        Latest `MAX_ROWS` tasks and the task count of each node.
+
+        The rows are fetched with a single windowed query, and the counts
+        with a single grouped query.
+        """
+        board_filter = self.get_board_filter(nodes, end_nodes)
+        tasks = (
+            queryset.filter(board_filter)
+            .annotate(
+                row_number=Window(
+                    RowNumber(),
+                    partition_by=[F("flow_task")],
+                    order_by=[F("created").desc(), F("pk").desc()],
+                )
+            )
+            .filter(row_number__lte=self.MAX_ROWS)
+            .order_by("-created", "-pk")
+        )
+        counts = (
+            queryset.filter(board_filter)
+            .values_list("flow_task")
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+
+        rows = defaultdict(list)
+        for task in tasks:
+            rows[task.flow_task].append(task)
+        return rows, dict(counts)
+
+    def get_cached_board(self, nodes, end_nodes):
+        """
+        Dashboard rows, cached for `cache_timeout` seconds if set.
+
+        The rows depend on the user only by the flow view permission, so
+        the task pks and counts are shared by the users with the same
+        permission. On a cache hit, the tasks are fetched by pk, and the
+        tasks that left the board since are skipped.
+        """
+        available = self.flow_class.instance.has_view_permission(self.request.user)
+        queryset = self.get_task_queryset(available)
+        if self.cache_timeout is None:
+            return self.get_board(queryset, nodes, end_nodes)
+
+        cache = caches[self.cache_name]
+        key = "viewflow-dashboard-{}-{}-{}".format(
+            self.flow_class.instance.flow_label, self.MAX_ROWS, available
+        )
+        cached = cache.get(key)
+        if cached is None:
+            rows, counts = self.get_board(queryset, nodes, end_nodes)
+            cache.set(
+                key,
+                (
+                    {
+                        get_task_ref(node): [task.pk for task in tasks]
+                        for node, tasks in rows.items()
+                    },
+                    {get_task_ref(node): count for node, count in counts.items()},
+                ),
+                self.cache_timeout,
+            )
+            return rows, counts
+
+        row_pks, counts = cached
+        tasks = queryset.filter(self.get_board_filter(nodes, end_nodes)).in_bulk(
+            [pk for pks in row_pks.values() for pk in pks]
+        )
+        nodes_by_ref = {get_task_ref(node): node for node in nodes + end_nodes}
+        rows = {
+            nodes_by_ref[ref]: [tasks[pk] for pk in pks if pk in tasks]
+            for ref, pks in row_pks.items()
+            if ref in nodes_by_ref
+        }
+        counts = {
+            nodes_by_ref[ref]: count
+            for ref, count in counts.items()
+            if ref in nodes_by_ref
+        }
+        return rows, counts
+
     def get_context_data(self, **kwargs):
         sorted_nodes, _ = chart.topsort(self.flow_class)
         nodes = [
@@ -48,32 +156,31 @@ class DashboardView(
 
         end_nodes = [node for node in sorted_nodes if node.task_type in ["END"]]
 
+        rows, counts = self.get_cached_board(nodes, end_nodes)
+
         columns = []
         for node in nodes:
             columns.append(
                 {
                     "node": node,
                     "node_ref": get_task_ref(node),
-                    "tasks": self.flow_class.task_class._default_manager.filter_available(
-                        [self.flow_class], self.request.user
-                    ).filter(
-                        Q(finished__isnull=True) | Q(status=STATUS.ERROR),
-                        flow_task=node,
-                    )[
-                        : self.MAX_ROWS
-                    ],
+                    "tasks": rows.get(node, []),
+                    "count": counts.get(node, 0),
                 }
             )
 
-        finished = self.flow_class.task_class._default_manager.filter_available(
-            [self.flow_class], self.request.user
-        ).filter(finished__isnull=False, flow_task__in=end_nodes)[: self.MAX_ROWS]
+        finished = sorted(
+            (task for node in end_nodes for task in rows.get(node, [])),
+            key=lambda task: (task.created, task.pk),
+            reverse=True,
+        )[: self.MAX_ROWS]
 
         return super().get_context_data(
             columns=columns,
             start_nodes=start_nodes,
             end_nodes=end_nodes,
             finished=finished,
+            finished_count=sum(counts.get(node, 0) for node in end_nodes),
             **kwargs,
         )
 
@@ -95,6 +202,7 @@ class DashboardView(
 class DashboardTaskListView(
     mixins.StoreRequestPathMixin,
     mixins.ProcessViewTemplateNames,
+    mixins.TaskBriefsMixin,
     ListModelView,
 ):
     """List of all tasks of the flow."""
@@ -104,6 +212,8 @@ class DashboardTaskListView(
 
     columns = ("task_id", "flow_task", "process_summary", "created", "owner")
     filterset_class = filters.DashboardTaskListViewFilter
+    list_select_related = ("owner",)
+    process_briefs = True
 
     def task_id(self, task):
         task_url = task.flow_task.reverse("index", args=[task.process_id, task.pk])
@@ -112,7 +222,7 @@ class DashboardTaskListView(
     task_id.short_description = _("#")
 
     def process_summary(self, task):
-        return task.process.coerced.brief
+        return task.process.brief
 
     @property
     def model(self):
@@ -121,12 +231,13 @@ class DashboardTaskListView(
     @viewprop
     def queryset(self):
         queryset = self.model._default_manager.all()
-        return queryset.filter(process__flow_class=self.flow_class)
+        return queryset.filter(flow_class=self.flow_class)
 
 
 class DashboardProcessListView(
     mixins.StoreRequestPathMixin,
     mixins.ProcessViewTemplateNames,
+    mixins.ProcessBriefsMixin,
     ListModelView,
 ):
     """List of all processes of the flow."""
@@ -144,9 +255,22 @@ class DashboardProcessListView(
         )
         return mark_safe(f'<a href="{process_url}">{process.pk}</a>')
 
-    def active_tasks(self, obj):
-        manager = obj.flow_class.task_class._default_manager
-        return manager.filter(process=obj, finished__isnull=True).count()
+    def get_list_annotations(self):
+        active_tasks = (
+            self.flow_class.task_class._default_manager.filter(
+                process=OuterRef("pk"), finished__isnull=True
+            )
+            .order_by()
+            .values("process")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return {
+            "active_tasks": Coalesce(
+                Subquery(active_tasks, output_field=IntegerField()), 0
+            ),
+            **super().get_list_annotations(),
+        }
 
     @property
     def model(self):
@@ -12,6 +12,7 @@ from . import filters, mixins
 class FlowInboxListView(
     mixins.StoreRequestPathMixin,
     mixins.ProcessViewTemplateNames,
+    mixins.TaskBriefsMixin,
     ListModelView,
 ):
     """List of current user assigned tasks of a flow"""
@@ -44,7 +45,7 @@ class FlowInboxListView(
         queryset = self.model._default_manager.all()
 
         return queryset.filter(
-            process__flow_class=self.flow_class,
+            flow_class=self.flow_class,
             owner=self.request.user,
             status=STATUS.ASSIGNED,
         ).order_by("-created")
@@ -53,6 +54,7 @@ class FlowInboxListView(
 class FlowQueueListView(
     mixins.StoreRequestPathMixin,
     mixins.ProcessViewTemplateNames,
+    mixins.TaskBriefsMixin,
     ListModelView,
 ):
     """List of current user available tasks of a flow"""
@@ -93,6 +95,7 @@ class FlowQueueListView(
 class FlowArchiveListView(
     mixins.StoreRequestPathMixin,
     mixins.ProcessViewTemplateNames,
+    mixins.TaskBriefsMixin,
     ListModelView,
 ):
     """List of current user completed tasks of a flow."""
@@ -100,6 +103,7 @@ class FlowArchiveListView(
     columns = ("task_id", "brief", "created", "finished", "process_summary")
     filterset_class = filters.FlowArchiveListFilter
     flow_class = None
+    process_briefs = True
     template_filename = "process_tasks_list.html"
     title = _("Archive")
 
@@ -129,9 +133,12 @@ class FlowArchiveListView(
         ).order_by("-created")
 
 
-class WorkflowTaskListView(mixins.StoreRequestPathMixin, ListModelView):
+class WorkflowTaskListView(
+    mixins.StoreRequestPathMixin, mixins.TaskBriefsMixin, ListModelView
+):
     flow_classes = None
     model = Task
+    process_briefs = True
     template_name = "viewflow/workflow/workflow_tasks_list.html"
 
     def task_id(self, task):
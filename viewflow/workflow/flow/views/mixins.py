@@ -10,6 +10,9 @@ from django.contrib import messages
 from django.utils.html import format_html
 from django.urls.exceptions import NoReverseMatch
 
+from viewflow.utils import viewprop
+from viewflow.workflow import briefs
+
 
 class SuccessMessageMixin(object):
     """Send a notification with link to the current process or task."""
@@ -102,3 +105,75 @@ class StoreRequestPathMixin:
     def dispatch(self, request, *args, **kwargs):
         request.session["vf-pin-location"] = request.get_full_path()
         return super().dispatch(request, *args, **kwargs)
+
+
+class BriefTextColumn(object):
+    """List column ordered by the stored brief."""
+
+    def __init__(self, column_def, orderby):
+        self.column_def = column_def
+        self._orderby = orderby
+
+    def __getattr__(self, attr_name):
+        return getattr(self.column_def, attr_name)
+
+    def orderby(self):
+        return self._orderby
+
+
+class BriefTextMixin(object):
+    """Order and search a list by the stored briefs, if enabled."""
+
+    brief_columns = {}  # column name -> brief_text lookup
+
+    def get_column_def(self, attr_name):
+        column_def = super().get_column_def(attr_name)
+        if attr_name in self.brief_columns and briefs.is_enabled():
+            column_def = BriefTextColumn(column_def, self.brief_columns[attr_name])
+        return column_def
+
+    @viewprop
+    def search_fields(self):
+        if briefs.is_enabled():
+            lookups = [
+                self.brief_columns[column_name]
+                for column_name in self.get_columns()
+                if column_name in self.brief_columns
+            ]
+            if lookups:
+                return lookups
+        return None
+
+
+class TaskBriefsMixin(BriefTextMixin):
+    """Render the task briefs of a list page in bulk."""
+
+    brief_columns = {
+        "brief": "brief_text",
+        "process_brief": "process__brief_text",
+        "process_summary": "process__brief_text",
+    }
+    process_briefs = False
+
+    def get_queryset(self):
+        """Tasks with the processes, coerced for the briefs, in the page query."""
+        flow_classes = (
+            self.flow_classes if hasattr(self, "flow_classes") else [self.flow_class]
+        )
+        return super().get_queryset().select_coerced_processes(flow_classes)
+
+    def get_page_data(self, page):
+        tasks = list(page)
+        self.model.render_briefs(tasks, processes=self.process_briefs)
+        return super().get_page_data(tasks)
+
+
+class ProcessBriefsMixin(BriefTextMixin):
+    """Render the process briefs of a list page in bulk."""
+
+    brief_columns = {"brief": "brief_text"}
+
+    def get_page_data(self, page):
+        processes = list(page)
+        self.model.render_briefs(processes)
+        return super().get_page_data(processes)
@@ -1,12 +1,17 @@
 """Prevents inconsistent db updates for flow."""
 from __future__ import unicode_literals
 
-import time
+import copy
+import hashlib
 import random
+import threading
+import time
+from collections import defaultdict, deque
 from contextlib import contextmanager
 
 from django.core.cache import cache as default_cache
-from django.db import transaction, DatabaseError
+from django.db import connection, transaction, DatabaseError
+from django.db.models import F
 
 from .exceptions import FlowLockFailed
 
@@ -15,7 +20,8 @@ class NoLock(object):
     """
     No pessimistic locking, just execute flow task in transaction.
 
-    Not suitable when you have Join nodes in your flow.
+    Not suitable when you have Join nodes in your flow. Consider the
+    `LocalLock` for single-process deployments.
     """
 
     @contextmanager
@@ -23,6 +29,11 @@ class NoLock(object):
         with transaction.atomic():
             yield
 
+    @contextmanager
+    def lock_many(self, flow_class, process_pks):
+        with transaction.atomic():
+            yield
+
 
 class SelectForUpdateLock(object):
     """
@@ -54,6 +65,30 @@ class SelectForUpdateLock(object):
                     yield
                     break
 
+    @contextmanager
+    def lock_many(self, flow_class, process_pks):
+        """Lock the process rows with a single query, in the pk order."""
+        for i in range(self.attempts):
+            with transaction.atomic():
+                try:
+                    processes = flow_class.process_class._default_manager.filter(
+                        pk__in=process_pks
+                    ).order_by("pk")
+                    list(
+                        processes.select_for_update(nowait=self.nowait).values_list(
+                            "pk", flat=True
+                        )
+                    )
+                except DatabaseError:
+                    if i != self.attempts - 1:
+                        sleep_time = (((i + 1) * random.random()) + 2**i) / 2.5
+                        time.sleep(sleep_time)
+                    else:
+                        raise FlowLockFailed("Lock failed for {}".format(flow_class))
+                else:
+                    yield
+                    break
+
 
 class CacheLock(object):
     """
@@ -98,6 +133,346 @@ class CacheLock(object):
             self.cache.delete(key)
 
 
+class RetryPolicy(object):
+    """
+    Rerun a function failed with `FlowLockFailed`, with an exponential backoff.
+
+    A function is not retried inside an outer transaction, since the
+    transaction is already broken by the failure.
+
+    Any callable, that accepts a function to run, could be used as a retry
+    policy::
+
+        class MyFlow(Flow):
+            lock_impl = OptimisticLock(retry_policy=RetryPolicy(attempts=10))
+    """
+
+    def __init__(self, attempts=5, delay=0.01, max_delay=1.0):  # noqa D102
+        self.attempts = attempts
+        self.delay = delay
+        self.max_delay = max_delay
+
+    def get_delay(self, attempt):
+        """Time to sleep before the next attempt, with a random jitter."""
+        return min(self.max_delay, self.delay * 2**attempt) * random.uniform(0.5, 1)
+
+    def __call__(self, func):
+        for attempt in range(self.attempts):
+            try:
+                return func()
+            except FlowLockFailed:
+                if attempt == self.attempts - 1 or connection.in_atomic_block:
+                    raise
+                time.sleep(self.get_delay(attempt))
+
+
+class OptimisticLock(object):
+    """
+    Optimistic concurrency control over the process `version` column.
+
+    Activations are not serialized. The process version is read at the
+    beginning, and incremented by a compare-and-swap update at the end of
+    the transaction. If another activation has committed to the same
+    process in the meantime, the transaction is rolled back with
+    `FlowLockFailed`.
+
+    Safe to use with Join nodes: two branches coming to a join concurrently
+    can't both commit with a stale view of the process tasks. The
+    activations started with `Flow.run_locked`, like `Handle.run`, are
+    rerun by the retry policy on a conflict.
+
+    Requires READ COMMITTED or lower transaction isolation level to make
+    the retries succeed.
+    """
+
+    def __init__(self, retry_policy=None):  # noqa D102
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+    def get_update_fields(self, process):
+        """
+        Fields written by `save()` of an existing flow process.
+
+        The version is changed by the lock only, so a stale in-memory value
+        can't hide a concurrent modification.
+        """
+        deferred_fields = process.get_deferred_fields()
+        return [
+            field.name
+            for field in process._meta.concrete_fields
+            if not field.primary_key
+            and field.name != "version"
+            and field.attname not in deferred_fields
+        ]
+
+    @contextmanager
+    def __call__(self, flow_class, process_pk):
+        manager = flow_class.process_class._default_manager
+        with transaction.atomic():
+            version = (
+                manager.filter(pk=process_pk).values_list("version", flat=True).first()
+            )
+            yield
+            if version is not None:
+                updated = manager.filter(pk=process_pk, version=version).update(
+                    version=F("version") + 1
+                )
+                if not updated:
+                    raise FlowLockFailed(
+                        "Concurrent modification of {} #{}".format(
+                            flow_class, process_pk
+                        )
+                    )
+
+    @contextmanager
+    def lock_many(self, flow_class, process_pks):
+        """
+        Lock the processes of a bulk operation.
+
+        The versions are incremented up front, so the concurrent activations
+        of the processes fail on the commit.
+        """
+        manager = flow_class.process_class._default_manager
+        with transaction.atomic():
+            manager.filter(pk__in=process_pks).update(version=F("version") + 1)
+            yield
+
+
+class LockStats(object):
+    """Lock wait time and contention counters of a flow class."""
+
+    def __init__(self):  # noqa D102
+        self.acquired = 0
+        self.contended = 0
+        self.failed = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def __repr__(self):
+        return "<LockStats acquired={} contended={} failed={} wait_time={:.3f}>".format(
+            self.acquired, self.contended, self.failed, self.wait_time
+        )
+
+
+class _LockWaiter(object):
+    __slots__ = ("owner", "event")
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.event = threading.Event()
+
+
+class _LockEntry(object):
+    __slots__ = ("owner", "waiters")
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.waiters = deque()
+
+
+class LocalLock(object):
+    """
+    In-memory process lock for single-node deployments.
+
+    Activations on a process are serialized across threads of the current
+    OS process, without a round trip to the database or cache. Not
+    suitable, if more than one worker process serves the flow.
+
+    Locks are kept in a striped table keyed by (flow_label, process_pk).
+    Waiting threads get the lock in the FIFO order, and the table entry is
+    dropped as soon as the lock is released with no waiters.
+
+    :keyword timeout: Max time to wait for the lock, in seconds.
+    :keyword stripes: Number of independent table stripes.
+    :keyword debug: Fail with `FlowLockFailed` on a re-entrant lock
+                    acquisition on the same process, instead of a deadlock.
+
+    Example::
+
+        class MyFlow(Flow):
+            lock_impl = LocalLock(timeout=30, debug=settings.DEBUG)
+    """
+
+    def __init__(self, timeout=None, stripes=64, debug=False):  # noqa D102
+        self.timeout = timeout
+        self.debug = debug
+        self._stripes = [(threading.Lock(), {}) for _ in range(stripes)]
+
+    def _get_stripe(self, key):
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def acquire(self, key, blocking=True, timeout=None):
+        """Acquire the lock for the key, return True on success."""
+        mutex, entries = self._get_stripe(key)
+        owner = threading.get_ident()
+
+        with mutex:
+            entry = entries.get(key)
+            if entry is None:
+                entries[key] = _LockEntry(owner)
+                return True
+            if self.debug and entry.owner == owner:
+                raise FlowLockFailed("Re-entrant lock acquisition for {}".format(key))
+            if not blocking:
+                return False
+            waiter = _LockWaiter(owner)
+            entry.waiters.append(waiter)
+
+        if waiter.event.wait(timeout):
+            return True
+
+        with mutex:
+            if waiter.event.is_set():  # lock was passed after the timeout
+                return True
+            entry.waiters.remove(waiter)
+            return False
+
+    def release(self, key):
+        """Release the lock, and pass it to the first waiting thread."""
+        mutex, entries = self._get_stripe(key)
+        with mutex:
+            entry = entries[key]
+            if entry.waiters:
+                waiter = entry.waiters.popleft()
+                entry.owner = waiter.owner
+                waiter.event.set()
+            else:
+                del entries[key]
+
+    @contextmanager
+    def __call__(self, flow_class, process_pk):  # noqa D102
+        key = (flow_class.instance.flow_label, process_pk)
+        if not self.acquire(key, timeout=self.timeout):
+            raise FlowLockFailed("Lock failed for {}".format(flow_class))
+
+        try:
+            with transaction.atomic():
+                yield
+        finally:
+            self.release(key)
+
+
+class AdvisoryLock(object):
+    """
+    PostgreSQL transaction-level advisory lock on the process.
+
+    Unlike `SelectForUpdateLock`, the process row is not locked, so readers
+    that use `SELECT ... FOR SHARE` are not blocked, and waiting activations
+    are queued by the database instead of retrying with sleeps.
+
+    The lock key is a 64-bit hash of the flow label and process pk.
+
+    :keyword blocking: Wait for the lock. If False, fail immediately when
+                       the process is locked by another transaction.
+    :keyword timeout: Max time to wait for the lock, in seconds.
+
+    Lock wait time and contention counters are collected per flow class,
+    see `get_stats`.
+
+    On databases other than PostgreSQL, the in-memory `LocalLock` table is
+    used, that is suitable for the local testing only.
+
+    Example::
+
+        class MyFlow(Flow):
+            lock_impl = AdvisoryLock(timeout=5)
+    """
+
+    def __init__(self, blocking=True, timeout=None):  # noqa D102
+        self.blocking = blocking
+        self.timeout = timeout
+        self._stats = defaultdict(LockStats)
+        self._stats_lock = threading.Lock()
+        self._local_lock = LocalLock()
+
+    def get_key(self, flow_class, process_pk):
+        """64-bit signed lock key for the process."""
+        key = "{}/{}".format(flow_class.instance.flow_label, process_pk)
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big", signed=True)
+
+    def get_stats(self, flow_class):
+        """Snapshot of the lock statistics of the flow class."""
+        with self._stats_lock:
+            return copy.copy(self._stats[flow_class])
+
+    def reset_stats(self):
+        """Reset the lock statistics of all flow classes."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def _record(self, flow_class, acquired, contended, wait_time):
+        with self._stats_lock:
+            stats = self._stats[flow_class]
+            if acquired:
+                stats.acquired += 1
+            else:
+                stats.failed += 1
+            if contended:
+                stats.contended += 1
+            stats.wait_time += wait_time
+            stats.max_wait_time = max(stats.max_wait_time, wait_time)
+
+    def _acquire_advisory(self, key):
+        """Acquire the lock and return (acquired, contended)."""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [key])
+            if cursor.fetchone()[0]:
+                return True, False
+            if not self.blocking:
+                return False, True
+
+            if self.timeout is not None:
+                cursor.execute("SELECT current_setting('lock_timeout')")
+                lock_timeout = cursor.fetchone()[0]
+                cursor.execute(
+                    "SELECT set_config('lock_timeout', %s, true)",
+                    ["{}ms".format(int(self.timeout * 1000))],
+                )
+            try:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", [key])
+            except DatabaseError:
+                return False, True
+            if self.timeout is not None:
+                cursor.execute(
+                    "SELECT set_config('lock_timeout', %s, true)", [lock_timeout]
+                )
+            return True, True
+
+    def _acquire_local(self, key):
+        """Acquire the in-memory lock and return (acquired, contended)."""
+        if self._local_lock.acquire(key, blocking=False):
+            return True, False
+        if not self.blocking:
+            return False, True
+        return self._local_lock.acquire(key, timeout=self.timeout), True
+
+    def _acquire(self, flow_class, key, acquire_func):
+        start = time.monotonic()
+        acquired, contended = acquire_func(key)
+        self._record(flow_class, acquired, contended, time.monotonic() - start)
+        if not acquired:
+            raise FlowLockFailed("Lock failed for {}".format(flow_class))
+
+    @contextmanager
+    def __call__(self, flow_class, process_pk):  # noqa D102
+        key = self.get_key(flow_class, process_pk)
+
+        if connection.vendor == "postgresql":
+            with transaction.atomic():
+                self._acquire(flow_class, key, self._acquire_advisory)
+                yield
+        else:
+            self._acquire(flow_class, key, self._acquire_local)
+            try:
+                with transaction.atomic():
+                    yield
+            finally:
+                self._local_lock.release(key)
+
+
 no_lock = NoLock()
 cache_lock = CacheLock()
 select_for_update_lock = SelectForUpdateLock()
+optimistic_lock = OptimisticLock()
+advisory_lock = AdvisoryLock()
+local_lock = LocalLock()
@@ -1,12 +1,14 @@
-from django.db import models
-from django.db.models import Q, F, Value
-from django.db.models.functions import Concat
-from django.conf import settings
+from collections import defaultdict
+from functools import lru_cache
+
+from django.db.models import Q, prefetch_related_objects
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.query import QuerySet
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.query import ModelIterable
 
+from . import bulk, candidates
+from .permissions import get_permission_snapshot
 from .status import STATUS
 from .utils import get_next_process_task
 
@@ -19,8 +21,9 @@ def _available_flows(flow_classes, user):
     return result
 
 
+@lru_cache(maxsize=None)
 def _get_related_path(model, base_model):
-    """Return path suitable for select related for subclass."""
+    """Return path suitable for select related for subclass, cached per models pair."""
     ancestry = []
 
     if model._meta.proxy:
@@ -67,6 +70,45 @@ def coerce_to_related_instance(instance, target_model):
     return instance
 
 
+def _prefetch_coerced(instances, get_target_model):
+    groups = defaultdict(list)
+    for instance in instances:
+        target_model = get_target_model(instance)
+        if target_model is not None:
+            related = _get_related_path(target_model, instance.__class__)
+            if related:
+                groups[instance.__class__, related].append(instance)
+
+    for (_, related), group in groups.items():
+        prefetch_related_objects(group, related)
+
+
+def prefetch_coerced_processes(processes):
+    """
+    Load subclass instances of the processes for `Process.coerced` lookups.
+
+    Processes with the same subclass model are fetched in a single query.
+    """
+    _prefetch_coerced(
+        processes,
+        lambda process: (
+            process.flow_class.process_class if process.flow_class else None
+        ),
+    )
+
+
+def prefetch_coerced_tasks(tasks):
+    """
+    Load subclass instances of the tasks for `Task.coerced` lookups.
+
+    Tasks with the same subclass model are fetched in a single query.
+    """
+    _prefetch_coerced(
+        tasks,
+        lambda task: task.flow_task.flow_class.task_class if task.flow_task else None,
+    )
+
+
 class ProcessIterable(ModelIterable):
     def __iter__(self):
         base_iterator = super().__iter__()
@@ -153,65 +195,55 @@ class TaskQuerySet(QuerySet):
             ),
         )
 
-        return self.filter(process__flow_class__in=flow_classes).select_related(
+        return self.filter(flow_class__in=flow_classes).select_related(
             "process", *related
         )
 
+    def select_coerced_processes(self, flow_classes):
+        """Fetch the task processes, with the flow process subclass rows."""
+        process_model = self.model._meta.get_field("process").related_model
+        related = filter(
+            None,
+            map(
+                lambda flow_class: _get_related_path(
+                    flow_class.process_class, process_model
+                ),
+                flow_classes,
+            ),
+        )
+        return self.select_related(
+            "process", *(LOOKUP_SEP.join(["process", path]) for path in related)
+        )
+
+    def prefetch_coerced_processes(self):
+        """Fetch the task processes, coerced to the flow process class, in bulk."""
+        queryset = self.select_related("process")
+        queryset._prefetch_coerced = True
+        return queryset
+
     def user_queue(self, user, flow_class=None):
         """List of tasks of the flow_class permitted for user."""
         queryset = self.filter(flow_task_type="HUMAN")
 
         if flow_class is not None:
-            queryset = queryset.filter(process__flow_class=flow_class)
-
-        if not user.is_superuser:
-            has_permission = Q(owner_permission__isnull=True) | Q(owner=user)
-
-            if "guardian" in settings.INSTALLED_APPS:
-                from guardian.models import UserObjectPermission, GroupObjectPermission
-
-                queryset = queryset.annotate(
-                    owner_permission_obj_check=Concat(
-                        F("owner_permission"),
-                        Value("_"),
-                        F("owner_permission_obj_pk"),
-                        output_field=models.CharField(),
-                    )
-                )
-
-                all_user_perms = user.get_all_permissions()
-                if hasattr(user, "_viewflow_per_object_perm_cache"):
-                    per_object_perms = user._viewflow_per_object_perm_cache
-                else:
-                    per_object_perms = {
-                        "{}.{}_{}".format(
-                            userperm.content_type.app_label,
-                            userperm.permission.codename,
-                            userperm.object_pk,
-                        )
-                        for userperm in UserObjectPermission.objects.filter(user=user)
-                    }
-
-                    per_object_perms = per_object_perms | {
-                        "{}.{}_{}".format(
-                            groupperm.content_type.app_label,
-                            groupperm.permission.codename,
-                            groupperm.object_pk,
-                        )
-                        for groupperm in GroupObjectPermission.objects.filter(
-                            group__in=user.groups.all()
-                        )
-                    }
-                    user._viewflow_per_object_perm_cache = per_object_perms
-
-                has_permission = (
-                    has_permission
-                    | Q(owner_permission__in=all_user_perms)
-                    | Q(owner_permission_obj_check__in=per_object_perms)
-                )
-            else:
-                has_permission = (
-                    Q(owner_permission__in=user.get_all_permissions()) | has_permission
+            queryset = queryset.filter(flow_class=flow_class)
+
+        if not user.is_superuser and candidates.is_enabled(self.model):
+            queryset = queryset.filter(
+                Q(owner_permission__isnull=True)
+                | Q(owner=user)
+                | candidates.candidate_filter(user)
+            )
+        elif not user.is_superuser:
+            snapshot = get_permission_snapshot(user)
+            has_permission = (
+                Q(owner_permission__isnull=True)
+                | Q(owner=user)
+                | Q(owner_permission__in=snapshot.perms)
+            )
+            if snapshot.object_perms:
+                has_permission |= Q(
+                    owner_permission_obj_check__in=snapshot.object_perms
                 )
 
             queryset = queryset.filter(has_permission)
@@ -223,7 +255,7 @@ class TaskQuerySet(QuerySet):
         queryset = self.filter(flow_task_type="HUMAN")
 
         if flow_class is not None:
-            queryset = queryset.filter(process__flow_class=flow_class)
+            queryset = queryset.filter(flow_class=flow_class)
 
         return queryset.filter(owner=user, finished__isnull=False)
 
@@ -251,6 +283,14 @@ class TaskQuerySet(QuerySet):
             owner=user, finished__isnull=False
         )
 
+    def bulk_assign(self, user, chunk_size=500):
+        """Assign the tasks to the user, see `viewflow.workflow.bulk`."""
+        return bulk.assign(self, user, chunk_size=chunk_size)
+
+    def bulk_unassign(self, user, chunk_size=500):
+        """Unassign the tasks on behalf of the user, see `viewflow.workflow.bulk`."""
+        return bulk.unassign(self, user, chunk_size=chunk_size)
+
     def next_user_task(self, process, user):
         """
         Lookup for the next task for a user execution.
@@ -283,8 +323,20 @@ class TaskQuerySet(QuerySet):
 
         return task
 
+    def _fetch_all(self):
+        prefetch = self._result_cache is None
+        super()._fetch_all()
+        if prefetch and getattr(self, "_prefetch_coerced", False):
+            prefetch_coerced_processes(
+                task.process
+                for task in self._result_cache
+                if isinstance(task, self.model)
+            )
+
     def _chain(self, **kwargs):
         chained = super()._chain(**kwargs)
         if hasattr(self, "_coerced"):
             chained._coerced = self._coerced
+        if hasattr(self, "_prefetch_coerced"):
+            chained._prefetch_coerced = self._prefetch_coerced
         return chained
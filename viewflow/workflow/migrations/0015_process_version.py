@@ -0,0 +1,20 @@
+# Generated by Django 5.0.7 on 2026-10-18 18:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0014_alter_process_parent_task"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="process",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Version"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0015_process_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["process", "token"],
+                name="viewflow_task_token_idx",
+                opclasses=["", "varchar_pattern_ops"],
+            ),
+        ),
+    ]
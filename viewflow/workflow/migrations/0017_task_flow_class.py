@@ -0,0 +1,56 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:19
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+import viewflow.workflow.fields
+
+
+def copy_flow_class(apps, schema_editor):
+    Process = apps.get_model("viewflow", "Process")
+    Task = apps.get_model("viewflow", "Task")
+    Task.objects.update(
+        flow_class=Subquery(
+            Process.objects.filter(pk=OuterRef("process_id")).values("flow_class")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0016_task_token_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="flow_class",
+            field=viewflow.workflow.fields.FlowReferenceField(
+                blank=True, max_length=250, null=True, verbose_name="Flow"
+            ),
+        ),
+        migrations.RunPython(copy_flow_class, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["owner", "status", "-created"], name="viewflow_task_inbox_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("flow_task_type", "HUMAN"), ("status", "NEW")),
+                fields=["flow_class", "-created"],
+                name="viewflow_task_queue_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("finished__isnull", False)),
+                fields=["owner", "-created"],
+                name="viewflow_task_archive_idx",
+            ),
+        ),
+    ]
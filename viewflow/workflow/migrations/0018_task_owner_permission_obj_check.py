@@ -0,0 +1,39 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:23
+
+from django.db import migrations, models
+from django.db.models import F, Value
+from django.db.models.functions import Concat
+
+
+def fill_owner_permission_obj_check(apps, schema_editor):
+    Task = apps.get_model("viewflow", "Task")
+    Task.objects.filter(
+        owner_permission__isnull=False, owner_permission_obj_pk__isnull=False
+    ).exclude(owner_permission="").update(
+        owner_permission_obj_check=Concat(
+            F("owner_permission"),
+            Value("_"),
+            F("owner_permission_obj_pk"),
+            output_field=models.CharField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0017_task_flow_class"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="owner_permission_obj_check",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=511, null=True
+            ),
+        ),
+        migrations.RunPython(
+            fill_owner_permission_obj_check, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0019_taskcandidate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="process",
+            name="brief_text",
+            field=models.TextField(
+                blank=True, editable=False, null=True, verbose_name="Brief"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="brief_text",
+            field=models.TextField(
+                blank=True, editable=False, null=True, verbose_name="Brief"
+            ),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0020_brief_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=50, verbose_name="Kind")),
+                ("payload", models.JSONField(default=dict, verbose_name="Payload")),
+                (
+                    "dedup_key",
+                    models.CharField(
+                        blank=True, max_length=255, null=True, verbose_name="Dedup key"
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Created"
+                    ),
+                ),
+                (
+                    "available",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Available"
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="Attempts"),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, null=True, verbose_name="Last error"),
+                ),
+            ],
+            options={
+                "verbose_name": "Outbox message",
+                "verbose_name_plural": "Outbox messages",
+                "indexes": [
+                    models.Index(fields=["available", "id"], name="viewflow_outbox_idx")
+                ],
+            },
+        ),
+    ]
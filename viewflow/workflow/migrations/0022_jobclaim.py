@@ -0,0 +1,66 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viewflow", "0021_outboxmessage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobClaim",
+            fields=[
+                (
+                    "task",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="job_claim",
+                        serialize=False,
+                        to="viewflow.task",
+                        verbose_name="Task",
+                    ),
+                ),
+                ("worker", models.CharField(max_length=255, verbose_name="Worker")),
+                (
+                    "claimed",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Claimed"
+                    ),
+                ),
+                (
+                    "heartbeat",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Heartbeat"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Job claim",
+                "verbose_name_plural": "Job claims",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(
+                    ("flow_task_type__in", ["FUNCTION", "JOB"]), ("status", "SCHEDULED")
+                ),
+                fields=["created"],
+                name="viewflow_task_job_queue_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobclaim",
+            index=models.Index(fields=["worker"], name="viewflow_jobclaim_worker_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="jobclaim",
+            index=models.Index(fields=["heartbeat"], name="viewflow_jobclaim_beat_idx"),
+        ),
+    ]
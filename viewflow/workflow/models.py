@@ -5,15 +5,21 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
-from django.template import Template, Context
+from django.db.models import prefetch_related_objects
+from django.template import Context
 from django.utils import timezone
-from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
 from .fields import FlowReferenceField, TaskReferenceField, TokenField
-from .managers import ProcessQuerySet, TaskQuerySet, coerce_to_related_instance
+from .managers import (
+    ProcessQuerySet,
+    TaskQuerySet,
+    coerce_to_related_instance,
+    prefetch_coerced_processes,
+    prefetch_coerced_tasks,
+)
 from .token import Token
-from . import status
+from . import briefs, status
 
 
 class AbstractProcess(models.Model):
@@ -30,6 +36,12 @@ class AbstractProcess(models.Model):
     created = models.DateTimeField(_("Created"), default=timezone.now)
     finished = models.DateTimeField(_("Finished"), blank=True, null=True)
 
+    # changed by lock.OptimisticLock only
+    version = models.PositiveIntegerField(_("Version"), default=0, editable=False)
+
+    # the rendered brief, kept if VIEWFLOW["BRIEF_TEXT"] is enabled
+    brief_text = models.TextField(_("Brief"), blank=True, editable=False, null=True)
+
     objects = ProcessQuerySet.as_manager()
 
     class Meta:
@@ -40,30 +52,59 @@ class AbstractProcess(models.Model):
             return "{} #{}".format(self.flow_class.process_title, self.pk)
         return "<Process {}> - {}".format(self.pk, self.status)
 
+    def save(self, *args, **kwargs):  # noqa D102
+        lock_impl = getattr(self.flow_class, "lock_impl", None)
+        get_update_fields = getattr(lock_impl, "get_update_fields", None)
+        if (
+            get_update_fields is not None
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+            and not args
+        ):
+            kwargs["update_fields"] = get_update_fields(self)
+        super().save(*args, **kwargs)
+
     @property
     def brief(self):
         """Quick textual process state representation for end user."""
         if self.flow_class is None:
             return None
 
-        template_content = ""
-
-        if self.finished:
-            template_content = self.flow_class.process_result_template
+        if "_brief" in self.__dict__:
+            return self._brief
 
-        if not template_content:
-            template_content = self.flow_class.process_summary_template
+        if self.brief_text is not None and briefs.is_enabled():
+            return self.brief_text
 
-        if not template_content:
-            template_content = self.flow_class.process_description
+        return self.render_brief()
 
-        if not template_content:
-            template_content = "{{ flow_class.process_title }} - {{ process.status }}"
-
-        return Template(force_str(template_content)).render(
+    def render_brief(self):
+        """Render the process brief template."""
+        template = self.flow_class.get_brief_template(finished=bool(self.finished))
+        return template.render(
             Context({"process": self.coerced, "flow_class": self.flow_class})
         )
 
+    @classmethod
+    def render_briefs(cls, processes):
+        """
+        Render briefs of a list page processes.
+
+        Process subclass instances are fetched in bulk, and the rendered
+        briefs are kept on the processes for the `brief` lookups.
+        """
+        processes = list(processes)
+        rendering = [
+            process
+            for process in processes
+            if process.flow_class is not None and not briefs.is_stored(process)
+        ]
+        prefetch_coerced_processes(rendering)
+        for process in rendering:
+            process._brief = process.render_brief()
+        return [process.brief for process in processes]
+
     @property
     def coerced(self):
         """Return process instance of flow_class type."""
@@ -82,6 +123,7 @@ class AbstractTask(models.Model):
 
     """
 
+    flow_class = FlowReferenceField(_("Flow"), blank=True, null=True)
     flow_task = TaskReferenceField(_("Task"))
     flow_task_type = models.CharField(_("Type"), max_length=50)
     status = models.CharField(
@@ -143,6 +185,14 @@ class AbstractTask(models.Model):
         for_concrete_model=False,
     )
 
+    # "{owner_permission}_{owner_permission_obj_pk}" for per-object queue lookups
+    owner_permission_obj_check = models.CharField(
+        blank=True, db_index=True, editable=False, max_length=511, null=True
+    )
+
+    # the rendered brief, kept if VIEWFLOW["BRIEF_TEXT"] is enabled
+    brief_text = models.TextField(_("Brief"), blank=True, editable=False, null=True)
+
     objects = TaskQuerySet.as_manager()
 
     class Meta:
@@ -157,9 +207,17 @@ class AbstractTask(models.Model):
     def save(self, *args, **kwargs):  # noqa D102
         if self.flow_task and not self.flow_task_type:
             self.flow_task_type = self.flow_task.task_type
+        if self.flow_task and not self.flow_class:
+            self.flow_class = self.flow_task.flow_class
+        self.owner_permission_obj_check = self.get_owner_permission_obj_check()
 
         super(AbstractTask, self).save(*args, **kwargs)
 
+    def get_owner_permission_obj_check(self):
+        """Per-object permission required to assign the task."""
+        if self.owner_permission and self.owner_permission_obj_pk is not None:
+            return "{}_{}".format(self.owner_permission, self.owner_permission_obj_pk)
+
     @property
     def coerced(self):
         """Return task instance of flow_class type."""
@@ -191,24 +249,18 @@ class AbstractTask(models.Model):
         if not self.flow_task:
             return "< No flow_task assigned >"
 
-        template_content = ""
-
-        if self.finished:
-            template_content = self.flow_task.task_result_template
-
-        if not template_content:
-            template_content = self.flow_task.task_summary_template
-
-        if not template_content:
-            template_content = self.flow_task.task_description
+        if "_brief" in self.__dict__:
+            return self._brief
 
-        if not template_content:
-            template_content = self.flow_task.task_title
+        if self.brief_text is not None and briefs.is_enabled():
+            return self.brief_text
 
-        if not template_content:
-            template_content = "{{ flow_task }}/{{ task.status }}"
+        return self.render_brief()
 
-        return Template(force_str(template_content)).render(
+    def render_brief(self):
+        """Render the task brief template."""
+        template = self.flow_task.get_brief_template(finished=bool(self.finished))
+        return template.render(
             Context(
                 {
                     "process": self.process.coerced,
@@ -219,6 +271,30 @@ class AbstractTask(models.Model):
             )
         )
 
+    @classmethod
+    def render_briefs(cls, tasks, processes=False):
+        """
+        Render briefs of a list page tasks, and of their processes if requested.
+
+        Task processes and subclass instances are fetched in bulk, and the
+        rendered briefs are kept on the instances for the `brief` lookups.
+        """
+        tasks = list(tasks)
+        rendering = [
+            task
+            for task in tasks
+            if task.flow_task is not None and not briefs.is_stored(task)
+        ]
+        prefetch_related_objects(tasks, "process")
+        if processes:
+            AbstractProcess.render_briefs([task.process for task in tasks])
+
+        prefetch_coerced_tasks(rendering)
+        prefetch_coerced_processes(task.process for task in rendering)
+        for task in rendering:
+            task._brief = task.render_brief()
+        return [task.brief for task in tasks]
+
     @contextmanager
     def activation(self):
         """
@@ -320,6 +396,134 @@ class Task(AbstractTask):
         verbose_name = _("Task")
         verbose_name_plural = _("Tasks")
         ordering = ["-created"]
+        indexes = [
+            # split/join lookups by the token prefix within a process
+            models.Index(
+                fields=["process", "token"],
+                name="viewflow_task_token_idx",
+                opclasses=["", "varchar_pattern_ops"],
+            ),
+            # inbox
+            models.Index(
+                fields=["owner", "status", "-created"],
+                name="viewflow_task_inbox_idx",
+            ),
+            # queue
+            models.Index(
+                fields=["flow_class", "-created"],
+                name="viewflow_task_queue_idx",
+                condition=models.Q(status=status.STATUS.NEW, flow_task_type="HUMAN"),
+            ),
+            # archive
+            models.Index(
+                fields=["owner", "-created"],
+                name="viewflow_task_archive_idx",
+                condition=models.Q(finished__isnull=False),
+            ),
+            # database job queue
+            models.Index(
+                fields=["created"],
+                name="viewflow_task_job_queue_idx",
+                condition=models.Q(
+                    status=status.STATUS.SCHEDULED,
+                    flow_task_type__in=["FUNCTION", "JOB"],
+                ),
+            ),
+        ]
 
     def reverse(self, view_name: str, *args: List[Any]) -> str:
         return self.flow_task.reverse(view_name, args=[self.process_id, self.pk, *args])
+
+
+class TaskCandidate(models.Model):
+    """
+    A user or a group permitted to assign the task from the queue.
+
+    Enabled by the `VIEWFLOW["TASK_CANDIDATES"]` setting, see
+    `viewflow.workflow.candidates`.
+    """
+
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name="candidates",
+        verbose_name=_("Task"),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        blank=True,
+        db_index=False,
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("User"),
+    )
+    group = models.ForeignKey(
+        "auth.Group",
+        blank=True,
+        db_index=False,
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Group"),
+    )
+
+    class Meta:  # noqa D101
+        verbose_name = _("Task candidate")
+        verbose_name_plural = _("Task candidates")
+        indexes = [
+            models.Index(fields=["user", "task"]),
+            models.Index(fields=["group", "task"]),
+        ]
+
+
+class OutboxMessage(models.Model):
+    """
+    A job or a flow event, waiting for the delivery after the commit.
+
+    Enabled by the `VIEWFLOW["OUTBOX"]` setting, see
+    `viewflow.workflow.outbox`.
+    """
+
+    kind = models.CharField(_("Kind"), max_length=50)
+    payload = models.JSONField(_("Payload"), default=dict)
+    dedup_key = models.CharField(_("Dedup key"), max_length=255, blank=True, null=True)
+    created = models.DateTimeField(_("Created"), default=timezone.now)
+    available = models.DateTimeField(_("Available"), default=timezone.now)
+    attempts = models.PositiveIntegerField(_("Attempts"), default=0)
+    last_error = models.TextField(_("Last error"), blank=True, null=True)
+
+    class Meta:  # noqa D101
+        verbose_name = _("Outbox message")
+        verbose_name_plural = _("Outbox messages")
+        indexes = [
+            models.Index(fields=["available", "id"], name="viewflow_outbox_idx"),
+        ]
+
+
+class JobClaim(models.Model):
+    """
+    A scheduled job taken by a `viewflow_worker`.
+
+    A delayed retry is kept as a claim without a worker, with the retry
+    time as the heartbeat. See `viewflow.workflow.worker`.
+    """
+
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="job_claim",
+        verbose_name=_("Task"),
+    )
+    worker = models.CharField(_("Worker"), max_length=255)
+    claimed = models.DateTimeField(_("Claimed"), default=timezone.now)
+    heartbeat = models.DateTimeField(_("Heartbeat"), default=timezone.now)
+
+    class Meta:  # noqa D101
+        verbose_name = _("Job claim")
+        verbose_name_plural = _("Job claims")
+        indexes = [
+            models.Index(fields=["worker"], name="viewflow_jobclaim_worker_idx"),
+            models.Index(fields=["heartbeat"], name="viewflow_jobclaim_beat_idx"),
+        ]
@@ -4,7 +4,7 @@ from .end import End, EndActivation
 from .func import Function, FunctionActivation
 from .handle import Handle, HandleActivation
 from .if_gate import If, IfActivation
-from .job import AbstractJob, AbstractJobActivation
+from .job import AbstractJob, AbstractJobActivation, Job, JobActivation
 from .join import Join, JoinActivation
 from .obsolete import Obsolete, ObsoleteActivation
 from .split import Split, SplitActivation, SplitFirst
@@ -23,6 +23,8 @@ __all__ = (
     "HandleActivation",
     "If",
     "IfActivation",
+    "Job",
+    "JobActivation",
     "Join",
     "JoinActivation",
     "Obsolete",
@@ -2,20 +2,27 @@ from django.db import transaction
 from django.utils.timezone import now
 
 from viewflow import this
-from ..activation import Activation, has_manage_permission
+from ..activation import Activation, get_exception_data, has_manage_permission
 from ..base import Node
+from ..context import Context
 from ..status import STATUS
-from ..signals import task_started
+from ..signals import task_failed, task_started
+from ..utils import run_callback
 from . import mixins
 
 
-class FunctionActivation(mixins.NextNodeActivationMixin, Activation):
+class FunctionActivation(
+    mixins.RetryActivationMixin, mixins.NextNodeActivationMixin, Activation
+):
     """
     Handle  Activation.
 
-    Executes a callback immediately.
+    Executes a callback immediately. With a retry policy, the failed
+    callback is re-run by the job executor.
     """
 
+    bulk_cancel = True
+
     @Activation.status.super()
     def activate(self):
         """Perform the callback within current exception propagation strategy."""
@@ -24,10 +31,54 @@ class FunctionActivation(mixins.NextNodeActivationMixin, Activation):
             task_started.send(
                 sender=self.flow_class, process=self.process, task=self.task
             )
-            self.flow_task._func(self)
+            if self.flow_task._retry_policy is None:
+                run_callback(self.flow_task._func, self)
+                return
+
+            # roll back the failed attempt only, the task is retried
+            try:
+                with transaction.atomic(savepoint=True):
+                    run_callback(self.flow_task._func, self)
+            except Exception as exc:
+                if not self.can_retry(exc):
+                    self.task.finished = now()
+                    self.record_attempt(exc)
+                    raise
+                self.retry(exc)
+            else:
+                self.task.finished = now()
+                self.record_attempt()
+
+    @Activation.status.transition(source=STATUS.SCHEDULED, target=STATUS.STARTED)
+    def start(self):
+        """Start the retry of the scheduled task."""
+        self.task.started = now()
+        self.task.save()
+        task_started.send(sender=self.flow_class, process=self.process, task=self.task)
+
+    @Activation.status.transition(
+        source=[STATUS.NEW, STATUS.STARTED], target=STATUS.DONE
+    )
+    def complete(self):
+        super().complete.original()
+
+    @Activation.status.transition(source=STATUS.STARTED)
+    def execute(self):
+        """Complete the retried task, and activate next."""
+        self.complete()
+        with Context(propagate_exception=False):
+            self.activate_next()
+
+    @Activation.status.transition(source=STATUS.STARTED, target=STATUS.ERROR)
+    def error(self, exception):
+        """Keep the last retry failure."""
+        self.task.data["_exception"] = get_exception_data(exception)
+        self.task.finished = now()
+        self.task.save()
+        task_failed.send(sender=self.flow_class, process=self.process, task=self.task)
 
     @Activation.status.transition(
-        source=[STATUS.ERROR],
+        source=[STATUS.SCHEDULED, STATUS.ERROR],
         target=STATUS.CANCELED,
         permission=has_manage_permission,
     )
@@ -36,9 +87,13 @@ class FunctionActivation(mixins.NextNodeActivationMixin, Activation):
         self.task.save()
 
 
-class Function(mixins.NextNodeMixin, mixins.NodePermissionMixin, Node):
+class Function(
+    mixins.NextNodeMixin, mixins.NodePermissionMixin, mixins.NodeRetryMixin, Node
+):
     """
     Callback executed synchronously on a task activation.
+
+    The callback could be an `async def` function.
     """
 
     activation_class = FunctionActivation
@@ -66,3 +121,4 @@ class Function(mixins.NextNodeMixin, mixins.NodePermissionMixin, Node):
     def _resolve(self, instance):
         super()._resolve(instance)
         self._func = this.resolve(instance, self._func)
+        self._resolve_retry_policy()
@@ -4,10 +4,13 @@ from ..activation import Activation, leading_tasks_canceled
 from ..base import Node
 from ..status import STATUS
 from ..signals import task_started, task_finished
+from ..utils import run_callback, run_in_thread
 from . import mixins
 
 
 class HandleActivation(mixins.NextNodeActivationMixin, Activation):
+    bulk_cancel = True
+
     @Activation.status.super()
     def activate(self):
         """Do nothing on sync call"""
@@ -16,7 +19,7 @@ class HandleActivation(mixins.NextNodeActivationMixin, Activation):
     def run(self, func, **kwargs):
         self.task.started = now()
         task_started.send(sender=self.flow_class, process=self.process, task=self.task)
-        return func(self, **kwargs) if func else self.process
+        return run_callback(func, self, **kwargs) if func else self.process
 
     @Activation.status.transition(source=STATUS.STARTED, target=STATUS.DONE)
     def complete(self):
@@ -45,6 +48,9 @@ class HandleActivation(mixins.NextNodeActivationMixin, Activation):
 class Handle(mixins.NextNodeMixin, Node):
     """
     Task to be executed outside of the flow.
+
+    The callback could be an `async def` function. Use `await arun(task)`
+    from the async code.
     """
 
     task_type = "FUNCTION"
@@ -70,13 +76,15 @@ class Handle(mixins.NextNodeMixin, Node):
         self._undo_func = undo_func
 
     def _create_wrapper_function(self, origin_func, task):
+        def run_activation(**kwargs):
+            task.refresh_from_db()
+            activation = self.activation_class(task)
+            result = activation.run(origin_func, **kwargs)
+            activation.execute()
+            return result
+
         def func(**kwargs):
-            with self.flow_class.lock(task.process.pk):
-                task.refresh_from_db()
-                activation = self.activation_class(task)
-                result = activation.run(origin_func, **kwargs)
-                activation.execute()
-                return result
+            return self.flow_class.run_locked(task.process_id, run_activation, **kwargs)
 
         return func
 
@@ -84,3 +92,7 @@ class Handle(mixins.NextNodeMixin, Node):
         func = this.resolve(self.flow_class.instance, self._func)
         wrapper = self._create_wrapper_function(func, task)
         return wrapper(**kwargs)
+
+    async def arun(self, task, **kwargs):
+        """Async version of `run`, executed in a worker thread."""
+        return await run_in_thread(self.run, task, **kwargs)
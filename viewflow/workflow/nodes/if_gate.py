@@ -11,6 +11,8 @@ from . import mixins
 class IfActivation(Activation):
     """Conditionally activate one of outgoing nodes."""
 
+    bulk_cancel = True
+
     _condition_result = None
 
     @Activation.status.super()
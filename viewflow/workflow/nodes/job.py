@@ -1,39 +1,33 @@
-import json
-import traceback
 import uuid
 
 from django.utils import timezone
 
-from ..activation import Activation
+from viewflow import this
+from ..activation import Activation, get_exception_data, has_manage_permission
 from ..base import Node
 from ..context import Context
+from ..executors import schedule_job
 from ..fields import get_flow_ref
-from ..signals import task_failed
+from ..signals import task_failed, task_started
 from ..status import STATUS
 from . import mixins
 
 
-class AbstractJobActivation(mixins.NextNodeActivationMixin, Activation):
+class AbstractJobActivation(
+    mixins.RetryActivationMixin, mixins.NextNodeActivationMixin, Activation
+):
     @classmethod
-    def create(cls, flow_task, prev_activation, token, data=None, seed=None):
-        """Instantiate and persist new flow task."""
-        flow_class = flow_task.flow_class
-        task = flow_class.task_class(
-            process=prev_activation.process,
-            flow_task=flow_task,
-            token=token,
-            external_task_id=str(uuid.uuid4()),
-        )
-        task.data = data if data is not None else {}
-        task.seed = seed
-        task.save()
-        task.previous.add(prev_activation.task)
-        return cls(task)
+    def prepare(cls, flow_task, prev_activation, token, data=None, seed=None):
+        """Instantiate new flow task with an external task id."""
+        task = super().prepare(flow_task, prev_activation, token, data=data, seed=seed)
+        task.external_task_id = str(uuid.uuid4())
+        return task
 
     @Activation.status.transition(source=STATUS.SCHEDULED, target=STATUS.STARTED)
     def start(self):
         self.task.started = timezone.now()
         self.task.save()
+        task_started.send(sender=self.flow_class, process=self.process, task=self.task)
 
     @Activation.status.transition(source=STATUS.STARTED)
     def resume(self):
@@ -54,22 +48,7 @@ class AbstractJobActivation(mixins.NextNodeActivationMixin, Activation):
         if not self.task.data:
             self.task.data = {}
 
-        tb = exception.__traceback__
-        while tb.tb_next:
-            tb = tb.tb_next
-
-        try:
-            serialized_locals = json.dumps(
-                tb.tb_frame.f_locals, default=lambda obj: str(obj)
-            )
-        except Exception as ex:
-            serialized_locals = json.dumps({"_serialization_exception": str(ex)})
-
-        self.task.data["_exception"] = {
-            "title": str(exception),
-            "traceback": traceback.format_exc(),
-            "locals": json.loads(serialized_locals),
-        }
+        self.task.data["_exception"] = get_exception_data(exception)
         self.task.finished = timezone.now()
         self.task.save()
         task_failed.send(sender=self.flow_class, process=self.process, task=self.task)
@@ -78,7 +57,30 @@ class AbstractJobActivation(mixins.NextNodeActivationMixin, Activation):
         return f"{get_flow_ref(self.flow_class)}/{self.process.pk}/{self.task.pk}"
 
 
-class AbstractJob(mixins.NextNodeMixin, Node):
+class JobActivation(AbstractJobActivation):
+    """
+    Schedule the job, and hand it to the executor after the transaction commits.
+    """
+
+    bulk_cancel = True
+
+    @Activation.status.transition(source=STATUS.NEW, target=STATUS.SCHEDULED)
+    def activate(self):
+        self.task.data["_job"] = {"scheduled": timezone.now().isoformat()}
+        self.task.save()
+        schedule_job(self)
+
+    @Activation.status.transition(
+        source=[STATUS.SCHEDULED, STATUS.ERROR],
+        target=STATUS.CANCELED,
+        permission=has_manage_permission,
+    )
+    def cancel(self):
+        self.task.finished = timezone.now()
+        self.task.save()
+
+
+class AbstractJob(mixins.NextNodeMixin, mixins.NodeRetryMixin, Node):
     task_type = "JOB"
 
     shape = {
@@ -103,3 +105,23 @@ class AbstractJob(mixins.NextNodeMixin, Node):
     }
 
     bpmn_element = "scriptTask"
+
+    def _resolve(self, instance):
+        super()._resolve(instance)
+        self._resolve_retry_policy()
+
+
+class Job(AbstractJob):
+    """
+    Callback executed asynchronously by a job executor.
+    """
+
+    activation_class = JobActivation
+
+    def __init__(self, func, **kwargs):  # noqa D102
+        super().__init__(**kwargs)
+        self._func = func
+
+    def _resolve(self, instance):
+        super()._resolve(instance)
+        self._func = this.resolve(instance, self._func)
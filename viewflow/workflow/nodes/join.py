@@ -10,6 +10,8 @@ from . import mixins
 class JoinActivation(mixins.NextNodeActivationMixin, Activation):
     """Activation for parallel Join node."""
 
+    bulk_cancel = True
+
     type: str = "join"
 
     def __init__(self, *args, **kwargs):  # noqa D102
@@ -58,6 +60,7 @@ class JoinActivation(mixins.NextNodeActivationMixin, Activation):
 
         task.previous.add(prev_activation.task)
         activation = cls(task)
+        activation.arrive(prev_activation.task)
 
         return activation
 
@@ -94,30 +97,95 @@ class JoinActivation(mixins.NextNodeActivationMixin, Activation):
         for activation in activations:
             activation.cancel()
 
-    def is_done(self):
-        """
-        Check that process can be continued further.
+    def get_join_prefix(self, prev_task):
+        """Token prefix of the split, that the incoming task belongs to."""
+        return prev_task.token.get_common_split_prefix(self.task.token, prev_task.pk)
+
+    def count_branches(self, join_prefix):
+        """Number of the parallel branches started by the split."""
+        split_pk = join_prefix.rsplit("/", 1)[1][:-1]
+        return (
+            self.flow_class.task_class._default_manager.filter(
+                previous__pk=split_pk, token__prefix=join_prefix
+            )
+            .values("token")
+            .distinct()
+            .count()
+        )
 
-        Join check the all task state in db with the common token prefix.
+    def count_arrivals(self):
+        """
+        Recalculate the join state from the scratch.
 
-        Join node would continue execution if all incoming tasks are DONE or CANCELED.
+        Scans all incoming tasks. Used on the first arrival, and to recover
+        join tasks that have no arrival counters.
         """
-        join_prefixes = set(
-            prev.token.get_common_split_prefix(self.task.token, prev.pk)
-            for prev in self.task.previous.exclude(
-                status__in=[STATUS.CANCELED, STATUS.REVIVED]
-            ).all()
-        )
+        join_prefixes = set()
+        arrived, direct = 0, 0
+        for prev in self.task.previous.exclude(
+            status__in=[STATUS.CANCELED, STATUS.REVIVED]
+        ):
+            join_prefixes.add(self.get_join_prefix(prev))
+            arrived += 1
+            if prev.token == self.task.token:
+                direct += 1
 
         if len(join_prefixes) > 1:
             raise FlowRuntimeError(
                 f"Multiple tokens {join_prefixes} came to join { self.flow_task.name}"
             )
 
-        join_token_prefix = next(iter(join_prefixes))
+        join_prefix = next(iter(join_prefixes))
+        return {
+            "prefix": join_prefix,
+            "expected": self.count_branches(join_prefix) + direct,
+            "arrived": arrived,
+        }
+
+    def arrive(self, prev_task):
+        """
+        Count the incoming task.
+
+        Branch tasks are created by the split in advance, so the number of
+        expected arrivals is known on the join task creation. Each next
+        arrival only increments the counter stored in the join task data.
+
+        A split branch that goes directly to the join has no own task, and
+        counted as expected on arrival.
+        """
+        state = self.task.data.get("_join")
+        if state is None:
+            state = self.count_arrivals()
+        else:
+            join_prefix = self.get_join_prefix(prev_task)
+            if join_prefix != state["prefix"]:
+                raise FlowRuntimeError(
+                    f"Multiple tokens {set([state['prefix'], join_prefix])} "
+                    f"came to join { self.flow_task.name}"
+                )
+            state["arrived"] += 1
+            if prev_task.token == self.task.token:
+                state["expected"] += 1
+
+        self.task.data["_join"] = state
+        self.task.save(update_fields=["data"])
+
+    def is_done(self):
+        """
+        Check that process can be continued further.
+
+        Join would continue execution if all incoming tasks are DONE or
+        CANCELED. When all split branches came to the join, no database
+        lookup required. Otherwise, the join checks for any active task
+        with the common token prefix, since some branches could be
+        cancelled or finished by another path.
+        """
+        state = self.task.data.get("_join")
+        if state is None:
+            state = self.count_arrivals()
 
         active_tasks = self.flow_class.task_class._default_manager.filter(
-            process=self.process, token__startswith=join_token_prefix
+            process=self.process, token__prefix=state["prefix"]
         ).exclude(status__in=[STATUS.DONE, STATUS.CANCELED, STATUS.REVIVED])
 
         if self.flow_task._continue_on_condition:
@@ -126,6 +194,9 @@ class JoinActivation(mixins.NextNodeActivationMixin, Activation):
                 self.cancel_active_tasks(active_tasks)
                 return True
 
+        if state["arrived"] >= state["expected"]:
+            return True
+
         return not active_tasks.exists()
 
     @Activation.status.transition(
@@ -1,7 +1,16 @@
-from typing import Any, Callable, Dict, Optional
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.timezone import now
+
 from viewflow import this
+from viewflow.utils import DEFAULT
 
+from .. import outbox
 from ..activation import Activation
+from ..executors import get_executor, schedule_job
+from ..retry import RetryPolicy, exponential
 from ..status import STATUS
 from ..base import Edge
 
@@ -9,17 +18,22 @@ from ..base import Edge
 class NextNodeActivationMixin(object):
     """Mixin for an activation of node with NextNodeMixin."""
 
+    def get_next_tasks(self):
+        """List of (flow_task, token, data, seed) of the tasks to create next."""
+        if not self.flow_task._next:
+            return []
+
+        data, seed = {}, None
+        if self.flow_task._task_data:
+            data = self.flow_task._task_data(self)
+        if self.flow_task._task_seed:
+            seed = self.flow_task._task_seed(self)
+        return [(self.flow_task._next, self.task.token, data, seed)]
+
     @Activation.status.transition(source=STATUS.DONE)
     def create_next(self):
-        if self.flow_task._next:
-            data, seed = {}, None
-            if self.flow_task._task_data:
-                data = self.flow_task._task_data(self)
-            if self.flow_task._task_seed:
-                seed = self.flow_task._task_seed(self)
-            yield self.flow_task._next._create(
-                self, self.task.token, data=data, seed=seed
-            )
+        for flow_task, token, data, seed in self.get_next_tasks():
+            yield flow_task._create(self, token, data=data, seed=seed)
 
 
 class NextNodeMixin(object):
@@ -123,3 +137,121 @@ class NodePermissionMixin(object):
             self._owner_permission = "{}.{}".format(
                 self.flow_class.process_class._meta.app_label, self._owner_permission
             )
+
+
+class NodeExecutorMixin(object):
+    """Node mixin to select the executor of the node jobs."""
+
+    _executor = None
+
+    def Executor(self, executor):
+        """
+        Executor of the node jobs, an instance or an import path to it.
+
+        Overrides the `Flow.job_executor` and the `JOB_EXECUTOR` setting.
+        """
+        self._executor = executor
+        return self
+
+    def get_executor(self):
+        """Resolve the node, flow or the default executor."""
+        return get_executor(self._executor or self.flow_class.job_executor)
+
+
+class NodeRetryMixin(NodeExecutorMixin):
+    """Node mixin to re-run failed tasks by the job executor."""
+
+    _retry_policy = None
+
+    def Retry(
+        self,
+        max_attempts: int = 3,
+        backoff: Any = DEFAULT,
+        on: Tuple[Type[BaseException], ...] = (Exception,),
+    ):
+        """
+        Retry the failed task, instead of moving it to the ERROR state.
+
+        The default backoff is `retry.exponential`, or no delay for the
+        executors without the delays support. See `viewflow.workflow.retry`::
+
+            .Retry(max_attempts=5, backoff=retry.exponential, on=(TimeoutError,))
+        """
+        self._retry_policy = RetryPolicy(
+            max_attempts=max_attempts, backoff=backoff, on=on
+        )
+        return self
+
+    def _resolve_retry_policy(self):
+        """Check that the node executor could wait for the retry backoff."""
+        policy = self._retry_policy
+        if policy is None:
+            return
+
+        executor = self.get_executor()
+        can_delay = (
+            outbox.is_enabled()
+            or not getattr(executor, "submit_on_commit", True)
+            or getattr(executor, "supports_delay", True)
+        )
+        if policy.backoff is DEFAULT:
+            backoff = exponential if can_delay else None
+        elif policy.backoff and not can_delay:
+            raise ImproperlyConfigured(
+                "{} can't run jobs with a delay. Use `.Retry(backoff=None)`, an "
+                "executor with the delays support, or the outbox, for {}".format(
+                    type(executor).__name__, self
+                )
+            )
+        else:
+            backoff = policy.backoff
+        self._retry_policy = RetryPolicy(
+            max_attempts=policy.max_attempts, backoff=backoff, on=policy.on
+        )
+
+
+class RetryActivationMixin(object):
+    """Mixin for an activation of node with NodeRetryMixin."""
+
+    def can_retry(self, exception):
+        """Check that the failed task should be scheduled again."""
+        policy = self.flow_task._retry_policy
+        attempt = len(self.task.data.get("_attempts", [])) + 1
+        return policy is not None and policy.should_retry(attempt, exception)
+
+    def record_attempt(self, exception=None, delay=None):
+        """Store the attempt timings, for nodes with a retry policy."""
+        if self.flow_task._retry_policy is None:
+            return
+
+        attempts = self.task.data.setdefault("_attempts", [])
+        attempt = {
+            "attempt": len(attempts) + 1,
+            "started": self.task.started.isoformat(),
+            "finished": self.task.finished.isoformat(),
+            "duration": (self.task.finished - self.task.started).total_seconds(),
+        }
+        if exception is not None:
+            attempt["error"] = "{}: {}".format(type(exception).__name__, exception)
+        if delay is not None:
+            attempt["delay"] = delay
+        attempts.append(attempt)
+
+    @Activation.status.transition(
+        source=[STATUS.NEW, STATUS.STARTED], target=STATUS.SCHEDULED
+    )
+    def retry(self, exception):
+        """Schedule the failed task to run again, after the backoff delay."""
+        delay = self.flow_task._retry_policy.get_delay(
+            len(self.task.data.get("_attempts", [])) + 1
+        )
+        if self.task.finished is None:
+            self.task.finished = now()
+        self.record_attempt(exception, delay=delay)
+
+        self.task.started = None
+        self.task.finished = None
+        self.task.external_task_id = str(uuid.uuid4())
+        self.task.data["_job"] = {"scheduled": now().isoformat()}
+        self.task.save()
+        schedule_job(self, delay=delay)
@@ -2,7 +2,7 @@ from django.db import connection
 from django.utils.timezone import now
 from viewflow import this
 
-from ..activation import Activation
+from ..activation import Activation, create_tasks
 from ..exceptions import FlowRuntimeError
 from ..signals import task_finished
 from ..status import STATUS
@@ -39,6 +39,8 @@ class SplitActivation(Activation):
 
         Each task would have a new execution token attached,
         the Split task token as a common prefix.
+
+        Tasks of all branches are created in bulk.
         """
         token_source = Token.split_token_source(self.task.token, self.task.pk)
 
@@ -46,10 +48,13 @@ class SplitActivation(Activation):
             (task, data) for task, data in self.next_tasks if not isinstance(task, Join)
         ] + [(task, data) for task, data in self.next_tasks if isinstance(task, Join)]
 
-        for n, (next_task, data) in enumerate(next_tasks, 1):
-            yield next_task._create(
-                prev_activation=self, token=next(token_source), data=data
-            )
+        yield from create_tasks(
+            self,
+            [
+                (next_task, next(token_source), data, None)
+                for next_task, data in next_tasks
+            ],
+        )
 
 
 class Split(
@@ -144,6 +149,8 @@ class SplitFirstActivation(SplitActivation):
     the remaining tasks are cancelled.
     """
 
+    bulk_cancel = True
+
     @Activation.status.transition(source=STATUS.NEW, target=STATUS.STARTED)
     def activate(self):
         self.task.started = now()
@@ -1,11 +1,19 @@
+from django.db import connection, transaction
 from django.utils.timezone import now
 
 from viewflow import this
 from viewflow.utils import is_owner
 from ..base import Node
-from ..activation import Activation, leading_tasks_canceled, has_manage_permission
+from ..activation import (
+    Activation,
+    can_bulk_insert,
+    create_task_waves,
+    has_manage_permission,
+    leading_tasks_canceled,
+)
 from ..status import STATUS, PROCESS
 from ..signals import task_started, task_finished, flow_started
+from ..utils import run_callback, run_in_thread
 from . import mixins
 
 
@@ -18,7 +26,9 @@ class StartActivation(mixins.NextNodeActivationMixin, Activation):
 
         process = flow_class.process_class(flow_class=flow_class)
         task = flow_class.task_class(
+            flow_class=flow_class,
             flow_task=flow_task,
+            flow_task_type=flow_task.task_type,
             process=process,
             started=now(),
         )
@@ -39,6 +49,56 @@ class StartActivation(mixins.NextNodeActivationMixin, Activation):
             )
             self.activate_next()
 
+    @classmethod
+    def execute_many(cls, activations):
+        """
+        Execute the start activations, with processes and tasks inserted in bulk.
+
+        New processes are not visible to other transactions until the commit,
+        so the flow lock is not acquired. The next tasks of all processes are
+        inserted together, then activated process by process.
+        """
+        assert connection.in_atomic_block
+        if not activations:
+            return
+
+        flow_class = activations[0].flow_class
+        for activation in activations:
+            task_started.send(
+                sender=flow_class, process=activation.process, task=activation.task
+            )
+
+        processes = [activation.process for activation in activations]
+        if can_bulk_insert(flow_class.process_class):
+            flow_class.process_class._default_manager.bulk_create(processes)
+        else:
+            for process in processes:
+                process.save()
+
+        tasks = [activation.task for activation in activations]
+        for activation in activations:
+            activation.task.status = STATUS.DONE
+            activation.task.finished = now()
+        if can_bulk_insert(flow_class.task_class):
+            flow_class.task_class._default_manager.bulk_create(tasks)
+        else:
+            for task in tasks:
+                task.save()
+
+        for activation in activations:
+            task_finished.send(
+                sender=flow_class, process=activation.process, task=activation.task
+            )
+            flow_started.send(
+                sender=flow_class, process=activation.process, task=activation.task
+            )
+
+        waves = create_task_waves(
+            [(activation, activation.get_next_tasks()) for activation in activations]
+        )
+        for activation, next_activations in zip(activations, waves):
+            activation._activate_next(set(next_activations))
+
 
 class StartHandleActivation(StartActivation):
     @Activation.status.transition(
@@ -186,20 +246,26 @@ class StartHandle(mixins.NextNodeMixin, Node):
         self._func = func
         self._undo_func = undo_func
 
-    def _create_wrapper_function(self, origin_func):
-        def func(**kwargs):
-            activation = self.activation_class.create(self, None, None)
+    def _create_activation(self, origin_func, kwargs):
+        activation = self.activation_class.create(self, None, None)
 
-            # link subprocess to a parent process
-            activation.process.parent_task = kwargs.pop("_parent_task", None)
-            activation.process.data = kwargs.pop("_process_data", {})
-            activation.process.seed = kwargs.pop("_process_seed", None)
-            activation.task.data = kwargs.pop("_task_data", {})
-            activation.task.seed = kwargs.pop("_task_seed", None)
+        # link subprocess to a parent process
+        activation.process.parent_task = kwargs.pop("_parent_task", None)
+        activation.process.data = kwargs.pop("_process_data", {})
+        activation.process.seed = kwargs.pop("_process_seed", None)
+        activation.task.data = kwargs.pop("_task_data", {})
+        activation.task.seed = kwargs.pop("_task_seed", None)
 
-            result = (
-                origin_func(activation, **kwargs) if origin_func else activation.process
-            )
+        result = (
+            run_callback(origin_func, activation, **kwargs)
+            if origin_func
+            else activation.process
+        )
+        return activation, result
+
+    def _create_wrapper_function(self, origin_func):
+        def func(**kwargs):
+            activation, result = self._create_activation(origin_func, kwargs)
             activation.execute()
             return result
 
@@ -209,3 +275,39 @@ class StartHandle(mixins.NextNodeMixin, Node):
         func = this.resolve(self.flow_class.instance, self._func)
         wrapper = self._create_wrapper_function(func)
         return wrapper(**kwargs)
+
+    async def arun(self, **kwargs):
+        """Async version of `run`, executed in a worker thread."""
+        return await run_in_thread(self.run, **kwargs)
+
+    def run_many(self, items, chunk_size=100):
+        """
+        Start a process for each of the `run` keyword arguments in `items`.
+
+        Processes and start tasks of a chunk are inserted in bulk, and the
+        following tasks are inserted in bulk too. Signals are sent for each
+        process, same as for `run`. Each chunk is executed in a separate
+        transaction.
+
+        Returns the list of started processes.
+        """
+        func = this.resolve(self.flow_class.instance, self._func)
+
+        processes, chunk = [], []
+        for kwargs in items:
+            chunk.append(kwargs)
+            if len(chunk) == chunk_size:
+                processes.extend(self._run_chunk(func, chunk))
+                chunk = []
+        if chunk:
+            processes.extend(self._run_chunk(func, chunk))
+        return processes
+
+    def _run_chunk(self, origin_func, chunk):
+        with transaction.atomic():
+            activations = [
+                self._create_activation(origin_func, dict(kwargs))[0]
+                for kwargs in chunk
+            ]
+            self.activation_class.execute_many(activations)
+        return [activation.process for activation in activations]
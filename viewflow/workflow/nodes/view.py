@@ -2,28 +2,23 @@ from django.utils.timezone import now
 
 from viewflow import this
 from viewflow.utils import is_owner
+from .. import candidates
 from ..base import Node
 from ..activation import Activation, has_manage_permission
 from ..status import STATUS
-from ..signals import task_started, task_finished
+from ..signals import task_changed, task_started, task_finished
 from . import mixins
 
 
 class ViewActivation(mixins.NextNodeActivationMixin, Activation):
     """View node activation."""
 
-    @classmethod
-    def create(cls, flow_task, prev_activation, token, data=None, seed=None):
-        """Instantiate and persist new flow task."""
-        flow_class = flow_task.flow_class
-        task = flow_class.task_class(
-            process=prev_activation.process,
-            flow_task=flow_task,
-            token=token,
-        )
-        task.data = data if data is not None else {}
-        task.seed = seed
+    bulk_cancel = True
 
+    @classmethod
+    def prepare(cls, flow_task, prev_activation, token, data=None, seed=None):
+        """Instantiate new flow task with calculated owner and permissions."""
+        task = super().prepare(flow_task, prev_activation, token, data=data, seed=seed)
         activation = cls(task)
 
         # Try to assign permission
@@ -31,6 +26,7 @@ class ViewActivation(mixins.NextNodeActivationMixin, Activation):
         if owner_permission:
             task.owner_permission = owner_permission
             task.owner_permission_obj = flow_task.calc_owner_permission_obj(activation)
+            task.owner_permission_obj_check = task.get_owner_permission_obj_check()
 
         # Try to assign owner
         owner = flow_task.calc_owner(activation)
@@ -38,13 +34,23 @@ class ViewActivation(mixins.NextNodeActivationMixin, Activation):
             task.owner = owner
             task.status = STATUS.ASSIGNED
 
-        task.save()
-        task.previous.add(prev_activation.task)
+        return task
 
-        if flow_task._on_create is not None:
-            flow_task._on_create(activation)
+    @classmethod
+    def created(cls, task):
+        """Call the node `onCreate` callback for the persisted task."""
+        return cls.created_many([task])[0]
 
-        return activation
+    @classmethod
+    def created_many(cls, tasks):
+        """Add the candidates of the tasks at once, and call `onCreate`."""
+        if tasks and candidates.is_enabled(type(tasks[0])):
+            candidates.add_candidates(tasks)
+        activations = [cls(task) for task in tasks]
+        for activation in activations:
+            if activation.task.flow_task._on_create is not None:
+                activation.task.flow_task._on_create(activation)
+        return activations
 
     @Activation.status.transition(
         source=STATUS.NEW,
@@ -81,6 +87,7 @@ class ViewActivation(mixins.NextNodeActivationMixin, Activation):
         if user:
             self.task.owner = user
         self.task.save()
+        task_changed.send(sender=self.flow_class, process=self.process, task=self.task)
 
     @Activation.status.super()
     def activate(self):
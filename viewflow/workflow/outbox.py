@@ -0,0 +1,243 @@
+"""
+Transactional outbox of the job dispatch and the flow events.
+
+Flow signals are sent inside the transaction, and jobs are handed to the
+executor after the commit, so a side effect could happen for a rolled
+back transaction, and a job is lost if the process dies right after the
+commit. When enabled, jobs and flow events are saved as `OutboxMessage`
+rows in the same transaction as the task state, and delivered by a relay::
+
+    ./manage.py viewflow_relay_outbox --loop
+
+or from the code, with `deliver_pending()`.
+
+Jobs of the `DatabaseQueueExecutor` nodes are already kept in the
+database, and bypass the outbox.
+
+The delivery is at-least-once. A failed delivery is retried with a
+backoff. Messages with the same `external_task_id` are delivered once per
+batch, and a job delivered twice is skipped by the `run_job`.
+
+Flow events are recorded only when the `signals.flow_event` has
+receivers::
+
+    @receiver(flow_event)
+    def on_flow_event(sender, event, process, task, **kwargs):
+        if event == "task_finished":
+            ...
+
+The feature is enabled in the settings::
+
+    VIEWFLOW = {
+        'OUTBOX': True,
+    }
+"""
+
+import time
+import traceback
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .signals import (
+    flow_event,
+    flow_finished,
+    flow_started,
+    task_failed,
+    task_finished,
+    task_started,
+)
+
+JOB = "job"
+EVENTS = {
+    "flow_started": flow_started,
+    "flow_finished": flow_finished,
+    "task_started": task_started,
+    "task_failed": task_failed,
+    "task_finished": task_finished,
+}
+MAX_BACKOFF = 3600
+
+
+def is_enabled():
+    """Check that jobs and flow events are delivered through the outbox."""
+    from viewflow.conf import settings as viewflow_settings
+
+    return viewflow_settings.OUTBOX
+
+
+def enqueue_job(job, delay=None):
+    """Save the job for the delivery to the executor, in `delay` seconds if given."""
+    from .models import OutboxMessage
+
+    available = timezone.now()
+    if delay:
+        available += timedelta(seconds=delay)
+    return OutboxMessage.objects.create(
+        kind=JOB,
+        payload=job,
+        dedup_key=job.get("external_task_id"),
+        available=available,
+    )
+
+
+def _is_saved(process, task):
+    return process.pk is not None and (task is None or task.pk is not None)
+
+
+def enqueue_event(event, flow_class, process, task):
+    """
+    Save the flow event for the delivery to the `flow_event` receivers.
+
+    The start node sends `task_started` before the process and the task
+    are saved. Events of unsaved objects are kept on the process instance,
+    and saved with the next event of the process, in the same transaction.
+    Returns the saved messages.
+    """
+    from .fields import get_flow_ref
+    from .models import OutboxMessage
+
+    pending = process.__dict__.setdefault("_outbox_pending", [])
+    pending.append((event, flow_class, task))
+    if not _is_saved(process, task):
+        return []
+
+    ready = [item for item in pending if _is_saved(process, item[2])]
+    pending[:] = [item for item in pending if item not in ready]
+    return [
+        OutboxMessage.objects.create(
+            kind=kind,
+            payload={
+                "flow_class": get_flow_ref(sender),
+                "process_pk": process.pk,
+                "task_pk": item_task.pk if item_task is not None else None,
+            },
+        )
+        for kind, sender, item_task in ready
+    ]
+
+
+def _deliver_job(payload):
+    from .fields import import_task_by_ref
+
+    flow_task = import_task_by_ref(payload["task"])
+    flow_task.get_executor().submit(payload)
+
+
+def _get_event_objects(messages):
+    """Coerced processes and tasks of the events, by flow class and pk."""
+    from .fields import import_flow_by_ref
+
+    pks = defaultdict(lambda: (set(), set()))
+    for message in messages:
+        process_pks, task_pks = pks[message.payload["flow_class"]]
+        process_pks.add(message.payload["process_pk"])
+        if message.payload["task_pk"] is not None:
+            task_pks.add(message.payload["task_pk"])
+
+    objects = {}
+    for flow_ref, (process_pks, task_pks) in pks.items():
+        flow_class = import_flow_by_ref(flow_ref)
+        processes = flow_class.process_class._default_manager.in_bulk(process_pks)
+        tasks = flow_class.task_class._default_manager.in_bulk(task_pks)
+        objects[flow_ref] = flow_class, processes, tasks
+    return objects
+
+
+def _deliver_event(message, objects):
+    flow_class, processes, tasks = objects[message.payload["flow_class"]]
+    flow_event.send(
+        sender=flow_class,
+        event=message.kind,
+        process=processes.get(message.payload["process_pk"]),
+        task=tasks.get(message.payload["task_pk"]),
+    )
+
+
+def deliver_batch(batch_size=100):
+    """Deliver the batch of pending messages, and return the delivered count."""
+    return _deliver_batch(batch_size)[1]
+
+
+def _deliver_batch(batch_size):
+    from .models import OutboxMessage
+
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.filter(available__lte=timezone.now())
+            .select_for_update(skip_locked=True)
+            .order_by("available", "pk")[:batch_size]
+        )
+        if not messages:
+            return 0, 0
+
+        objects = _get_event_objects(
+            [message for message in messages if message.kind != JOB]
+        )
+
+        delivered, failed, seen = [], [], set()
+        for message in messages:
+            if message.dedup_key is not None:
+                if (message.kind, message.dedup_key) in seen:
+                    delivered.append(message.pk)
+                    continue
+                seen.add((message.kind, message.dedup_key))
+
+            try:
+                with transaction.atomic(savepoint=True):
+                    if message.kind == JOB:
+                        _deliver_job(message.payload)
+                    else:
+                        _deliver_event(message, objects)
+            except Exception:
+                message.attempts += 1
+                message.last_error = traceback.format_exc()
+                message.available = timezone.now() + timedelta(
+                    seconds=min(2**message.attempts, MAX_BACKOFF)
+                )
+                failed.append(message)
+            else:
+                delivered.append(message.pk)
+
+        OutboxMessage.objects.filter(pk__in=delivered).delete()
+        OutboxMessage.objects.bulk_update(
+            failed, ["attempts", "last_error", "available"]
+        )
+    return len(messages), len(delivered)
+
+
+def deliver_pending(batch_size=100, loop=False, interval=1.0):
+    """
+    Deliver batches until no pending messages left, and return the count.
+
+    With `loop=True`, keep polling for the new messages every `interval`
+    seconds.
+    """
+    count = 0
+    while True:
+        processed, delivered = _deliver_batch(batch_size)
+        count += delivered
+        if processed:
+            continue
+        if not loop:
+            return count
+        time.sleep(interval)
+
+
+def _on_flow_signal(event):
+    def receiver(sender, process, task=None, **kwargs):
+        if is_enabled() and flow_event.has_listeners(sender):
+            enqueue_event(event, sender, process, task)
+
+    return receiver
+
+
+_receivers = {event: _on_flow_signal(event) for event in EVENTS}
+
+
+def connect_signals():
+    """Record flow events in the outbox."""
+    for event, signal in EVENTS.items():
+        signal.connect(_receivers[event], dispatch_uid="viewflow-outbox-" + event)
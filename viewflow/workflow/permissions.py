@@ -0,0 +1,179 @@
+"""
+Shared cache of user permissions for the task queue lookups.
+
+`TaskQuerySet.user_queue` needs all model and per-object permissions of
+a user. The permission snapshot is computed once, and kept in the Django
+cache under a key with a version stamp. The stamp is changed on user,
+group and permission changes, so an outdated snapshot is never read.
+
+The cache is disabled by default, and could be enabled in the settings::
+
+    VIEWFLOW = {
+        'PERMISSION_CACHE': 'default',  # None to disable
+    }
+
+The stamps are changed in the cache itself, so the cache backend should
+be shared by all server processes, like Redis or Memcached. With the
+per-process `LocMemCache`, other processes keep serving revoked
+permissions until the cache timeout.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+GLOBAL_VERSION_KEY = "viewflow-perms-version"
+USER_VERSION_KEY = "viewflow-perms-version-{}"
+SNAPSHOT_KEY = "viewflow-perms-{}-{}-{}"
+
+
+class PermissionSnapshot(object):
+    """Model and per-object permissions of a user."""
+
+    def __init__(self, perms, object_perms):  # noqa D102
+        self.perms = frozenset(perms)
+        # "app_label.codename_objectpk", as `Task.owner_permission_obj_check`
+        self.object_perms = frozenset(object_perms)
+
+
+def _get_cache():
+    from viewflow.conf import settings as viewflow_settings
+
+    cache_name = viewflow_settings.PERMISSION_CACHE
+    return caches[cache_name] if cache_name is not None else None
+
+
+def _get_object_perms(user):
+    from guardian.models import GroupObjectPermission, UserObjectPermission
+
+    fields = ["content_type__app_label", "permission__codename", "object_pk"]
+    user_perms = UserObjectPermission.objects.filter(user=user).values_list(*fields)
+    group_perms = GroupObjectPermission.objects.filter(
+        group__in=user.groups.all()
+    ).values_list(*fields)
+
+    return {
+        "{}.{}_{}".format(app_label, codename, object_pk)
+        for perms in [user_perms, group_perms]
+        for app_label, codename, object_pk in perms
+    }
+
+
+def build_permission_snapshot(user):
+    """Collect the user permissions from the database."""
+    object_perms = set()
+    if "guardian" in settings.INSTALLED_APPS:
+        object_perms = _get_object_perms(user)
+    return PermissionSnapshot(user.get_all_permissions(), object_perms)
+
+
+def _get_versions(cache, user_pk):
+    user_version_key = USER_VERSION_KEY.format(user_pk)
+    versions = cache.get_many([GLOBAL_VERSION_KEY, user_version_key])
+
+    missing = {
+        key: uuid.uuid4().hex
+        for key in [GLOBAL_VERSION_KEY, user_version_key]
+        if key not in versions
+    }
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+
+    return versions[GLOBAL_VERSION_KEY], versions[user_version_key]
+
+
+def get_permission_snapshot(user):
+    """Return the cached user permissions."""
+    cache = _get_cache()
+    if cache is None or user.pk is None:
+        return build_permission_snapshot(user)
+
+    key = SNAPSHOT_KEY.format(user.pk, *_get_versions(cache, user.pk))
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_permission_snapshot(user)
+        cache.set(key, snapshot)
+    return snapshot
+
+
+def invalidate_user_permissions(*user_pks):
+    """Outdate cached permissions of the users."""
+    cache = _get_cache()
+    if cache is not None:
+        cache.set_many(
+            {
+                USER_VERSION_KEY.format(user_pk): uuid.uuid4().hex
+                for user_pk in user_pks
+            },
+            None,
+        )
+
+
+def invalidate_all_permissions():
+    """Outdate cached permissions of all users."""
+    cache = _get_cache()
+    if cache is not None:
+        cache.set(GLOBAL_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def _on_user_changed(sender, instance, **kwargs):
+    invalidate_user_permissions(instance.pk)
+
+
+def _on_user_relation_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user_permissions(instance.pk)
+    elif pk_set:
+        invalidate_user_permissions(*pk_set)
+    else:
+        invalidate_all_permissions()
+
+
+def _on_group_relation_changed(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_all_permissions()
+
+
+def _on_object_permission_changed(sender, instance, **kwargs):
+    invalidate_user_permissions(instance.user_id)
+
+
+def _on_permission_changed(sender, **kwargs):
+    invalidate_all_permissions()
+
+
+def connect_signals():
+    """Invalidate cached permissions on the auth models changes."""
+    from django.apps import apps
+
+    if not apps.is_installed("django.contrib.auth"):
+        return
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group, Permission
+
+    user_model = get_user_model()
+    post_save.connect(_on_user_changed, sender=user_model)
+    post_delete.connect(_on_user_changed, sender=user_model)
+
+    for field_name in ["user_permissions", "groups"]:
+        field = getattr(user_model, field_name, None)
+        if field is not None:
+            m2m_changed.connect(_on_user_relation_changed, sender=field.through)
+
+    m2m_changed.connect(_on_group_relation_changed, sender=Group.permissions.through)
+    post_delete.connect(_on_permission_changed, sender=Group)
+    post_delete.connect(_on_permission_changed, sender=Permission)
+
+    if "guardian" in settings.INSTALLED_APPS:
+        from guardian.models import GroupObjectPermission, UserObjectPermission
+
+        post_save.connect(_on_object_permission_changed, sender=UserObjectPermission)
+        post_delete.connect(_on_object_permission_changed, sender=UserObjectPermission)
+        post_save.connect(_on_permission_changed, sender=GroupObjectPermission)
+        post_delete.connect(_on_permission_changed, sender=GroupObjectPermission)
@@ -0,0 +1,73 @@
+"""
+Retry policies of the Function and Job nodes.
+
+A failed task of a node with a retry policy is not moved to the `ERROR`
+state, but is scheduled again, and re-run in place by the node job
+executor after the backoff delay::
+
+    class MyFlow(flow.Flow):
+        fetch = (
+            flow.Function(this.fetch_rates)
+            .Retry(max_attempts=5, backoff=retry.exponential, on=(TimeoutError,))
+            .Next(this.end)
+        )
+
+Timings of each attempt are stored in the `task.data["_attempts"]`. The
+task is moved to the `ERROR` state after the last attempt, or on an
+exception not listed in `on`.
+
+The default `ImmediateExecutor` can't wait for the backoff delay without
+blocking the request thread. Its failed tasks are retried without a delay
+by default, and an explicit `backoff` raises `ImproperlyConfigured` on the
+flow class definition. Use another executor, or the outbox, for delays.
+"""
+
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+
+def exponential(
+    attempt: int, base: float = 1.0, factor: float = 2.0, max_delay: float = 3600.0
+) -> float:
+    """Delay of 1, 2, 4, 8... seconds. Use `functools.partial` to adjust."""
+    return min(base * factor ** (attempt - 1), max_delay)
+
+
+def linear(attempt: int, step: float = 5.0, max_delay: float = 3600.0) -> float:
+    """Delay of 5, 10, 15... seconds. Use `functools.partial` to adjust."""
+    return min(step * attempt, max_delay)
+
+
+class RetryPolicy(object):
+    """
+    Attempts count, delays and exceptions to retry.
+
+    :param max_attempts: Total attempts, including the first one.
+    :param backoff: Callable of the failed attempt number, returning the
+        delay before the next attempt in seconds, or a constant delay.
+    :param on: Exception classes to retry.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: Optional[Union[float, Callable[[int], float]]] = exponential,
+        on: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:  # noqa D102
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.on = on
+
+    def should_retry(self, attempt: int, exception: BaseException) -> bool:
+        """Check that the failed attempt should be repeated."""
+        return attempt < self.max_attempts and isinstance(exception, self.on)
+
+    def get_delay(self, attempt: int) -> float:
+        """Seconds to wait after the failed attempt."""
+        if self.backoff is None:
+            return 0
+        if callable(self.backoff):
+            return self.backoff(attempt)
+        return self.backoff
+
+    def __repr__(self) -> Any:
+        return "<RetryPolicy max_attempts={} on={}>".format(self.max_attempts, self.on)
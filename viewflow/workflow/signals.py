@@ -14,3 +14,23 @@ task_failed = Signal()
 
 # providing_args=["process", "task"]
 task_finished = Signal()
+
+# providing_args=["process", "task"]
+# sent after a task transition to another status, except the ones that
+# send task_started, task_finished and task_failed, i.e. on assign,
+# unassign, cancel, undo and revive, and on reassign to another owner
+task_changed = Signal()
+
+# providing_args=["task_pks"]
+# sent once per chunk of tasks assigned or unassigned in bulk
+tasks_changed = Signal()
+
+# providing_args=["process_pks"]
+# sent once per chunk of processes canceled by Flow.cancel_many, and for
+# a single process, canceled by Flow.cancel
+processes_canceled = Signal()
+
+# providing_args=["event", "process", "task"]
+# committed flow_started, flow_finished, task_started, task_failed and
+# task_finished signals, delivered by the outbox relay
+flow_event = Signal()
@@ -0,0 +1,11 @@
+"""Celery task of the `CeleryExecutor`."""
+
+from celery import shared_task
+
+from .executors import run_job
+
+
+@shared_task(name="viewflow.workflow.run_job", ignore_result=True)
+def run_job_task(task, process_pk, task_pk, external_task_id=None):
+    """Execute the scheduled job task on a Celery worker."""
+    run_job(task, process_pk, task_pk, external_task_id=external_task_id)
@@ -1,5 +1,5 @@
 from itertools import count
-from typing import Iterator, Any
+from typing import Iterator, Any, Tuple
 from django.utils.deconstruct import deconstructible
 
 
@@ -41,6 +41,15 @@ class Token:
             return "{}/{}_".format(self.token, task_pk)
         return "{}_".format(self.token.rsplit("_", 1)[0])
 
+    @staticmethod
+    def get_prefix_range(prefix: str) -> Tuple[str, str]:
+        """
+        Bounds of the tokens with the prefix, in the binary string order.
+
+        'start/3_' prefix matches tokens in the ['start/3_', 'start/3`') range.
+        """
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
     def __repr__(self) -> str:
         return self.token
 
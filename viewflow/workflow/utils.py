@@ -1,3 +1,6 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.db import close_old_connections
+
 from .status import STATUS
 
 
@@ -28,6 +31,36 @@ class Act(object):
 act = Act()
 
 
+def run_callback(func, *args, **kwargs):
+    """
+    Call a node callback. An `async def` callback is awaited in the event
+    loop of the calling `arun`, or in a new one.
+    """
+    if iscoroutinefunction(func):
+        return async_to_sync(func)(*args, **kwargs)
+    return func(*args, **kwargs)
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Run the flow code from a coroutine, in a worker thread.
+
+    Each call gets an own thread and database connection, so the
+    activations of different processes advance concurrently. The async
+    ORM calls of `async def` callbacks are executed back in that thread,
+    inside the activation transaction.
+    """
+
+    def run():
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return await sync_to_async(run, thread_sensitive=False)()
+
+
 def get_next_process_task(manager, process, user):
     task = manager.filter(process=process, owner=user, status=STATUS.ASSIGNED).first()
 
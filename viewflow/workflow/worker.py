@@ -0,0 +1,267 @@
+"""
+Database job queue, for deployments without a message broker.
+
+Scheduled job tasks stay in the database, and are taken by workers::
+
+    ./manage.py viewflow_worker --concurrency 4
+
+A worker claims a batch of `SCHEDULED` job tasks with
+`SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent workers never take
+the same task, and records a `JobClaim` row for each one. Jobs are
+executed by `run_job` in a pool of threads or processes. The worker
+updates the heartbeat of its claims periodically. Claims of a worker
+that stopped sending heartbeats are released by the other workers, and
+the tasks are claimed again. A job runs in a single transaction, so a
+task of the crashed worker is still `SCHEDULED`.
+
+The SKIP LOCKED is ignored on the databases without the support, such as
+SQLite, run a single worker there.
+
+Jobs are left for the workers by the executor set in the settings::
+
+    VIEWFLOW = {
+        'JOB_EXECUTOR': 'viewflow.workflow.executors.DatabaseQueueExecutor',
+    }
+
+The worker takes the scheduled jobs, and retries of the function tasks,
+of the `viewflow.Task` table, only of the nodes with the
+`DatabaseQueueExecutor`. Jobs of the other executors are left to them.
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from concurrent import futures
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .executors import DatabaseQueueExecutor, ProcessExecutor, ThreadExecutor, run_job
+from .fields import get_task_ref
+from .status import STATUS
+
+logger = logging.getLogger(__name__)
+
+
+class Worker(object):
+    """
+    Claim and execute scheduled jobs.
+
+    :param concurrency: Number of jobs executed at once. With zero, jobs
+        are executed in the worker thread one by one.
+    :param processes: Use a pool of processes instead of threads.
+    :param batch_size: Max number of claimed jobs, including executing.
+    :param poll_interval: Seconds to wait for new jobs in the empty queue.
+    :param heartbeat_interval: Seconds between the claims heartbeat updates.
+    :param stale_timeout: Seconds without a heartbeat to release a claim,
+        should exceed the job run time for the `concurrency=0`.
+    """
+
+    def __init__(
+        self,
+        concurrency=1,
+        processes=False,
+        batch_size=10,
+        poll_interval=1.0,
+        heartbeat_interval=10.0,
+        stale_timeout=60.0,
+        name=None,
+    ):  # noqa D102
+        self.concurrency = concurrency
+        self.batch_size = max(batch_size, concurrency)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_timeout = stale_timeout
+        self.name = name or "{}-{}-{}".format(
+            socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8]
+        )
+
+        self.executor = None
+        if concurrency > 0:
+            executor_class = ProcessExecutor if processes else ThreadExecutor
+            self.executor = executor_class(max_workers=concurrency)
+
+        self.in_flight = {}  # future -> job
+        self.processed = 0
+        self.failed = 0
+
+    def get_queue_nodes(self):
+        """Flow tasks with scheduled jobs, executed by the database queue."""
+        from .models import Task
+
+        nodes = (
+            Task._default_manager.filter(
+                flow_task_type__in=["FUNCTION", "JOB"], status=STATUS.SCHEDULED
+            )
+            .order_by()
+            .values_list("flow_task", flat=True)
+            .distinct()
+        )
+        return [
+            node
+            for node in nodes
+            if hasattr(node, "get_executor")
+            and isinstance(node.get_executor(), DatabaseQueueExecutor)
+        ]
+
+    def claim(self, limit):
+        """Claim up to `limit` scheduled jobs, and return them."""
+        from .models import JobClaim, Task
+
+        if limit <= 0:
+            return []
+
+        with transaction.atomic():
+            # delayed retries
+            JobClaim.objects.filter(worker="", heartbeat__lte=timezone.now()).delete()
+
+            nodes = self.get_queue_nodes()
+            if not nodes:
+                return []
+
+            tasks = list(
+                Task._default_manager.filter(
+                    flow_task_type__in=["FUNCTION", "JOB"],
+                    flow_task__in=nodes,
+                    status=STATUS.SCHEDULED,
+                )
+                .filter(~Exists(JobClaim.objects.filter(task=OuterRef("pk"))))
+                .order_by("created", "pk")
+                .select_for_update(skip_locked=True)
+                .values_list("pk", "process_id", "flow_task", "external_task_id")[
+                    :limit
+                ]
+            )
+            now = timezone.now()
+            # a claim committed after the select is skipped, not raised
+            JobClaim.objects.bulk_create(
+                (
+                    JobClaim(
+                        task_id=task[0], worker=self.name, claimed=now, heartbeat=now
+                    )
+                    for task in tasks
+                ),
+                ignore_conflicts=True,
+            )
+            claimed = set(
+                JobClaim.objects.filter(
+                    task__in=[task[0] for task in tasks], worker=self.name
+                ).values_list("task_id", flat=True)
+            )
+            tasks = [task for task in tasks if task[0] in claimed]
+
+        return [
+            {
+                "task": get_task_ref(flow_task),
+                "process_pk": process_pk,
+                "task_pk": task_pk,
+                "external_task_id": external_task_id,
+            }
+            for task_pk, process_pk, flow_task, external_task_id in tasks
+        ]
+
+    def release(self, task_pks):
+        """Delete the worker claims of the tasks."""
+        from .models import JobClaim
+
+        if task_pks:
+            JobClaim.objects.filter(task__in=task_pks, worker=self.name).delete()
+
+    def heartbeat(self):
+        """Mark the worker claims alive."""
+        from .models import JobClaim
+
+        JobClaim.objects.filter(worker=self.name).update(heartbeat=timezone.now())
+
+    def recover_stale(self):
+        """Release claims without a recent heartbeat, and return the count."""
+        from .models import JobClaim
+
+        deadline = timezone.now() - timedelta(seconds=self.stale_timeout)
+        return JobClaim.objects.filter(heartbeat__lt=deadline).delete()[0]
+
+    def _finished(self, job, exception=None):
+        if exception is None:
+            self.processed += 1
+        else:
+            self.failed += 1
+            logger.error(
+                "Job %s failed",
+                job["task_pk"],
+                exc_info=(type(exception), exception, exception.__traceback__),
+            )
+
+    def submit(self, jobs):
+        """Execute the claimed jobs, or hand them to the pool."""
+        if self.executor is None:
+            for job in jobs:
+                try:
+                    run_job(**job)
+                except Exception as exc:
+                    self._finished(job, exc)
+                else:
+                    self._finished(job)
+                self.release([job["task_pk"]])
+            return
+
+        for job in jobs:
+            self.in_flight[self.executor.submit(job)] = job
+
+    def wait(self, timeout):
+        """Wait for the executing jobs, and release claims of finished."""
+        if not self.in_flight:
+            if timeout:
+                time.sleep(timeout)
+            return
+
+        done, _ = futures.wait(
+            self.in_flight, timeout=timeout, return_when=futures.FIRST_COMPLETED
+        )
+        finished = []
+        for future in done:
+            job = self.in_flight.pop(future)
+            self._finished(job, future.exception())
+            finished.append(job["task_pk"])
+        self.release(finished)
+
+    def run(self, burst=False):
+        """
+        Execute jobs until stopped, and return the count of executed.
+
+        With `burst=True`, return when no scheduled jobs are left.
+        """
+        last_heartbeat = time.monotonic()
+        self.recover_stale()
+        try:
+            while True:
+                jobs = []
+                capacity = self.batch_size - len(self.in_flight)
+                if capacity >= min(self.concurrency, self.batch_size):
+                    jobs = self.claim(capacity)
+                    self.submit(jobs)
+
+                if time.monotonic() - last_heartbeat >= self.heartbeat_interval:
+                    self.heartbeat()
+                    self.recover_stale()
+                    last_heartbeat = time.monotonic()
+
+                if burst and not jobs and not self.in_flight:
+                    return self.processed
+                self.wait(0 if jobs and self.executor is None else self.poll_interval)
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Wait for the executing jobs, and release all worker claims."""
+        from .models import JobClaim
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        for future, job in self.in_flight.items():
+            self._finished(job, future.exception())
+        self.in_flight = {}
+        JobClaim.objects.filter(worker=self.name).delete()